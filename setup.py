@@ -9,7 +9,7 @@ setup(
 	python_requires='>=3.8',
 	author='arandomdev',
 	url='https://github.com/arandomdev/dyldextractor',
-	install_requires=['progressbar2', 'capstone==4.0.2'],
+	install_requires=['progressbar2', 'capstone==4.0.2', 'numpy'],
 	packages=find_packages(
 		where='src'
 	),
@@ -19,5 +19,5 @@ setup(
 		'License :: OSI Approved :: MIT License',
 		'Operating System :: OS Independent'
 	],
-	scripts=['bin/dyldex', 'bin/dyldex_all', 'bin/kextex', 'bin/kextex_all']
+	scripts=['bin/dyldex', 'bin/dyldex_all', 'bin/dyldex_daemon', 'bin/kextex', 'bin/kextex_all']
 )
@@ -1,4 +1,8 @@
+import threading
 from typing import (
+	Any,
+	Callable,
+	Dict,
 	Tuple,
 	BinaryIO
 )
@@ -6,6 +10,61 @@ from typing import (
 from DyldExtractor.file_context import FileContext
 
 
+# Data derived from a cache that is the same for every image, keyed by
+# the file key of the cache and a name. This lets all contexts in a
+# process that map the same cache reuse it.
+_sharedData: Dict[Tuple[Tuple[int, int], str], Any] = {}
+_sharedDataLock = threading.Lock()
+
+
+def getSharedData(
+	fileKey: Tuple[int, int],
+	name: str,
+	factory: Callable[[], Any]
+) -> Any:
+	"""Get the shared data for a cache, creating it if needed.
+
+	Data that is the same for every image of a cache is created once
+	and reused by every extraction from that cache in the process.
+
+	Args:
+		fileKey: The file key of the cache.
+		name: The name of the data.
+		factory: Called without arguments to create the data if it
+			does not exist yet.
+
+	Returns:
+		The shared data.
+	"""
+
+	key = (fileKey, name)
+	with _sharedDataLock:
+		if key in _sharedData:
+			return _sharedData[key]
+		pass
+
+	# create the data outside of the lock, the factory may
+	# need other shared data.
+	data = factory()
+	with _sharedDataLock:
+		return _sharedData.setdefault(key, data)
+
+
+def setSharedData(fileKey: Tuple[int, int], name: str, data: Any) -> None:
+	"""Set the shared data for a cache, replacing any existing data.
+
+	Args:
+		fileKey: The file key of the cache.
+		name: The name of the data.
+		data: The data to store.
+	"""
+
+	with _sharedDataLock:
+		_sharedData[(fileKey, name)] = data
+		pass
+	pass
+
+
 class CacheContext(FileContext):
 
 	def __init__(self, fileObject: BinaryIO, copyMode: bool = False) -> None:
@@ -29,8 +88,29 @@ class CacheContext(FileContext):
 		# didn't find the address in any mappings...
 		return None
 
+	def getSharedData(self, name: str, factory: Callable[[], Any]) -> Any:
+		"""Get data that is shared between all contexts of this cache.
+
+		Args:
+			name: The name of the data.
+			factory: Called without arguments to create the data if it
+				does not exist yet.
+
+		Returns:
+			The shared data.
+		"""
+
+		return getSharedData(self.fileKey, name, factory)
+
+	def setSharedData(self, name: str, data: Any) -> None:
+		"""Set data that is shared between all contexts of this cache.
+		"""
+
+		setSharedData(self.fileKey, name, data)
+		pass
+
 	def hasSubCaches(self) -> bool:
 		return False
-	
+
 	def isFileset(self) -> bool:
 		return False
@@ -1,22 +1,177 @@
-import struct
-from dataclasses import dataclass
+import logging
+import numpy as np
+from typing import List
 
 from DyldExtractor.extraction_context import ExtractionContext
 from DyldExtractor.macho.macho_context import MachOContext
 
-from DyldExtractor.macho.macho_structs import (
-	LoadCommands,
-)
-
 from DyldExtractor.macho.fixup_chains_structs import (
 	dyld_chained_fixups_header,
 	dyld_chained_starts_in_image,
 	dyld_chained_starts_in_segment,
 	ChainedPtrStart,
-	ChainedFixupPointerOnDisk,
 	PointerFormat,
 )
 
+# Fields of dyld_chained_ptr_64_kernel_cache_rebase
+_KERNEL_CACHE_TARGET_MASK = 0x3FFFFFFF
+_KERNEL_CACHE_NEXT_SHIFT = 51
+_KERNEL_CACHE_NEXT_MASK = 0xFFF
+_KERNEL_CACHE_STRIDE = 4
+
+# Byte offsets of a pointer, used to gather and scatter unaligned pointers
+_POINTER_BYTES = np.arange(8, dtype=np.int64)
+
+
+class ChainedFixupsOverlay(object):
+
+	SHARED_DATA_NAME = "chainedFixupsOverlay"
+
+	def __init__(self, offsets: np.ndarray, values: np.ndarray) -> None:
+		"""The fixed up pointers of a kernelcache.
+
+		The file offset and fixed up value of every pointer in the chains,
+		in chain order. apply() writes them into a context.
+
+		Args:
+			offsets: The file offsets of the pointers.
+			values: The fixed up value of each pointer.
+		"""
+
+		super().__init__()
+
+		self.offsets = offsets
+		self.values = values
+		pass
+
+	@classmethod
+	def build(
+		cls,
+		context: MachOContext,
+		logger: logging.Logger
+	) -> "ChainedFixupsOverlay":
+		"""Walk all the pointer chains of the kernelcache.
+
+		The chains of all pages are walked together, one link at a time.
+
+		Args:
+			context: The MachOContext of the whole kernelcache.
+			logger: Used to report chains that can't be fixed.
+
+		Returns:
+			The overlay, which is empty if the fixups can't be read.
+		"""
+
+		overlay = cls(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint64))
+
+		fixupsCmd = context.getChainedFixups()
+		if not fixupsCmd:
+			logger.warning("No LC_DYLD_CHAINED_FIXUPS found in mach-o.")
+			return overlay
+
+		chainsHeader = dyld_chained_fixups_header(context.file, fixupsCmd.dataoff)
+		if chainsHeader.fixups_version != 0:
+			logger.error("Unrecognised dyld_chained_fixups version.")
+			return overlay
+
+		startsOffset = chainsHeader._fileOff_ + chainsHeader.starts_offset
+		startsInfo = dyld_chained_starts_in_image(context.file, startsOffset)
+
+		chainStarts: List[np.ndarray] = []
+		segInfoOffsets = context.readFormat("<" + "I" * startsInfo.seg_count, startsOffset + 4)
+		for segInfoOffset in segInfoOffsets:
+			if segInfoOffset == 0:
+				continue
+
+			segInfo = dyld_chained_starts_in_segment(context.file, startsOffset + segInfoOffset)
+			chainStarts.append(cls._getChainStarts(context, segInfo, logger))
+			pass
+
+		chainOffs = np.concatenate(chainStarts) if chainStarts else np.zeros(0, dtype=np.int64)
+		fileBytes = np.frombuffer(context.file, dtype=np.uint8)
+
+		# Walk every chain one link at a time
+		chainIds = np.arange(len(chainOffs))
+		offsets: List[np.ndarray] = []
+		rawPointers: List[np.ndarray] = []
+		pointerChains: List[np.ndarray] = []
+		while len(chainOffs):
+			raw = fileBytes[chainOffs[:, None] + _POINTER_BYTES].view("<u8")[:, 0]
+			offsets.append(chainOffs)
+			rawPointers.append(raw)
+			pointerChains.append(chainIds)
+
+			nextLinks = ((raw >> _KERNEL_CACHE_NEXT_SHIFT) & _KERNEL_CACHE_NEXT_MASK).astype(np.int64)  # noqa
+			hasNext = nextLinks != 0
+			chainOffs = chainOffs[hasNext] + (nextLinks[hasNext] * _KERNEL_CACHE_STRIDE)
+			chainIds = chainIds[hasNext]
+			pass
+
+		if not offsets:
+			return overlay
+
+		# Order the pointers by chain, so they are written in the same
+		# order as walking each chain in full.
+		order = np.argsort(np.concatenate(pointerChains), kind="stable")
+
+		textAddr = np.uint64(context.segments[b"__TEXT"].seg.vmaddr)
+		overlay.offsets = np.concatenate(offsets)[order]
+		overlay.values = textAddr + (np.concatenate(rawPointers)[order] & _KERNEL_CACHE_TARGET_MASK)  # noqa
+		return overlay
+
+	@staticmethod
+	def _getChainStarts(
+		context: MachOContext,
+		segInfo: dyld_chained_starts_in_segment,
+		logger: logging.Logger
+	) -> np.ndarray:
+		"""Get the file offset of the first pointer of each page chain.
+		"""
+
+		# page_start follows page_count
+		pageStarts = np.frombuffer(
+			context.file,
+			dtype="<u2",
+			count=segInfo.page_count,
+			offset=segInfo._fileOff_ + 22
+		).astype(np.int64)
+		pageIndexes = np.flatnonzero(pageStarts != ChainedPtrStart.DYLD_CHAINED_PTR_START_NONE)
+
+		multiPages = pageStarts[pageIndexes] & ChainedPtrStart.DYLD_CHAINED_PTR_START_MULTI
+		if np.any(multiPages):
+			logger.error("DYLD_CHAINED_PTR_START_MULTI and DYLD_CHAINED_PTR_START_LAST fixups are not supported.")  # noqa
+
+			# the pages before it are still fixed
+			pageIndexes = pageIndexes[:np.argmax(multiPages != 0)]
+			pass
+
+		pointerFormat = segInfo.pointer_format
+		if len(pageIndexes) and pointerFormat != PointerFormat.DYLD_CHAINED_PTR_64_KERNEL_CACHE:
+			logger.error("Unsupported chain pointer_format: %s", pointerFormat)
+			return np.zeros(0, dtype=np.int64)
+
+		return (
+			context.header._fileOff_
+			+ segInfo.segment_offset
+			+ (pageIndexes * segInfo.page_size)
+			+ pageStarts[pageIndexes]
+		)
+
+	def apply(self, machoCtx: MachOContext) -> None:
+		"""Write the fixed up pointers into a writable context.
+		"""
+
+		if not len(self.offsets):
+			return
+
+		fileBytes = np.frombuffer(machoCtx.file, dtype=np.uint8)
+		fileBytes[self.offsets[:, None] + _POINTER_BYTES] = (
+			self.values.astype("<u8").view(np.uint8).reshape(-1, 8)
+		)
+		pass
+	pass
+
+
 class _PointerFixer(object):
 	def __init__(self, extractionCtx: ExtractionContext) -> None:
 		super().__init__()
@@ -29,65 +184,14 @@ class _PointerFixer(object):
 		self.context = extractionCtx.dyldCtx._machoCtx
 
 	def fixChainedPointers(self) -> None:
-		self.statusBar.update(unit="Chained Pointers")
+		self.statusBar.update(unit="Chained Pointers", status="Fixing Pointers")
+
+		overlay: ChainedFixupsOverlay = self.dyldCtx.getSharedData(
+			ChainedFixupsOverlay.SHARED_DATA_NAME,
+			lambda: ChainedFixupsOverlay.build(self.context, self.logger)
+		)
+		overlay.apply(self.machoCtx)
 
-		fixupsCmd = self.context.getLoadCommand((LoadCommands.LC_DYLD_CHAINED_FIXUPS,))
-		chainsHeader = dyld_chained_fixups_header(self.context.file, fixupsCmd.dataoff)
-		if not fixupsCmd:
-			self.logger.warning("No LC_DYLD_CHAINED_FIXUPS found in mach-o.")
-			return
-		
-		if chainsHeader.fixups_version != 0:
-			self.logger.error("Unrecognised dyld_chained_fixups version.")
-			return
-		
-		startsOffset = chainsHeader._fileOff_ + chainsHeader.starts_offset
-		startsInfo = dyld_chained_starts_in_image(self.context.file, startsOffset)
-		
-		seg_info_offsets = self.context.readFormat("<" + "I" * startsInfo.seg_count, startsOffset + 4)
-		for segInfoOffset in seg_info_offsets:
-			if segInfoOffset == 0:
-				continue
-			segInfo = dyld_chained_starts_in_segment(self.context.file, startsOffset + segInfoOffset)
-			self.fixChainedPointersInSegment(segInfo)
-
-	def fixChainedPointersInSegment(self, segInfo: dyld_chained_starts_in_segment) -> None:
-		page_start_off = 22
-		for pageIndex in range(segInfo.page_count):
-			offsetInPage = self.context.readFormat("<H", segInfo._fileOff_ + page_start_off + pageIndex * 2)[0]
-			if offsetInPage == ChainedPtrStart.DYLD_CHAINED_PTR_START_NONE:
-				continue
-			
-			if offsetInPage & ChainedPtrStart.DYLD_CHAINED_PTR_START_MULTI or offsetInPage & ChainedPtrStart.DYLD_CHAINED_PTR_START_LAST:
-				self.logger.error("DYLD_CHAINED_PTR_START_MULTI and DYLD_CHAINED_PTR_START_LAST fixups are not supported.")
-				return
-
-			pageContentStart = self.context.header._fileOff_ + segInfo.segment_offset + (pageIndex * segInfo.page_size)
-			chainOff = pageContentStart + offsetInPage
-			self.walkChain(chainOff, segInfo)
-
-	def walkChain(self, chainOff: int, segInfo: dyld_chained_starts_in_segment) -> None:
-		pointer_format = segInfo.pointer_format
-		if pointer_format != PointerFormat.DYLD_CHAINED_PTR_64_KERNEL_CACHE:
-			self.logger.error(f"Unsupported chain pointer_format: {pointer_format}")
-			return
-		
-		stride = 4
-		chainEnd = False
-
-		while not chainEnd:
-			chain = ChainedFixupPointerOnDisk(self.context.file, chainOff)
-			self.fixPointer(chain, segInfo)
-
-			if chain._next == 0:
-				chainEnd = True
-			else:
-				chainOff += chain._next * stride
-
-	def fixPointer(self, chain: ChainedFixupPointerOnDisk, segInfo: dyld_chained_starts_in_segment) -> None:
-		self.statusBar.update(status="Fixing Pointers")
-		fixedPointer = self.context.segments[b"__TEXT"].seg.vmaddr + chain.target
-		self.machoCtx.writeBytes(chain._fileOff_, struct.pack("<Q", fixedPointer))
 
 def fixChainedPointers(extractionCtx: ExtractionContext) -> None:
 	fixer = _PointerFixer(extractionCtx)
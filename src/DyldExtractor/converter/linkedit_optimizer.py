@@ -1,6 +1,14 @@
-import struct
-from typing import Union, Dict, Optional
+import numpy as np
+from typing import (
+	Callable,
+	Union,
+	Dict,
+	List,
+	Optional,
+	Tuple
+)
 
+from DyldExtractor.file_context import FileContext
 from DyldExtractor.dyld.dyld_context import DyldContext
 from DyldExtractor.extraction_context import ExtractionContext
 
@@ -17,7 +25,8 @@ from DyldExtractor.macho.macho_structs import (
 	dysymtab_command,
 	linkedit_data_command,
 	nlist_64,
-	symtab_command
+	symtab_command,
+	NLIST_64_DTYPE
 )
 
 
@@ -58,14 +67,200 @@ class _SymbolContext(object):
 
 			return index
 
-	def compileStrings(self) -> bytes:
-		"""Compile and get the string pool.
+	def addStrings(self, strings: List[bytes]) -> List[int]:
+		"""Add multiple strings to the string pool.
+
+		Args:
+			strings: The strings to add, in order.
+
+		Returns:
+			The index into the pool of each string.
+		"""
+
+		stringMap = self._stringMap
+		indexes = []
+		for string in strings:
+			index = stringMap.get(string)
+			if index is None:
+				index = self._stringLength
+
+				self._stringLength += len(string)
+				stringMap[string] = index
+				pass
+
+			indexes.append(index)
+			pass
+
+		return indexes
+
+	@property
+	def stringsSize(self) -> int:
+		"""The size of the string pool.
+		"""
+
+		return self._stringLength
+
+	def writeStrings(self, buffer: memoryview) -> None:
+		"""Write the string pool.
+
+		Args:
+			buffer: A buffer of stringsSize bytes.
+		"""
+
+		# Strings are added to the end of the pool in insertion order.
+		buffer[0:self._stringLength] = b"".join(self._stringMap)
+		pass
+
+
+class _LocalSymbolStrings(object):
+
+	SHARED_DATA_NAME = "localSymbolStrings"
+
+	def __init__(
+		self,
+		symbolsCache: DyldContext,
+		symbolsInfo: dyld_cache_local_symbols_info
+	) -> None:
+		"""An index of the local symbols string pool of a .symbols cache.
+
+		Holds the sorted offsets of every null terminator in the pool, so
+		a string's end is found with a binary search from its start.
+		Strings that aren't terminated inside the pool are read with
+		readString instead.
+
+		Args:
+			symbolsCache: The .symbols cache.
+			symbolsInfo: The local symbols info of the cache.
 		"""
 
-		strings = self._stringMap.items()
-		strings = sorted(strings, key=lambda item: item[1])  # just in case
+		super().__init__()
+
+		self._symbolsCache = symbolsCache
+		self._stringsStart = symbolsInfo._fileOff_ + symbolsInfo.stringsOffset
+		self._stringsSize = symbolsInfo.stringsSize
+
+		pool = np.frombuffer(
+			symbolsCache.file,
+			dtype=np.uint8,
+			count=self._stringsSize,
+			offset=self._stringsStart
+		)
+		self._stringEnds = np.flatnonzero(pool == 0).astype(np.uint32)
+		pass
 
-		return b"".join(map(lambda item: item[0], strings))
+	def getStrings(self, strx: np.ndarray) -> List[bytes]:
+		"""Read strings from the pool.
+
+		Args:
+			strx: Indexes into the string pool.
+
+		Returns:
+			The strings, including their null terminators.
+		"""
+
+		strx = strx.astype(np.int64)
+		endSlots = np.searchsorted(self._stringEnds, strx)
+		inPool = endSlots < len(self._stringEnds)
+
+		starts = (strx + self._stringsStart).tolist()
+		ends = np.zeros(len(strx), dtype=np.int64)
+		ends[inPool] = self._stringEnds[endSlots[inPool]].astype(np.int64) + 1
+		ends = (ends + self._stringsStart).tolist()
+
+		file = self._symbolsCache.file
+		strings = [file[start:end] for start, end in zip(starts, ends)]
+
+		# strings that aren't terminated in the pool
+		for i in np.flatnonzero(~inPool).tolist():
+			strings[i] = self._symbolsCache.readString(starts[i])
+			pass
+
+		return strings
+	pass
+
+
+class _LinkeditBuilder(object):
+
+	size: int
+
+	def __init__(self) -> None:
+		"""Lays out the new linkedit, then writes it into a single buffer.
+
+		Data is reserved in order with writers that are called once the
+		final size is known.
+		"""
+
+		super().__init__()
+
+		self.size = 0
+		self._writers: List[Tuple[int, int, Callable[[memoryview], None]]] = []
+		pass
+
+	def reserve(
+		self,
+		size: int,
+		writer: Optional[Callable[[memoryview], None]] = None
+	) -> int:
+		"""Reserve space in the linkedit.
+
+		Args:
+			size: The number of bytes to reserve.
+			writer: Optional; Called with a memoryview of the reserved
+				space to fill it in. The space is zeroed if not given.
+
+		Returns:
+			The offset of the reserved space.
+		"""
+
+		offset = self.size
+		self.size += size
+
+		if writer:
+			self._writers.append((offset, size, writer))
+			pass
+
+		return offset
+
+	def reserveCopy(self, file: FileContext, offset: int, size: int) -> int:
+		"""Reserve space and copy data into it.
+
+		Args:
+			file: The file to copy from.
+			offset: The offset of the data in the file.
+			size: The size of the data.
+
+		Returns:
+			The offset of the reserved space.
+		"""
+
+		def writer(buffer: memoryview) -> None:
+			buffer[:] = file.getBytes(offset, size)
+			pass
+
+		return self.reserve(size, writer)
+
+	def align(self) -> None:
+		"""Make sure the linkedit is 8-bit aligned.
+		"""
+
+		if (self.size % 8) != 0:
+			self.size += 4
+			pass
+		pass
+
+	def build(self) -> bytearray:
+		"""Write all the data into a buffer.
+		"""
+
+		linkedit = bytearray(self.size)
+		linkeditView = memoryview(linkedit)
+
+		for offset, size, writer in self._writers:
+			writer(linkeditView[offset:offset + size])
+			pass
+
+		linkeditView.release()
+		return linkedit
 
 
 class _LinkeditOptimizer(object):
@@ -83,29 +278,16 @@ class _LinkeditOptimizer(object):
 			self.machoCtx.segments[b"__LINKEDIT"].seg.vmaddr
 		)
 
-		self.symTabCmd: symtab_command = None
-		self.dynSymTabCmd: dysymtab_command = None
-		self.dyldInfo: dyld_info_command = None
-		self.exportTrieCmd: linkedit_data_command = None
-		self.functionStartsCmd: linkedit_data_command = None
-		self.dataInCodeCmd: linkedit_data_command = None
-
-		for lc in self.machoCtx.loadCommands:
-			if lc.cmd == LoadCommands.LC_SYMTAB:
-				self.symTabCmd = lc
-			elif lc.cmd == LoadCommands.LC_DYSYMTAB:
-				self.dynSymTabCmd = lc
-			elif (
-				lc.cmd == LoadCommands.LC_DYLD_INFO
-				or lc.cmd == LoadCommands.LC_DYLD_INFO_ONLY
-			):
-				self.dyldInfo = lc
-			elif lc.cmd == LoadCommands.LC_FUNCTION_STARTS:
-				self.functionStartsCmd = lc
-			elif lc.cmd == LoadCommands.LC_DATA_IN_CODE:
-				self.dataInCodeCmd = lc
-			elif lc.cmd == LoadCommands.LC_DYLD_EXPORTS_TRIE:
-				self.exportTrieCmd = lc
+		self.symTabCmd: symtab_command = self.machoCtx.getSymtab()
+		self.dynSymTabCmd: dysymtab_command = self.machoCtx.getDysymtab()
+		self.dyldInfo: dyld_info_command = self.machoCtx.getDyldInfo()
+		self.exportTrieCmd: linkedit_data_command = self.machoCtx.getExportsTrie()
+		self.functionStartsCmd: linkedit_data_command = self.machoCtx.getLoadCommand(
+			(LoadCommands.LC_FUNCTION_STARTS,)
+		)
+		self.dataInCodeCmd: linkedit_data_command = self.machoCtx.getLoadCommand(
+			(LoadCommands.LC_DATA_IN_CODE,)
+		)
 
 		# Maps the old symbol indexes in the shared symbol table
 		# 	to the new indexes in the optimized index table.
@@ -131,9 +313,32 @@ class _LinkeditOptimizer(object):
 		self.newSymbolTableOffset = 0
 		self.redactedSymbolCount = 0
 		self.symbolCtx = None
+
+		self._indirectSymbols: np.ndarray = None
 		pass
 
-	def copyWeakBindingInfo(self, newLinkedit: bytearray) -> None:
+	def getIndirectSymbols(self) -> np.ndarray:
+		"""Get the indirect symbol table as a uint32 array.
+		"""
+
+		if self._indirectSymbols is None:
+			if self.dynSymTabCmd:
+				self._indirectSymbols = np.frombuffer(
+					self.linkeditFile.getBytes(
+						self.dynSymTabCmd.indirectsymoff,
+						self.dynSymTabCmd.nindirectsyms * 4
+					),
+					dtype="<u4"
+				)
+				pass
+			else:
+				self._indirectSymbols = np.zeros(0, dtype="<u4")
+				pass
+			pass
+
+		return self._indirectSymbols
+
+	def copyWeakBindingInfo(self, newLinkedit: _LinkeditBuilder) -> None:
 		self.statusBar.update(status="Copy Weak Binding Info")
 
 		if not self.dyldInfo:
@@ -141,18 +346,16 @@ class _LinkeditOptimizer(object):
 
 		size = self.dyldInfo.weak_bind_size
 		if size:
-			weakBindingInfo = self.linkeditFile.getBytes(
+			self.newWeakBindingInfoOffset = newLinkedit.reserveCopy(
+				self.linkeditFile,
 				self.dyldInfo.weak_bind_off,
 				size
 			)
 
-			self.newWeakBindingInfoOffset = len(newLinkedit)
-			newLinkedit.extend(weakBindingInfo)
-
 		self.statusBar.update()
 		pass
 
-	def copyExportInfo(self, newLinkedit: bytearray) -> None:
+	def copyExportInfo(self, newLinkedit: _LinkeditBuilder) -> None:
 		self.statusBar.update(status="Copy Export Info")
 
 		if not self.dyldInfo and not self.exportTrieCmd:
@@ -166,15 +369,16 @@ class _LinkeditOptimizer(object):
 			exportSize = self.dyldInfo.export_size
 
 		if exportSize:
-			exportInfo = self.linkeditFile.getBytes(exportOff, exportSize)
-
-			self.newExportInfoOffset = len(newLinkedit)
-			newLinkedit.extend(exportInfo)
+			self.newExportInfoOffset = newLinkedit.reserveCopy(
+				self.linkeditFile,
+				exportOff,
+				exportSize
+			)
 
 		self.statusBar.update()
 		pass
 
-	def copyBindingInfo(self, newLinkedit: bytearray) -> None:
+	def copyBindingInfo(self, newLinkedit: _LinkeditBuilder) -> None:
 		self.statusBar.update(status="Copy Binding Info")
 
 		if not self.dyldInfo:
@@ -182,15 +386,16 @@ class _LinkeditOptimizer(object):
 
 		size = self.dyldInfo.bind_size
 		if size:
-			bindingInfo = self.linkeditFile.getBytes(self.dyldInfo.bind_off, size)
-
-			self.newBindingInfoOffset = len(newLinkedit)
-			newLinkedit.extend(bindingInfo)
+			self.newBindingInfoOffset = newLinkedit.reserveCopy(
+				self.linkeditFile,
+				self.dyldInfo.bind_off,
+				size
+			)
 
 		self.statusBar.update()
 		pass
 
-	def copyLazyBindingInfo(self, newLinkedit: bytearray) -> None:
+	def copyLazyBindingInfo(self, newLinkedit: _LinkeditBuilder) -> None:
 		self.statusBar.update(status="Copy Lazy Binding Info")
 
 		if not self.dyldInfo:
@@ -198,20 +403,51 @@ class _LinkeditOptimizer(object):
 
 		size = self.dyldInfo.lazy_bind_size
 		if size:
-			lazyBindingInfo = self.linkeditFile.getBytes(
+			self.newLazyBindingInfoOffset = newLinkedit.reserveCopy(
+				self.linkeditFile,
 				self.dyldInfo.lazy_bind_off,
 				size
 			)
 
-			self.newLazyBindingInfoOffset = len(newLinkedit)
-			newLinkedit.extend(lazyBindingInfo)
-
 		self.statusBar.update()
 		pass
 
-	def startSymbolContext(self, newLinkedit: bytearray) -> None:
+	def startSymbolContext(self, newLinkedit: _LinkeditBuilder) -> None:
 		self.symbolCtx = _SymbolContext()
-		self.newSymbolTableOffset = len(newLinkedit)
+		self.newSymbolTableOffset = newLinkedit.size
+		pass
+
+	def _reserveSymbols(
+		self,
+		newLinkedit: _LinkeditBuilder,
+		symbols: List[nlist_64]
+	) -> None:
+		"""Reserve space for symbol entries and write them later.
+		"""
+
+		def writer(buffer: memoryview) -> None:
+			for i, symbol in enumerate(symbols):
+				entryOff = i * nlist_64.SIZE
+				buffer[entryOff:entryOff + nlist_64.SIZE] = bytes(symbol)
+				pass
+			pass
+
+		newLinkedit.reserve(len(symbols) * nlist_64.SIZE, writer)
+		pass
+
+	def _reserveSymbolArray(
+		self,
+		newLinkedit: _LinkeditBuilder,
+		symbols: np.ndarray
+	) -> None:
+		"""Reserve space for a structured array of symbol entries.
+		"""
+
+		def writer(buffer: memoryview) -> None:
+			buffer[:] = symbols.tobytes()
+			pass
+
+		newLinkedit.reserve(symbols.nbytes, writer)
 		pass
 
 	def getLocalSymsEntry(
@@ -263,7 +499,7 @@ class _LinkeditOptimizer(object):
 
 		return None
 
-	def copyLocalSymbols(self, newLinkedit: bytearray) -> None:
+	def copyLocalSymbols(self, newLinkedit: _LinkeditBuilder) -> None:
 		self.statusBar.update(status="Copy Local Symbols")
 
 		symbolsCache = self.dyldCtx.getSymbolsCache()
@@ -286,37 +522,45 @@ class _LinkeditOptimizer(object):
 			return
 
 		self.newLocalSymbolsStartIndex = self.symbolCtx.symbolsSize
-		self.newLocalSymbolCount = 0
+		self.newLocalSymbolCount = localSymbolsEntriesInfo.nlistCount
+		self.symbolCtx.symbolsSize += localSymbolsEntriesInfo.nlistCount
 
 		# copy local symbols and their strings
-		entriesStart = (
-			localSymbolsInfo._fileOff_
-			+ localSymbolsInfo.nlistOffset
-			+ (localSymbolsEntriesInfo.nlistStartIndex * nlist_64.SIZE)
-		)
-		entriesEnd = (
-			entriesStart
-			+ (localSymbolsEntriesInfo.nlistCount * nlist_64.SIZE)
-		)
-
-		symbolStrOff = localSymbolsInfo._fileOff_ + localSymbolsInfo.stringsOffset
+		symbols = np.frombuffer(
+			symbolsCache.file,
+			dtype=NLIST_64_DTYPE,
+			count=localSymbolsEntriesInfo.nlistCount,
+			offset=(
+				localSymbolsInfo._fileOff_
+				+ localSymbolsInfo.nlistOffset
+				+ (localSymbolsEntriesInfo.nlistStartIndex * nlist_64.SIZE)
+			)
+		).copy()
 
-		for offset in range(entriesStart, entriesEnd, nlist_64.SIZE):
-			symbolEnt = nlist_64(symbolsCache.file, offset)
-			name = symbolsCache.readString(symbolStrOff + symbolEnt.n_strx)
+		symbolStrings: _LocalSymbolStrings = symbolsCache.getSharedData(
+			_LocalSymbolStrings.SHARED_DATA_NAME,
+			lambda: _LocalSymbolStrings(symbolsCache, localSymbolsInfo)
+		)
 
-			# copy data
-			self.newLocalSymbolCount += 1
-			self.symbolCtx.symbolsSize += 1
+		# read each string once, in the order they are first used
+		uniqueStrx, firstUses, strxIndexes = np.unique(
+			symbols["n_strx"],
+			return_index=True,
+			return_inverse=True
+		)
+		useOrder = np.argsort(firstUses)
+		names = symbolStrings.getStrings(uniqueStrx[useOrder])
 
-			symbolEnt.n_strx = self.symbolCtx.addString(name)
-			newLinkedit.extend(symbolEnt)
+		newStrx = np.zeros(len(uniqueStrx), dtype=np.uint32)
+		newStrx[useOrder] = self.symbolCtx.addStrings(names)
+		symbols["n_strx"] = newStrx[strxIndexes]
 
-			self.statusBar.update()
+		self._reserveSymbolArray(newLinkedit, symbols)
+		self.statusBar.update()
 		pass
 
-	def copyExportedSymbols(self, newLinkedit: bytearray) -> None:
-		self.statusBar.update("Copy Exported Symbols")
+	def copyExportedSymbols(self, newLinkedit: _LinkeditBuilder) -> None:
+		self.statusBar.update(status="Copy Exported Symbols")
 
 		self.newExportedSymbolsStartIndex = self.symbolCtx.symbolsSize
 		self.newExportedSymbolCount = 0
@@ -331,6 +575,7 @@ class _LinkeditOptimizer(object):
 
 		symbolStrOff = self.symTabCmd.stroff
 
+		symbols = []
 		for entryIndex in range(entriesStart, entriesEnd):
 			entryOff = self.symTabCmd.symoff + (entryIndex * nlist_64.SIZE)
 			entry = nlist_64(self.linkeditFile.file, entryOff)
@@ -345,12 +590,14 @@ class _LinkeditOptimizer(object):
 			self.symbolCtx.symbolsSize += 1
 
 			entry.n_strx = self.symbolCtx.addString(name)
-			newLinkedit.extend(entry)
+			symbols.append(entry)
 
 			self.statusBar.update()
+
+		self._reserveSymbols(newLinkedit, symbols)
 		pass
 
-	def copyImportedSymbols(self, newLinkedit: bytearray) -> None:
+	def copyImportedSymbols(self, newLinkedit: _LinkeditBuilder) -> None:
 		self.statusBar.update(status="Copy Imported Symbols")
 
 		self.newImportedSymbolsStartIndex = self.symbolCtx.symbolsSize
@@ -366,6 +613,7 @@ class _LinkeditOptimizer(object):
 
 		symbolStrOff = self.symTabCmd.stroff
 
+		symbols = []
 		for entryIndex in range(entriesStart, entriesEnd):
 			entryOff = self.symTabCmd.symoff + (entryIndex * nlist_64.SIZE)
 			entry = nlist_64(self.linkeditFile.file, entryOff)
@@ -380,17 +628,19 @@ class _LinkeditOptimizer(object):
 			self.symbolCtx.symbolsSize += 1
 
 			entry.n_strx = self.symbolCtx.addString(name)
-			newLinkedit.extend(entry)
+			symbols.append(entry)
 
 			self.statusBar.update()
 
+		self._reserveSymbols(newLinkedit, symbols)
+
 		# make room for the indirect symbol entries that may
 		# be fixed in stub_fixer
 		if self.redactedSymbolCount:
-			newLinkedit.extend(b"\x00" * (self.redactedSymbolCount * nlist_64.SIZE))
+			newLinkedit.reserve(self.redactedSymbolCount * nlist_64.SIZE)
 		pass
 
-	def addRedactedSymbol(self, newLinkedit: bytearray) -> None:
+	def addRedactedSymbol(self, newLinkedit: _LinkeditBuilder) -> None:
 		"""Adds a redacted symbol entry if needed.
 
 			Some images have indirect symbols that point to the zeroth
@@ -403,17 +653,10 @@ class _LinkeditOptimizer(object):
 
 		self.statusBar.update(status="Search Redacted Symbols")
 
-		self.redactedSymbolCount = 0
-
-		indirectStart = self.dynSymTabCmd.indirectsymoff
-		indirectEnd = indirectStart + (self.dynSymTabCmd.nindirectsyms * 4)
-		for offset in range(indirectStart, indirectEnd, 4):
-			symbolIndex = self.linkeditFile.getBytes(offset, 4)
-			if symbolIndex == b"\x00\x00\x00\x00":
-				self.redactedSymbolCount += 1
-
-			self.statusBar.update()
-			pass
+		self.redactedSymbolCount = int(
+			np.count_nonzero(self.getIndirectSymbols() == 0)
+		)
+		self.statusBar.update()
 
 		if self.redactedSymbolCount:
 			stringIndex = self.symbolCtx.addString(b"<redacted>\x00")
@@ -422,86 +665,93 @@ class _LinkeditOptimizer(object):
 			symbolEntry = nlist_64()
 			symbolEntry.n_strx = stringIndex
 			symbolEntry.n_type = 1
-			newLinkedit.extend(symbolEntry)
+			self._reserveSymbols(newLinkedit, [symbolEntry])
 
 			self.extractionCtx.hasRedactedIndirect = True
 		pass
 
-	def copyFunctionStarts(self, newLinkedit: bytearray) -> None:
+	def copyFunctionStarts(self, newLinkedit: _LinkeditBuilder) -> None:
 		self.statusBar.update(status="Copy Function Starts")
 
 		if not self.functionStartsCmd:
 			return
 
-		self.newFunctionStartsOffset = len(newLinkedit)
-
-		size = self.functionStartsCmd.datasize
-		functionStarts = self.linkeditFile.getBytes(
+		self.newFunctionStartsOffset = newLinkedit.reserveCopy(
+			self.linkeditFile,
 			self.functionStartsCmd.dataoff,
-			size
+			self.functionStartsCmd.datasize
 		)
-		newLinkedit.extend(functionStarts)
 
 		self.statusBar.update()
 		pass
 
-	def copyDataInCode(self, newLinkedit: bytearray) -> None:
+	def copyDataInCode(self, newLinkedit: _LinkeditBuilder) -> None:
 		self.statusBar.update(status="Copy Data In Code")
 
 		if not self.dataInCodeCmd:
 			return
 
-		self.newDataInCodeOffset = len(newLinkedit)
-
-		size = self.dataInCodeCmd.datasize
-		dataInCode = self.linkeditFile.getBytes(self.dataInCodeCmd.dataoff, size)
-		newLinkedit.extend(dataInCode)
+		self.newDataInCodeOffset = newLinkedit.reserveCopy(
+			self.linkeditFile,
+			self.dataInCodeCmd.dataoff,
+			self.dataInCodeCmd.datasize
+		)
 
 		self.statusBar.update()
 		pass
 
-	def copyIndirectSymbolTable(self, newLinkedit: bytearray) -> None:
+	def copyIndirectSymbolTable(self, newLinkedit: _LinkeditBuilder) -> None:
 		self.statusBar.update(status="Copy Indirect Symbol Table")
 
-		self.newIndirectSymbolTableOffset = len(newLinkedit)
+		self.newIndirectSymbolTableOffset = newLinkedit.size
 
 		if not self.dynSymTabCmd:
 			return
 
-		entriesEnd = (
-			self.dynSymTabCmd.indirectsymoff
-			+ (self.dynSymTabCmd.nindirectsyms * 4)
+		# Each entry is a 32bit index into the symbol table
+		symbolIndexes = self.getIndirectSymbols()
+
+		# Special entries are left as is
+		needsMapping = ~(
+			(symbolIndexes == INDIRECT_SYMBOL_ABS)
+			| (symbolIndexes == INDIRECT_SYMBOL_LOCAL)
+			| (symbolIndexes == (INDIRECT_SYMBOL_ABS | INDIRECT_SYMBOL_LOCAL))
+			| (symbolIndexes == 0)
+		)
+		oldIndexes = symbolIndexes[needsMapping].astype(np.int64)
+
+		# map the old indexes with a lookup array, -1 marks
+		# symbols that were not copied.
+		lookupSize = max(self.oldToNewSymbolIndexes, default=-1) + 1
+		lookup = np.full(lookupSize, -1, dtype=np.int64)
+		lookup[np.fromiter(self.oldToNewSymbolIndexes.keys(), dtype=np.int64)] = (
+			np.fromiter(self.oldToNewSymbolIndexes.values(), dtype=np.int64)
 		)
 
-		for offset in range(self.dynSymTabCmd.indirectsymoff, entriesEnd, 4):
-			# Each entry is a 32bit index into the symbol table
-			symbol = self.linkeditFile.getBytes(offset, 4)
-			symbolIndex = struct.unpack("<I", symbol)[0]
+		isUnmapped = oldIndexes >= lookupSize
+		isUnmapped[~isUnmapped] = lookup[oldIndexes[~isUnmapped]] == -1
+		if isUnmapped.any():
+			raise KeyError(int(oldIndexes[isUnmapped][0]))
 
-			if (
-				symbolIndex == INDIRECT_SYMBOL_ABS
-				or symbolIndex == INDIRECT_SYMBOL_LOCAL
-				or symbolIndex == (INDIRECT_SYMBOL_ABS | INDIRECT_SYMBOL_LOCAL)
-				or symbolIndex == 0
-			):
-				# Do nothing to the entry
-				newLinkedit.extend(symbol)
-				continue
+		newSymbolIndexes = symbolIndexes.copy()
+		newSymbolIndexes[needsMapping] = lookup[oldIndexes]
 
-			newSymbolIndex = self.oldToNewSymbolIndexes[symbolIndex]
-			newLinkedit.extend(struct.pack("<I", newSymbolIndex))
+		def writer(buffer: memoryview) -> None:
+			buffer[:] = newSymbolIndexes.tobytes()
+			pass
 
-			self.statusBar.update()
+		newLinkedit.reserve(newSymbolIndexes.nbytes, writer)
+		self.statusBar.update()
 		pass
 
-	def copyStringPool(self, newLinkedit: bytearray) -> None:
+	def copyStringPool(self, newLinkedit: _LinkeditBuilder) -> None:
 		self.statusBar.update(status="Copy String Pool")
 
-		stringPool = self.symbolCtx.compileStrings()
-
-		self.newStringPoolOffset = len(newLinkedit)
-		self.newStringPoolSize = len(stringPool)
-		newLinkedit.extend(stringPool)
+		self.newStringPoolSize = self.symbolCtx.stringsSize
+		self.newStringPoolOffset = newLinkedit.reserve(
+			self.newStringPoolSize,
+			self.symbolCtx.writeStrings
+		)
 
 		self.statusBar.update()
 		pass
@@ -516,6 +766,7 @@ class _LinkeditOptimizer(object):
 		LinkeditSeg.fileoff = newLinkeditOff
 		LinkeditSeg.filesize = len(newLinkedit)
 		LinkeditSeg.vmsize = len(newLinkedit)
+		self.machoCtx.invalidateAddrIndex()
 
 		# update Symbol table
 		self.symTabCmd.symoff = newLinkeditOff + self.newSymbolTableOffset
@@ -585,7 +836,8 @@ def optimizeLinkedit(extractionCtx: ExtractionContext) -> None:
 
 	extractionCtx.statusBar.update(unit="Optimize Linkedit")
 
-	newLinkedit = bytearray()
+	# Lay out the new linkedit first, then write it in one go.
+	newLinkedit = _LinkeditBuilder()
 
 	optimizer = _LinkeditOptimizer(extractionCtx)
 
@@ -610,14 +862,14 @@ def optimizeLinkedit(extractionCtx: ExtractionContext) -> None:
 	optimizer.copyIndirectSymbolTable(newLinkedit)
 
 	# make sure the new linkedit is 8-bit aligned
-	if (len(newLinkedit) % 8) != 0:
-		newLinkedit.extend(b"\x00" * 4)
+	newLinkedit.align()
 
 	optimizer.copyStringPool(newLinkedit)
 
 	# Align again
-	if (len(newLinkedit) % 8) != 0:
-		newLinkedit.extend(b"\x00" * 4)
+	newLinkedit.align()
+
+	newLinkedit = newLinkedit.build()
 
 	# Set the new linkedit in the same location
 	newLinkeditOff = extractionCtx.machoCtx.segments[b"__LINKEDIT"].seg.fileoff
@@ -1,16 +1,23 @@
 import struct
+import bisect
 import ctypes
+import logging
+import numpy as np
 import capstone as cp
 from typing import (
 	List,
 	Set,
 	Dict,
 	Tuple,
+	Callable,
+	FrozenSet,
+	Iterator,
 	Generator
 )
 
 from DyldExtractor.extraction_context import ExtractionContext
 from DyldExtractor.macho.macho_context import MachOContext
+from DyldExtractor import leb128
 
 from DyldExtractor.converter import (
 	slide_info,
@@ -42,6 +49,7 @@ from DyldExtractor.macho.macho_structs import (
 	LoadCommands,
 	linkedit_data_command,
 	mach_header_64,
+	section_64,
 	segment_command_64
 )
 
@@ -82,6 +90,143 @@ class _ObjCFixerError(Exception):
 	pass
 
 
+# Branches that are followed when finding ADRP ranges, and the
+# index of their target in the opcodes.
+_BRANCH_TARGET_OPCODE = {
+	"b": 0,
+	"cbz": 1,
+	"cbnz": 1,
+	"tbz": 2,
+	"tbnz": 2,
+}
+
+# Instructions that end an ADRP range.
+_RETURN_MNEMONICS = ("ret", "retaa", "retab")
+
+# Instructions that modify 2 registers.
+_PAIR_MNEMONICS = (
+	"ldaxp",
+	"ldnp",
+	"ldpsw",
+	"ldxp",
+	"stlxp",
+	"stnp",
+	"stp",
+	"stxp",
+	"ldp"
+)
+
+# The entries of method lists, decoded as a whole.
+_SMALL_METHOD_DTYPE = np.dtype([
+	("name", "<i4"),
+	("types", "<i4"),
+	("imp", "<i4"),
+])
+_LARGE_METHOD_DTYPE = np.dtype([
+	("name", "<u8"),
+	("types", "<u8"),
+	("imp", "<u8"),
+])
+
+
+class _TextDisassembly(object):
+
+	# The number of instructions disassembled at a time.
+	CHUNK_SIZE = 0x1000
+
+	def __init__(self, textData: bytearray, textAddr: int) -> None:
+		"""Disassembles the __text section as instructions are accessed.
+
+		Instructions are formatted like (address, mnemonic, (opcodes, ...)),
+		and the instruction at index 0 corresponds to the first instruction.
+
+		Args:
+			textData: The data of the text section.
+			textAddr: The address of the text section.
+		"""
+
+		super().__init__()
+
+		self._textData = textData
+		self._textAddr = textAddr
+		self._instrCount = len(textData) // 4
+
+		self._chunks: Dict[int, List[Tuple[int, str, List[str]]]] = {}
+		pass
+
+	def __len__(self) -> int:
+		return self._instrCount
+
+	def __getitem__(self, idx: int) -> Tuple[int, str, List[str]]:
+		chunkIdx, instrIdx = divmod(idx, self.CHUNK_SIZE)
+
+		chunk = self._chunks.get(chunkIdx)
+		if chunk is None:
+			chunk = self._disasmChunk(chunkIdx)
+			self._chunks[chunkIdx] = chunk
+			pass
+
+		return chunk[instrIdx]
+
+	def _disasmChunk(self, chunkIdx: int) -> List[Tuple[int, str, List[str]]]:
+		textData = self._textData
+		opStrTrans = str.maketrans("", "", "[]!")
+		disassembler = cp.Cs(cp.CS_ARCH_ARM64, cp.CS_MODE_LITTLE_ENDIAN)
+
+		startIdx = chunkIdx * self.CHUNK_SIZE
+		chunkSize = min(self.CHUNK_SIZE, self._instrCount - startIdx)
+
+		# Capstone 4.0.2 doesn't support some newer PAC instructions like
+		# retab or pacibsp, and when it encounters these, it just stops.
+		# Due to this, we have to detect this and add these instructions
+		# manually, at least until Capstone is updated.
+		textDataOff = startIdx * 4
+		textDataAddr = self._textAddr + textDataOff
+		instructions = []
+		while len(instructions) < chunkSize:
+			newInstrs = [
+				(instruction[0], instruction[2], [
+					opcode.strip()
+					for opcode
+					in instruction[3].translate(opStrTrans).split(",")
+				])
+				for instruction
+				in disassembler.disasm_lite(
+					textData,
+					textDataAddr,
+					count=chunkSize - len(instructions),
+					codeOffset=textDataOff
+				)
+			]
+
+			# Check if everything was disassembled
+			if len(instructions) + len(newInstrs) == chunkSize:
+				instructions += newInstrs
+				break
+
+			# Attempt to recover from an unknown instruction
+			byteOffset = len(newInstrs) * 4
+			textDataOff += byteOffset
+			textDataAddr += byteOffset
+			nextInstr = textData[textDataOff:textDataOff + 4]
+			if nextInstr == b"\xff\x0b\x5f\xd6":  # retaa
+				newInstrs.append((textDataAddr, "retaa", []))
+				pass
+			elif nextInstr == b"\xff\x0f\x5f\xd6":  # retab
+				newInstrs.append((textDataAddr, "retab", []))
+				pass
+			else:
+				newInstrs.append((textDataAddr, "UNKNOWN", [""]))
+				pass
+
+			instructions += newInstrs
+			textDataOff += 4
+			textDataAddr += 4
+			pass
+
+		return instructions
+
+
 class _ObjCSelectorFixer(object):
 	def __init__(
 		self,
@@ -103,10 +248,22 @@ class _ObjCSelectorFixer(object):
 		self._logger = extractionCtx.logger
 		self._delegate = delegate
 
-		# All the instructions in the text section.
-		# The instruction at index 0 corresponds to
-		# the first instruction.
-		self._textInstr: Tuple[int, str, Tuple[str]] = None
+		# All the instructions in the text section, disassembled
+		# as they are needed.
+		self._textInstr: _TextDisassembly = None
+
+		# The first instruction index of every basic block in the
+		# text section, sorted.
+		self._leaders: List[int] = None
+		self._leaderSet: Set[int] = None
+
+		# Maps a block and register to the ADD instructions in the
+		# block, and the blocks that the ADRP range continues to.
+		self._blockSummaries: Dict[Tuple[int, str], Tuple[Tuple[int], Tuple[int]]] = {}
+
+		# Maps a register and block to all the ADD instructions
+		# reachable from the start of the block.
+		self._blockReach: Dict[str, Dict[int, FrozenSet[int]]] = {}
 		pass
 
 	def run(self) -> None:
@@ -117,19 +274,33 @@ class _ObjCSelectorFixer(object):
 			self._logger.error("Unable to get __text section")
 			return
 
-		self._textInstr = self._disasmText()
-		if not self._textInstr:
+		if not self._delegate._selRefCache:
 			return
 
-		self._statusBar.update(status="Fixing Selectors")
-
 		# enumerate the text
 		textSectAddr = textSect.addr
 		textSectOff, textCtx = self._dyldCtx.convertAddr(textSectAddr)
 
+		textData = bytearray(textCtx.getBytes(textSectOff, textSect.size))
+		textWords = np.frombuffer(
+			textData,
+			dtype="<u4",
+			count=len(textData) // 4
+		)
+
+		adrpIdxs = self._findCandidateAdrps(textWords, textSectAddr)
+		if not len(adrpIdxs):
+			return
+
+		self._textInstr = _TextDisassembly(textData, textSectAddr)
+		self._findLeaders(textWords, textSectAddr)
+
+		self._statusBar.update(status="Fixing Selectors")
+
 		writableTextFile = self._machoCtx.ctxForAddr(textSectAddr)
 
-		for i, instrData in enumerate(self._textInstr):
+		for i in adrpIdxs.tolist():
+			instrData = self._textInstr[i]
 			if instrData[1] != "adrp":
 				continue
 
@@ -186,7 +357,7 @@ class _ObjCSelectorFixer(object):
 					# Make sure the new address is reachable with the new adrp
 					delta = newRefAddr - newAdrpTarget
 					if delta < 0 or delta > 4095:
-						self._logger.warning(f"Unable to reach possible selector reference at: {hex(textSectAddr + (addInstrIdx * 4))}, with new ADRP target: {hex(newAdrpTarget)}, load target: {hex(newRefAddr)}, ADRP delta: {hex(delta)}")  # noqa
+						self._logger.warning("Unable to reach possible selector reference at: %#x, with new ADRP target: %#x, load target: %#x, ADRP delta: %#x", textSectAddr + (addInstrIdx * 4), newAdrpTarget, newRefAddr, delta)  # noqa
 						continue
 					pass
 
@@ -202,268 +373,493 @@ class _ObjCSelectorFixer(object):
 			pass
 		pass
 
-	def _disasmText(self) -> Tuple[int, str, Tuple[str]]:
-		"""Disassemble and save the __text section."""
+	def _findCandidateAdrps(
+		self,
+		textWords: np.ndarray,
+		textSectAddr: int
+	) -> np.ndarray:
+		"""Find the ADRP instructions that could load a selector.
 
-		self._statusBar.update(status="Disassembling Text (will appear frozen)")
+		An ADD can only add up to a page to the ADRP result, so only
+		ADRPs that target the page of a selector can need fixing.
 
-		textSect = self._machoCtx.segments[b"__TEXT"].sects[b"__text"]
-		textSectOff, ctx = self._dyldCtx.convertAddr(textSect.addr)
-		textData = bytearray(ctx.getBytes(textSectOff, textSect.size))
+		Args:
+			textWords: The instructions of the text section.
+			textSectAddr: The address of the text section.
 
-		opStrTrans = str.maketrans("", "", "[]!")
-		disassembler = cp.Cs(cp.CS_ARCH_ARM64, cp.CS_MODE_LITTLE_ENDIAN)
+		Returns:
+			The sorted instruction indices of the ADRPs.
+		"""
 
-		# Capstone 4.0.2 doesn't support some newer PAC instructions like
-		# retab or pacibsp, and when it encounters these, it just stops.
-		# Due to this, we have to detect this and add these instructions
-		# manually, at least until Capstone is updated.
-		textDataOff = 0
-		textDataAddr = textSect.addr
-		instructions = []
-		while textDataOff < textSect.size:
-			# Format the instructions like this (address, mnemonic, (opcodes, ...))
-			newInstrs = [
-				(instruction[0], instruction[2], [
-					opcode.strip()
-					for opcode
-					in instruction[3].translate(opStrTrans).split(",")
-				])
-				for instruction
-				in disassembler.disasm_lite(textData, textDataAddr, codeOffset=textDataOff)
-			]
+		adrpIdxs = np.flatnonzero((textWords & 0x9F000000) == 0x90000000)
+		adrpInstrs = textWords[adrpIdxs].astype(np.int64)
 
-			# Check if everything was disassembled
-			if len(instructions) + len(newInstrs) == (textSect.size / 4):
-				instructions += newInstrs
+		immlo = (adrpInstrs >> 29) & 0x3
+		immhi = (adrpInstrs >> 5) & 0x7FFFF
+		imm = ((immhi << 2) | immlo) << 12
+		imm = (imm ^ (1 << 32)) - (1 << 32)
+
+		adrpAddrs = textSectAddr + (adrpIdxs.astype(np.int64) * 4)
+		adrpResults = (adrpAddrs & ~0xFFF) + imm
+
+		selPages = np.unique(
+			np.fromiter(self._delegate._selRefCache.keys(), dtype=np.int64) & ~0xFFF
+		)
+		return adrpIdxs[np.isin(adrpResults, selPages)]
+
+	def _getFunctionStarts(self) -> List[int]:
+		"""Read the function start addresses from LC_FUNCTION_STARTS.
+		"""
+
+		functionStarts = self._machoCtx.getLoadCommand(
+			(LoadCommands.LC_FUNCTION_STARTS,)
+		)
+		if not functionStarts or not functionStarts.datasize:
+			return []
+
+		linkeditFile = self._machoCtx.ctxForAddr(
+			self._machoCtx.segments[b"__LINKEDIT"].seg.vmaddr
+		)
+		data = linkeditFile.getBytes(functionStarts.dataoff, functionStarts.datasize)
+
+		# The offsets are relative to the previous function,
+		# starting with the __TEXT segment
+		addresses = []
+		address = self._machoCtx.segments[b"__TEXT"].seg.vmaddr
+		readHead = 0
+		while readHead < len(data):
+			delta, readHead = leb128.decodeUleb128(data, readHead)
+			if delta == 0:
 				break
 
-			# Attempt to recover from an unknown instruction
-			byteOffset = len(newInstrs) * 4
-			textDataOff += byteOffset
-			textDataAddr += byteOffset
-			nextInstr = textData[textDataOff:textDataOff + 4]
-			if nextInstr == b"\xff\x0b\x5f\xd6":  # retaa
-				newInstrs.append((textDataAddr, "retaa", []))
-				pass
-			elif nextInstr == b"\xff\x0f\x5f\xd6":  # retab
-				newInstrs.append((textDataAddr, "retab", []))
-				pass
-			else:
-				newInstrs.append((textDataAddr, "UNKNOWN", [""]))
-				pass
+			address += delta
+			addresses.append(address)
+			pass
 
-			instructions += newInstrs
-			textDataOff += 4
-			textDataAddr += 4
+		return addresses
+
+	def _findLeaders(self, textWords: np.ndarray, textSectAddr: int) -> None:
+		"""Find the first instructions of the basic blocks.
+
+		Blocks start at functions, branch targets, and after
+		branches and returns. The branches are decoded from the
+		instruction words so that the text doesn't have to be
+		disassembled, any missed block is added when it's walked.
+		"""
+
+		instrCount = len(textWords)
+		instrIdxs = np.arange(instrCount, dtype=np.int64)
+		words = textWords.astype(np.int64)
+
+		# B
+		isB = (words & 0xFC000000) == 0x14000000
+		bDelta = words & 0x3FFFFFF
+		bDelta = (bDelta ^ (1 << 25)) - (1 << 25)
+
+		# B.cond, CBZ, CBNZ
+		isCondB = (words & 0xFF000010) == 0x54000000
+		isCb = (words & 0x7E000000) == 0x34000000
+		cbDelta = (words >> 5) & 0x7FFFF
+		cbDelta = (cbDelta ^ (1 << 18)) - (1 << 18)
+
+		# TBZ, TBNZ
+		isTb = (words & 0x7E000000) == 0x36000000
+		tbDelta = (words >> 5) & 0x3FFF
+		tbDelta = (tbDelta ^ (1 << 13)) - (1 << 13)
+
+		# RET, RETAA, RETAB
+		isRet = (
+			((words & 0xFFFFFC1F) == 0xD65F0000)
+			| (words == 0xD65F0BFF)
+			| (words == 0xD65F0FFF)
+		)
+
+		targets = np.concatenate((
+			(instrIdxs + bDelta)[isB],
+			(instrIdxs + cbDelta)[isCondB | isCb],
+			(instrIdxs + tbDelta)[isTb]
+		))
+		targets = targets[(targets >= 0) & (targets < instrCount)]
+
+		functionStarts = (
+			np.array(self._getFunctionStarts(), dtype=np.int64) - textSectAddr
+		) // 4
+		functionStarts = functionStarts[
+			(functionStarts >= 0) & (functionStarts < instrCount)
+		]
+
+		afterBranches = instrIdxs[isB | isCondB | isCb | isTb | isRet] + 1
+		afterBranches = afterBranches[afterBranches < instrCount]
+
+		leaders = np.unique(np.concatenate((
+			np.zeros(1, dtype=np.int64),
+			targets,
+			functionStarts,
+			afterBranches
+		)))
+		self._leaders = leaders.tolist()
+		self._leaderSet = set(self._leaders)
+		pass
+
+	def _addLeader(self, idx: int) -> None:
+		"""Start a new block at the instruction index.
+
+		Splitting a block doesn't change what is reachable from
+		it, so existing summaries stay valid.
+		"""
+
+		if idx not in self._leaderSet:
+			bisect.insort(self._leaders, idx)
+			self._leaderSet.add(idx)
 			pass
+		pass
 
-		return instructions
+	def _getBlockEnd(self, startIdx: int) -> int:
+		"""Get the end of the block that contains the instruction index.
+		"""
 
-	def _findAddInstructions(
+		nextLeader = bisect.bisect_right(self._leaders, startIdx)
+		if nextLeader < len(self._leaders):
+			return self._leaders[nextLeader]
+		else:
+			return len(self._textInstr)
+
+	def _getBranchTarget(self, idx: int) -> int:
+		"""Get the instruction index that a branch targets.
+		"""
+
+		address, mnemonic, opcodes = self._textInstr[idx]
+		opcodeIdx = _BRANCH_TARGET_OPCODE.get(mnemonic, 0)
+
+		branchAddr = int(opcodes[opcodeIdx][1:], 16)
+		idxDelta = int((branchAddr - address) / 4)
+		return idx + idxDelta
+
+	def _walkRange(
 		self,
 		startIdx: int,
-		adrpReg: str,
-	) -> Set[int]:
-		"""Find ADD instructions given an ADRP register.
-
-		This will iteratively follow branches and stop
-		when the ADRP range ends.
+		endIdx: int,
+		adrpReg: str
+	) -> Tuple[List[int], List[int]]:
+		"""Walk the ADRP range within a block.
 
 		Args:
 			startIdx: The instruction index to start at.
+			endIdx: The end of the block.
+			adrpReg: The ADRP register.
+
 		Returns:
-			A list of indices to the ADD instructions.
+			A tuple of the indices of ADD instructions, and the
+			instruction indices where the range continues.
 		"""
 
-		addIdxs = set()
-
-		# set of indexes that are or being processed
-		processedIdx = set()
+		addIdxs = []
+		nextIdxs = []
+		instrCount = len(self._textInstr)
 
-		# list of indices that need to be processed
-		startIndices = [startIdx]
+		for i in range(startIdx, endIdx):
+			address, mnemonic, opcodes = self._textInstr[i]
 
-		while len(startIndices):
-			i = startIndices.pop()
-			if i in processedIdx:
-				continue
-			else:
-				processedIdx.add(i)
+			# check if the ADRP dest reg matches the base reg for the ADD
+			if mnemonic == "add" and opcodes[1] == adrpReg:
+				addIdxs.append(i)
 				pass
 
-			while i < len(self._textInstr) and i >= 0:
-				address, mnemonic, opcodes = self._textInstr[i]
+			# If there is an unconditional branch, and it points
+			# within the text section, follow it. If it does not
+			# point within the text section, end the ADRP range.
+			if mnemonic == "b":
+				target = self._getBranchTarget(i)
+				if target >= 0 and target < instrCount:
+					nextIdxs.append(target)
+					pass
+				return addIdxs, nextIdxs
 
-				# check if the ADRP dest reg matches the base reg for the ADD
-				if mnemonic == "add" and opcodes[1] == adrpReg:
-					addIdxs.add(i)
+			# If there is a conditional branch, follow it and continue
+			elif mnemonic in _BRANCH_TARGET_OPCODE or mnemonic[0:2] == "b.":
+				target = self._getBranchTarget(i)
+				if target >= 0 and target < instrCount:
+					nextIdxs.append(target)
 					pass
+				pass
 
-				# If there is an unconditional branch, and it points
-				# within the text section, follow it. If it does not
-				# point within the text section, end the ADRP range.
-				if mnemonic == "b":
-					branchAddr = int(opcodes[0][1:], 16)
-					idxDelta = int((branchAddr - address) / 4)
-					i += idxDelta
+			# End the ADRP range if the function returns
+			if mnemonic in _RETURN_MNEMONICS:
+				return addIdxs, nextIdxs
 
-					if i < 0 or i >= len(self._textInstr):
-						break
+			# If we find an instruction modifying the register,
+			# the adrp range probably ended.
+			if adrpReg == opcodes[0]:
+				return addIdxs, nextIdxs
+
+			if mnemonic in _PAIR_MNEMONICS and adrpReg == opcodes[1]:
+				return addIdxs, nextIdxs
+			pass
+
+		# continue into the next block
+		if endIdx < instrCount:
+			nextIdxs.append(endIdx)
+			pass
+
+		return addIdxs, nextIdxs
+
+	def _getBlockSummary(
+		self,
+		block: int,
+		adrpReg: str
+	) -> Tuple[Tuple[int], Tuple[int]]:
+		"""Get the ADD instructions and successors of a block.
+
+		Args:
+			block: The first instruction index of the block.
+			adrpReg: The ADRP register.
+
+		Returns:
+			A tuple of the ADD instruction indices in the block, and
+			the blocks the ADRP range continues to.
+		"""
+
+		key = (block, adrpReg)
+		if (summary := self._blockSummaries.get(key)) is not None:
+			return summary
+
+		addIdxs, nextIdxs = self._walkRange(
+			block,
+			self._getBlockEnd(block),
+			adrpReg
+		)
+		for nextIdx in nextIdxs:
+			self._addLeader(nextIdx)
+			pass
+
+		summary = (tuple(addIdxs), tuple(nextIdxs))
+		self._blockSummaries[key] = summary
+		return summary
+
+	def _getReachableAdds(self, block: int, adrpReg: str) -> FrozenSet[int]:
+		"""Get all the ADD instructions reachable from a block.
+
+		The blocks are processed by strongly connected components,
+		using an iterative version of Tarjan's algorithm. The result
+		of every visited block is memoized.
+
+		Args:
+			block: The first instruction index of the block.
+			adrpReg: The ADRP register.
 
-					startIndices.append(i)
+		Returns:
+			A set of ADD instruction indices.
+		"""
+
+		reach = self._blockReach.setdefault(adrpReg, {})
+		if block in reach:
+			return reach[block]
+
+		indices = {block: 0}
+		lowLinks = {block: 0}
+		stack = [block]
+		onStack = {block}
+		callStack = [(block, iter(self._getBlockSummary(block, adrpReg)[1]))]
+
+		while callStack:
+			node, successors = callStack[-1]
+
+			for successor in successors:
+				if successor in reach:
+					continue
+
+				if successor not in indices:
+					indices[successor] = lowLinks[successor] = len(indices)
+					stack.append(successor)
+					onStack.add(successor)
+					callStack.append((
+						successor,
+						iter(self._getBlockSummary(successor, adrpReg)[1])
+					))
 					break
 
-				# If there is a conditional branch, follow it and continue
-				elif mnemonic[0:2] == "b.":
-					branchAddr = int(opcodes[0][1:], 16)
-					idxDelta = int((branchAddr - address) / 4)
-					startIndices.append(i + idxDelta)
-					pass
-				elif mnemonic == "cbz" or mnemonic == "cbnz":
-					branchAddr = int(opcodes[1][1:], 16)
-					idxDelta = int((branchAddr - address) / 4)
-					startIndices.append(i + idxDelta)
-					pass
-				elif mnemonic == "tbz" or mnemonic == "tbnz":
-					branchAddr = int(opcodes[2][1:], 16)
-					idxDelta = int((branchAddr - address) / 4)
-					startIndices.append(i + idxDelta)
+				elif successor in onStack:
+					lowLinks[node] = min(lowLinks[node], indices[successor])
 					pass
+				pass
 
-				# End the ADRP range if the function returns
-				if mnemonic in (
-					"ret",
-					"retaa",
-					"retab"
-				):
-					break
+			else:
+				callStack.pop()
+				if callStack:
+					parent = callStack[-1][0]
+					lowLinks[parent] = min(lowLinks[parent], lowLinks[node])
+					pass
 
-				# If we find an instruction modifying the register,
-				# the adrp range probably ended.
-				if adrpReg == opcodes[0]:
-					break
+				if lowLinks[node] != indices[node]:
+					continue
 
-				# These instructions modify 2 registers.
-				if mnemonic in (
-					"ldaxp",
-					"ldnp",
-					"ldpsw",
-					"ldxp",
-					"stlxp",
-					"stnp",
-					"stp",
-					"stxp",
-					"ldp"
-				):
-					if adrpReg == opcodes[1]:
+				# node is the root of a component, collect its result
+				members = set()
+				while True:
+					member = stack.pop()
+					onStack.discard(member)
+					members.add(member)
+					if member == node:
 						break
 					pass
 
-				i += 1
+				addIdxs = set()
+				successorResults = []
+				for member in members:
+					memberAdds, memberSuccessors = self._getBlockSummary(member, adrpReg)
+					addIdxs.update(memberAdds)
+					successorResults.extend(
+						reach[successor]
+						for successor in memberSuccessors
+						if successor not in members
+					)
+					pass
+
+				if not addIdxs and len(successorResults) == 1:
+					result = successorResults[0]
+				else:
+					result = frozenset(addIdxs.union(*successorResults))
+					pass
+
+				for member in members:
+					reach[member] = result
+					pass
 				pass
 			pass
 
+		return reach[block]
+
+	def _findAddInstructions(
+		self,
+		startIdx: int,
+		adrpReg: str,
+	) -> Set[int]:
+		"""Find ADD instructions given an ADRP register.
+
+		This follows branches and stops when the ADRP range ends.
+		Ranges are walked by basic blocks, and the ADD instructions
+		reachable from each block are memoized.
+
+		Args:
+			startIdx: The instruction index to start at.
+		Returns:
+			A list of indices to the ADD instructions.
+		"""
+
+		if startIdx < 0 or startIdx >= len(self._textInstr):
+			return set()
+
+		# walk to the end of the block that contains the start
+		addIdxs, nextIdxs = self._walkRange(
+			startIdx,
+			self._getBlockEnd(startIdx),
+			adrpReg
+		)
+
+		addIdxs = set(addIdxs)
+		for nextIdx in nextIdxs:
+			self._addLeader(nextIdx)
+			addIdxs.update(self._getReachableAdds(nextIdx, adrpReg))
+			pass
+
 		return addIdxs
 
 
-class _ObjCFixer(object):
+class _ObjCCacheInfo(object):
+
+	SHARED_DATA_NAME = "objcCacheInfo"
 
 	def __init__(self, extractionCtx: ExtractionContext) -> None:
+		"""ObjC information derived from libobjc.
+
+		Holds the ObjC image index of each header and the base of the
+		optimized method names. Problems are recorded in errors and
+		messages instead of logged, so that every image can replay them.
+		"""
+
 		super().__init__()
 
-		self._extractionCtx = extractionCtx
 		self._dyldCtx = extractionCtx.dyldCtx
-		self._machoCtx = extractionCtx.machoCtx
-		self._statusBar = extractionCtx.statusBar
-		self._logger = extractionCtx.logger
-
 		self._slider = slide_info.PointerSlider(extractionCtx)
-		pass
 
-	def run(self):
-		# check if the optimization flag is set
-		imageInfo = None
-		imageInfoFile = None
-		for seg in self._machoCtx.segmentsI:
-			if b"__objc_imageinfo" in seg.sects:
-				imageInfo = seg.sects[b"__objc_imageinfo"]
-				imageInfoFile = self._machoCtx.ctxForAddr(seg.seg.vmaddr)
-				break
-			pass
+		# Errors that prevent fixing ObjC.
+		self.errors: List[str] = []
 
-		if not imageInfo:
-			return
+		# Other messages to log, as tuples of the level and message.
+		self.messages: List[Tuple[int, str]] = []
 
-		flagsOff = self._dyldCtx.convertAddr(imageInfo.addr)[0]
-		flags = imageInfoFile.readFormat(
-			"<I",
-			flagsOff + 4,
-		)[0]
-		if not flags & 0x8:
-			self._logger.info("ObjC was not optimized by Dyld, not fixing ObjC.")
-			return
+		# Maps the address of an image's header to its ObjC image index.
+		self.imageIndexes: Dict[int, int] = {}
 
-		# Removed the optimized objc bit
-		flags &= 0xfffffff7
-		imageInfoFile.writeBytes(flagsOff, struct.pack("<I", flags))
-
-		self._createExtraSegment()
+		self.usesObjcRoRelativeNames = False
+		self.optMethodNamesAddr: int = None
 
 		# Get the libobjc.A.dylib image
 		for image in self._dyldCtx.images:
 			path = self._dyldCtx.readString(image.pathFileOffset)
 			if b"libobjc.A.dylib" in path:
 				offset, ctx = self._dyldCtx.convertAddr(image.address)
-				self._libobjcImage = MachOContext(ctx.fileObject, offset)
+				self._libobjcImage = MachOContext(ctx.fileObject, offset, lazy=True)
 				break
 			pass
 		else:
-			self._logger.error("Unable to find libobjc.A.dylib")
+			self.errors.append("Unable to find libobjc.A.dylib")
 			return
-		
-		# Get image index
-		self._imageIndex = self._getImageIndex()
-		if self._imageIndex == -1:
-			self._logger.error("Unable to get objc image index")
+
+		if not self._readImageIndexes():
+			self.errors.append("Unable to get objc image index")
 			return
 
 		self._checkMethodNameStorage()
+		pass
 
-		# caches that map the original definition address
-		# to its new processed address.
-		self._categoryCache: Dict[int, int] = {}
-		self._classCache: Dict[int, int] = {}
-		self._classDataCache: Dict[int, int] = {}
-		self._ivarListCache: Dict[int, int] = {}
-		self._protocolListCache: Dict[int, int] = {}
-		self._protocolCache: Dict[int, int] = {}
-		self._propertyListCache: Dict[int, int] = {}
-		self._methodListCache: Dict[int, int] = {}
-		self._stringCache: Dict[int, int] = {}
-		self._intCache: Dict[int, int] = {}
-		self._methodNameCache: Dict[int, int] = {}
+	def _readImageIndexes(self) -> bool:
+		"""Read the ObjC specific image index of every image.
 
-		# connects a selrefs old target to its pointer address
-		self._selRefCache: Dict[int, int] = {}
+		Returns:
+			False if the header info could not be read.
+		"""
 
-		# A list of class pointers that are being processed.
-		self._classesProcessing: List[int] = []
+		# Read headeropt offset
+		objcOptAddr = None
+		for seg in self._libobjcImage.segments.values():
+			if b"__objc_opt_ro" in seg.sects:
+				objcOptAddr = seg.sects[b"__objc_opt_ro"].addr
+				break
+		if objcOptAddr is None:
+			self.errors.append("Unable to find __objc_opt_ro section")
+			return False
 
-		# A list of pointers that need to be updated at the end
-		# The first int is the address to the pointer that needs
-		# to be changed. The second int is the address of the
-		# target class
-		self._futureClasses: List[Tuple[int, int]] = []
+		# Get header opt offset
+		objcOptOff, objcOptFile = self._dyldCtx.convertAddr(objcOptAddr)
+		objcOptVer = objcOptFile.readFormat("<I", objcOptOff)[0]
 
-		self._processSections()
-		self._finalizeFutureClasses()
+		if objcOptVer in (12, 13):
+			headerOptOff = objc_opt_t_V12(objcOptFile.file, objcOptOff).headeropt_offset
+		elif objcOptVer in (15, 16):
+			headerOptOff = objc_opt_t_V15a(objcOptFile.file, objcOptOff).headeropt_ro_offset
+		else:
+			self.errors.append(f"Unknown objc_opt_t version: {objcOptVer}")
+			return False
+		if headerOptOff == 0:
+			self.errors.append("libobjc does not have objc_headeropt_ro_t")
+			return False
+		headerOptAddr = objcOptAddr + headerOptOff
 
-		_ObjCSelectorFixer(self._extractionCtx, self).run()
+		headerOptDataOff, headerOptFile = self._dyldCtx.convertAddr(headerOptAddr)
+		headerOpt = objc_headeropt_ro_t(headerOptFile.file, headerOptDataOff)
 
-		self._checkSpaceConstraints()
-		self._addExtraDataSeg()
-		pass
+		for i in range(headerOpt.count):
+			infoOff = objc_headeropt_ro_t.SIZE + (i * headerOpt.entsize)
+			infoAddr = headerOptAddr + infoOff
+			infoDataOff = headerOptDataOff + infoOff
+			info = objc_header_info_ro_t_64(headerOptFile.file, infoDataOff)
+
+			# keep the first index if there are duplicates
+			self.imageIndexes.setdefault(info.mhdr_offset + infoAddr, i)
+			pass
+
+		return True
 
 	def _checkMethodNameStorage(self) -> None:
 		"""Check where method names are stored.
@@ -474,9 +870,6 @@ class _ObjCFixer(object):
 		This tries to detect which is being used.
 		"""
 
-		self._usesObjcRoRelativeNames = False
-		self._optMethodNamesAddr = None
-
 		# Get __objc_scoffs, __objc_classlist
 		objcScoffs = None
 		objcClasslist = None
@@ -498,13 +891,13 @@ class _ObjCFixer(object):
 			# Older caches do not have this
 			return
 		elif objcClasslist is None:
-			self._logger.error("libobjc does not have __objc_classlist")
+			self.messages.append((logging.ERROR, "libobjc does not have __objc_classlist"))
 			return
 
 		# Parse __objc_scoffs
 		if objcScoffs.size == 0x20:
 			# Just 4 pointers, starting with methods start and methods end
-			self._optMethodNamesAddr = self._slider.slideAddress(objcScoffs.addr)
+			self.optMethodNamesAddr = self._slider.slideAddress(objcScoffs.addr)
 			_optMethodNamesEnd = self._slider.slideAddress(objcScoffs.addr + 8)
 			pass
 		elif objcScoffs.size == 0x28:
@@ -512,28 +905,28 @@ class _ObjCFixer(object):
 			verOff, ctx = self._dyldCtx.convertAddr(objcScoffs.addr)
 			version = ctx.readFormat("<Q", verOff)[0]
 			if version != 2 and version != 3 and version != 4:
-				self._logger.warning(
+				self.messages.append((
+					logging.WARNING,
 					f"Unknown objc opt version: {version}, but continuing on."
-				)
+				))
 				pass
 
-			self._optMethodNamesAddr = self._slider.slideAddress(objcScoffs.addr + 8)
+			self.optMethodNamesAddr = self._slider.slideAddress(objcScoffs.addr + 8)
 			_optMethodNamesEnd = self._slider.slideAddress(objcScoffs.addr + 16)
 			pass
 		else:
-			self._logger.error("Unable to parse objc scoffs")
+			self.messages.append((logging.ERROR, "Unable to parse objc scoffs"))
 			return
 
-		optMethodNamesSize = _optMethodNamesEnd - self._optMethodNamesAddr
+		optMethodNamesSize = _optMethodNamesEnd - self.optMethodNamesAddr
 
 		# Create a generator to get method lists
 		def getMethodLists() -> Generator[int, None, None]:
-			for ptrAddr in range(
+			classAddrs = self._slider.slideRange(
 				objcClasslist.addr,
-				objcClasslist.addr + objcClasslist.size,
-				8
-			):
-				classAddr = self._slider.slideAddress(ptrAddr)
+				len(range(objcClasslist.addr, objcClasslist.addr + objcClasslist.size, 8))
+			)
+			for classAddr in classAddrs.tolist():
 				classDef = self._slider.slideStruct(classAddr, objc_class_t)
 				classDataDef = self._slider.slideStruct(
 					classDef.data & ~0x3,
@@ -567,10 +960,111 @@ class _ObjCFixer(object):
 
 			# TODO: Hopefully there is a better way to detect this.
 			if name >= 0 and name < optMethodNamesSize:
-				self._usesObjcRoRelativeNames = True
+				self.usesObjcRoRelativeNames = True
 				pass
 			return
 		return
+	pass
+
+
+class _ObjCFixer(object):
+
+	def __init__(self, extractionCtx: ExtractionContext) -> None:
+		super().__init__()
+
+		self._extractionCtx = extractionCtx
+		self._dyldCtx = extractionCtx.dyldCtx
+		self._machoCtx = extractionCtx.machoCtx
+		self._statusBar = extractionCtx.statusBar
+		self._logger = extractionCtx.logger
+
+		self._slider = slide_info.PointerSlider(extractionCtx)
+		pass
+
+	def run(self):
+		# check if the optimization flag is set
+		imageInfo = None
+		imageInfoFile = None
+		for seg in self._machoCtx.segmentsI:
+			if b"__objc_imageinfo" in seg.sects:
+				imageInfo = seg.sects[b"__objc_imageinfo"]
+				imageInfoFile = self._machoCtx.ctxForAddr(seg.seg.vmaddr)
+				break
+			pass
+
+		if not imageInfo:
+			return
+
+		flagsOff = self._dyldCtx.convertAddr(imageInfo.addr)[0]
+		flags = imageInfoFile.readFormat(
+			"<I",
+			flagsOff + 4,
+		)[0]
+		if not flags & 0x8:
+			self._logger.info("ObjC was not optimized by Dyld, not fixing ObjC.")
+			return
+
+		# Removed the optimized objc bit
+		flags &= 0xfffffff7
+		imageInfoFile.writeBytes(flagsOff, struct.pack("<I", flags))
+
+		self._createExtraSegment()
+
+		# Get the ObjC info derived from libobjc
+		objcInfo: _ObjCCacheInfo = self._dyldCtx.getSharedData(
+			_ObjCCacheInfo.SHARED_DATA_NAME,
+			lambda: _ObjCCacheInfo(self._extractionCtx)
+		)
+		if objcInfo.errors:
+			for error in objcInfo.errors:
+				self._logger.error(error)
+				pass
+			return
+
+		# Get image index
+		imageAddr = self._machoCtx.segments[b"__TEXT"].seg.vmaddr
+		self._imageIndex = objcInfo.imageIndexes.get(imageAddr, -1)
+		if self._imageIndex == -1:
+			self._logger.error("Unable to get objc image index")
+			return
+
+		for level, message in objcInfo.messages:
+			self._logger.log(level, message)
+			pass
+
+		self._usesObjcRoRelativeNames = objcInfo.usesObjcRoRelativeNames
+		self._optMethodNamesAddr = objcInfo.optMethodNamesAddr
+
+		# caches that map the original definition address
+		# to its new processed address.
+		self._categoryCache: Dict[int, int] = {}
+		self._classCache: Dict[int, int] = {}
+		self._classDataCache: Dict[int, int] = {}
+		self._ivarListCache: Dict[int, int] = {}
+		self._protocolListCache: Dict[int, int] = {}
+		self._protocolCache: Dict[int, int] = {}
+		self._propertyListCache: Dict[int, int] = {}
+		self._methodListCache: Dict[int, int] = {}
+		self._stringCache: Dict[int, int] = {}
+		self._intCache: Dict[int, int] = {}
+		self._methodNameCache: Dict[int, int] = {}
+
+		# connects a selrefs old target to its pointer address
+		self._selRefCache: Dict[int, int] = {}
+
+		# Structures that have an address but still need to be
+		# processed. Maps the method that processes a type of
+		# structure to the pending structures of that type.
+		self._worklist: Dict[Callable[[List[tuple]], None], List[tuple]] = {}
+
+		self._processSections()
+		self._processWorklist()
+
+		_ObjCSelectorFixer(self._extractionCtx, self).run()
+
+		self._checkSpaceConstraints()
+		self._addExtraDataSeg()
+		pass
 
 	def _createExtraSegment(self) -> None:
 		"""Create an extra segment to store data in.
@@ -633,54 +1127,59 @@ class _ObjCFixer(object):
 		self._extraData = bytearray()
 		pass
 
+	def _slideSection(self, sect: section_64) -> Iterator[Tuple[int, int]]:
+		"""Slide all the pointers in a section at once.
+
+		Returns:
+			Pairs of pointer addresses and their slid values. Pointers
+			that can't be slid have a value of 0.
+		"""
+
+		ptrAddrs = range(sect.addr, sect.addr + sect.size, 8)
+		slidPtrs = self._slider.slideRange(sect.addr, len(ptrAddrs))
+		return zip(ptrAddrs, slidPtrs.tolist())
+
 	def _processSections(self) -> None:
 		for segment in self._machoCtx.segmentsI:
 			for sect in segment.sectsI:
 
 				if sect.sectname == b"__objc_classlist":
-					for ptrAddr in range(sect.addr, sect.addr + sect.size, 8):
+					for ptrAddr, classAddr in self._slideSection(sect):
 						self._statusBar.update(status="Processing Classes")
-						classAddr = self._slider.slideAddress(ptrAddr)
 
 						if self._machoCtx.containsAddr(classAddr):
-							if self._processClass(classAddr)[1]:
-								self._futureClasses.append((ptrAddr, classAddr))
-								pass
-
+							self._addClass(classAddr)
 							continue
 
-						self._logger.warning(f"Class pointer at {hex(ptrAddr)} points to class outside MachO file.")  # noqa
+						self._logger.warning("Class pointer at %#x points to class outside MachO file.", ptrAddr)  # noqa
 					pass
 
 				elif sect.sectname == b"__objc_catlist":
-					for ptrAddr in range(sect.addr, sect.addr + sect.size, 8):
+					for ptrAddr, categoryAddr in self._slideSection(sect):
 						self._statusBar.update(status="Processing Categories")
-						categoryAddr = self._slider.slideAddress(ptrAddr)
 
 						if self._machoCtx.containsAddr(categoryAddr):
-							self._processCategory(categoryAddr)
+							self._addCategory(categoryAddr)
 							continue
 
-						self._logger.warning(f"Category pointer at {hex(ptrAddr)} points to category outside MachO file.")  # noqa
+						self._logger.warning("Category pointer at %#x points to category outside MachO file.", ptrAddr)  # noqa
 					pass
 
 				elif sect.sectname == b"__objc_protolist":
-					for ptrAddr in range(sect.addr, sect.addr + sect.size, 8):
+					for ptrAddr, protoAddr in self._slideSection(sect):
 						self._statusBar.update(status="Processing Protocols")
-						protoAddr = self._slider.slideAddress(ptrAddr)
 
 						if self._machoCtx.containsAddr(protoAddr):
-							self._processProtocol(protoAddr)
+							self._addProtocol(protoAddr)
 							continue
 
-						self._logger.warning(f"Protocol pointer at {hex(ptrAddr)} points to protocol outside MachO file.")  # noqa
+						self._logger.warning("Protocol pointer at %#x points to protocol outside MachO file.", ptrAddr)  # noqa
 					pass
 
 				elif sect.sectname == b"__objc_selrefs":
 					file = self._machoCtx.ctxForAddr(sect.addr)
-					for ptrAddr in range(sect.addr, sect.addr + sect.size, 8):
+					for ptrAddr, selRefAddr in self._slideSection(sect):
 						self._statusBar.update(status="Processing Selector References")
-						selRefAddr = self._slider.slideAddress(ptrAddr)
 
 						self._selRefCache[selRefAddr] = ptrAddr
 
@@ -694,15 +1193,14 @@ class _ObjCFixer(object):
 
 				elif sect.sectname == b"__objc_protorefs":
 					file = self._machoCtx.ctxForAddr(sect.addr)
-					for ptrAddr in range(sect.addr, sect.addr + sect.size, 8):
+					for ptrAddr, protoRefAddr in self._slideSection(sect):
 						self._statusBar.update(status="Processing Protocols References")
-						protoRefAddr = self._slider.slideAddress(ptrAddr)
 
 						if protoRefAddr == 0:
 							# a null ref?
 							continue
 
-						newPtr = self._processProtocol(protoRefAddr)
+						newPtr = self._addProtocol(protoRefAddr)
 						file.writeBytes(
 							self._dyldCtx.convertAddr(ptrAddr)[0],
 							struct.pack("<Q", newPtr)
@@ -711,47 +1209,35 @@ class _ObjCFixer(object):
 
 				if sect.sectname == b"__objc_classrefs":
 					file = self._machoCtx.ctxForAddr(sect.addr)
-					for ptrAddr in range(sect.addr, sect.addr + sect.size, 8):
+					for ptrAddr, classRefAddr in self._slideSection(sect):
 						self._statusBar.update(status="Processing Classes References")
-						classRefAddr = self._slider.slideAddress(ptrAddr)
 
 						if classRefAddr == 0:
 							# a null ref?
 							continue
 
-						newPtr, incomplete = self._processClass(classRefAddr)
-						if incomplete:
-							self._futureClasses.append((ptrAddr, classRefAddr))
-							pass
-						else:
-							file.writeBytes(
-								self._dyldCtx.convertAddr(ptrAddr)[0],
-								struct.pack("<Q", newPtr)
-							)
-							pass
+						newPtr = self._addClass(classRefAddr)
+						file.writeBytes(
+							self._dyldCtx.convertAddr(ptrAddr)[0],
+							struct.pack("<Q", newPtr)
+						)
 						pass
 					pass
 
 				if sect.sectname == b"__objc_superrefs":
 					file = self._machoCtx.ctxForAddr(sect.addr)
-					for ptrAddr in range(sect.addr, sect.addr + sect.size, 8):
+					for ptrAddr, superRefAddr in self._slideSection(sect):
 						self._statusBar.update(status="Processing Super References")
-						superRefAddr = self._slider.slideAddress(ptrAddr)
 
 						if superRefAddr == 0:
 							# a null ref?
 							continue
 
-						newPtr, incomplete = self._processClass(superRefAddr)
-						if incomplete:
-							self._futureClasses.append((ptrAddr, superRefAddr))
-							pass
-						else:
-							file.writeBytes(
-								self._dyldCtx.convertAddr(ptrAddr)[0],
-								struct.pack("<Q", newPtr)
-							)
-							pass
+						newPtr = self._addClass(superRefAddr)
+						file.writeBytes(
+							self._dyldCtx.convertAddr(ptrAddr)[0],
+							struct.pack("<Q", newPtr)
+						)
 						pass
 					pass
 				pass
@@ -774,398 +1260,461 @@ class _ObjCFixer(object):
 		self._extraDataHead += len(data)
 		pass
 
-	def _processCategory(self, categoryAddr: int) -> int:
-		if categoryAddr in self._categoryCache:
-			return self._categoryCache[categoryAddr]
+	def _reserveData(self, addr: int, size: int) -> int:
+		"""Get the new address of a structure.
 
-		categoryDef = self._slider.slideStruct(categoryAddr, objc_category_t)
+		Structures in the image keep their address, otherwise
+		space is reserved in the extra data for it.
 
-		if categoryDef.name:
-			categoryDef.name = self._processString(categoryDef.name)
-			pass
-
-		needsFutureClass = False
-		if categoryDef.cls:
-			categoryDef.cls, needsFutureClass = self._processClass(categoryDef.cls)
-			pass
+		Args:
+			addr: The original address of the structure.
+			size: The size of the structure.
 
-		if categoryDef.instanceMethods:
-			categoryDef.instanceMethods = self._processMethodList(
-				categoryDef.instanceMethods
-			)
-			pass
+		Returns:
+			The new address of the structure.
+		"""
 
-		if categoryDef.classMethods:
-			categoryDef.classMethods = self._processMethodList(categoryDef.classMethods)
-			pass
+		if self._machoCtx.containsAddr(addr):
+			return addr
 
-		if categoryDef.protocols:
-			categoryDef.protocols = self._processProtocolList(categoryDef.protocols)
-			pass
+		newAddr = self._extraDataHead
+		self._addExtraData(bytes(size))
+		return newAddr
 
-		if categoryDef.instanceProperties:
-			categoryDef.instanceProperties = self._processPropertyList(
-				categoryDef.instanceProperties
-			)
-			pass
+	def _writeData(self, addr: int, newAddr: int, data: bytes) -> None:
+		"""Write a processed structure to its new address.
 
-		# Add or update data
-		if self._machoCtx.containsAddr(categoryAddr):
-			newCategoryAddr = categoryAddr
+		Args:
+			addr: The original address of the structure.
+			newAddr: The address given by _reserveData.
+			data: The processed structure.
+		"""
 
-			file = self._machoCtx.ctxForAddr(categoryAddr)
-			defOff = self._dyldCtx.convertAddr(categoryAddr)[0]
-			file.writeBytes(defOff, categoryDef)
+		if self._machoCtx.containsAddr(addr):
+			file = self._machoCtx.ctxForAddr(addr)
+			defOff = self._dyldCtx.convertAddr(addr)[0]
+			file.writeBytes(defOff, data)
 			pass
 		else:
-			newCategoryAddr = self._extraDataHead
-			self._addExtraData(categoryDef)
+			data = bytes(data)
+			dataOff = newAddr - self._extraSegment.vmaddr
+			self._extraData[dataOff:dataOff + len(data)] = data
 			pass
+		pass
 
-		if needsFutureClass:
-			futureClass = (
-				newCategoryAddr + objc_category_t.cls.offset,
-				categoryDef.cls
-			)
-			self._futureClasses.append(futureClass)
+	def _enqueue(self, processor: Callable[[List[tuple]], None], node: tuple) -> None:
+		"""Add a structure to the worklist.
+
+		Args:
+			processor: The method that processes a batch of the
+				structures.
+			node: The arguments for the structure, starting with its
+				original and new address.
+		"""
+
+		self._worklist.setdefault(processor, []).append(node)
+		pass
+
+	def _processWorklist(self) -> None:
+		"""Process structures until the worklist is empty.
+
+		All the pending structures of a type are processed together,
+		any structures they reference are added to the worklist.
+		"""
+
+		while self._worklist:
+			processor = next(iter(self._worklist))
+			nodes = self._worklist.pop(processor)
+
+			self._statusBar.update(status="Processing ObjC Data")
+			processor(nodes)
 			pass
+		pass
+
+	def _addCategory(self, categoryAddr: int) -> int:
+		if categoryAddr in self._categoryCache:
+			return self._categoryCache[categoryAddr]
+
+		newCategoryAddr = self._reserveData(
+			categoryAddr,
+			ctypes.sizeof(objc_category_t)
+		)
+		self._enqueue(self._processCategories, (categoryAddr, newCategoryAddr))
 
 		self._categoryCache[categoryAddr] = newCategoryAddr
 		return newCategoryAddr
 
-	def _processClass(self, classAddr: int) -> Tuple[int, bool]:
-		"""Process a class definition.
+	def _processCategories(self, nodes: List[Tuple[int, int]]) -> None:
+		categoryDefs = self._slider.slideStructs(
+			[categoryAddr for categoryAddr, _ in nodes],
+			objc_category_t
+		)
+
+		for (categoryAddr, newCategoryAddr), categoryDef in zip(nodes, categoryDefs):
+			if categoryDef.name:
+				categoryDef.name = self._processString(categoryDef.name)
+				pass
+
+			if categoryDef.cls:
+				categoryDef.cls = self._addClass(categoryDef.cls)
+				pass
+
+			if categoryDef.instanceMethods:
+				categoryDef.instanceMethods = self._addMethodList(
+					categoryDef.instanceMethods
+				)
+				pass
+
+			if categoryDef.classMethods:
+				categoryDef.classMethods = self._addMethodList(categoryDef.classMethods)
+				pass
+
+			if categoryDef.protocols:
+				categoryDef.protocols = self._addProtocolList(categoryDef.protocols)
+				pass
+
+			if categoryDef.instanceProperties:
+				categoryDef.instanceProperties = self._addPropertyList(
+					categoryDef.instanceProperties
+				)
+				pass
+
+			self._writeData(categoryAddr, newCategoryAddr, categoryDef)
+			pass
+		pass
+
+	def _addClass(self, classAddr: int) -> int:
+		"""Add a class definition.
+
+		The address of the class is decided before it is processed,
+		so classes that reference each other don't need to wait for
+		each other.
 
 		Args:
-			defAddr: The address of the class definition.
+			classAddr: The address of the class definition.
 
 		Returns:
-			If the class if fully defined the updated address
-			of the class is returned along with False. Otherwise
-			the original address of the class is returned, along
-			with True.
+			The updated address of the class.
 		"""
 
-		# check if the class is already being processed.
-		if classAddr in self._classesProcessing:
-			return classAddr, True
-
-		# check if the class was processed before
 		if classAddr in self._classCache:
-			return self._classCache[classAddr], False
-
-		self._classesProcessing.append(classAddr)
-		classDef = self._slider.slideStruct(classAddr, objc_class_t)
+			return self._classCache[classAddr]
 
-		needsFutureIsa = False
-		if classDef.isa:
-			classDef.isa, needsFutureIsa = self._processClass(classDef.isa)
-			pass
+		newClassAddr = self._reserveData(classAddr, ctypes.sizeof(objc_class_t))
+		self._enqueue(self._processClasses, (classAddr, newClassAddr))
 
-		needsFutureSuper = False
-		if classDef.superclass:
-			classDef.superclass, needsFutureSuper = self._processClass(
-				classDef.superclass
-			)
-			pass
+		self._classCache[classAddr] = newClassAddr
+		return newClassAddr
 
-		# zero out cache and vtable
-		classDef.method_cache = 0
-		classDef.vtable = 0
+	def _processClasses(self, nodes: List[Tuple[int, int]]) -> None:
+		classDefs = self._slider.slideStructs(
+			[classAddr for classAddr, _ in nodes],
+			objc_class_t
+		)
 
-		if classDef.data:
-			# Low bit marks Swift classes
-			isStubClass = not self._machoCtx.containsAddr(classAddr)
-			classDef.data = self._processClassData(
-				classDef.data & ~0x3,
-				isStubClass=isStubClass
-			)
-			pass
+		for (classAddr, newClassAddr), classDef in zip(nodes, classDefs):
+			if classDef.isa:
+				classDef.isa = self._addClass(classDef.isa)
+				pass
 
-		# add or update data
-		if self._machoCtx.containsAddr(classAddr):
-			newClassAddr = classAddr
+			if classDef.superclass:
+				classDef.superclass = self._addClass(classDef.superclass)
+				pass
 
-			file = self._machoCtx.ctxForAddr(classAddr)
-			defOff = self._dyldCtx.convertAddr(classAddr)[0]
-			file.writeBytes(defOff, classDef)
-			pass
+			# zero out cache and vtable
+			classDef.method_cache = 0
+			classDef.vtable = 0
 
-		else:
-			newClassAddr = self._extraDataHead
-			self._addExtraData(classDef)
-			pass
+			if classDef.data:
+				# Low bit marks Swift classes
+				isStubClass = not self._machoCtx.containsAddr(classAddr)
+				classDef.data = self._addClassData(
+					classDef.data & ~0x3,
+					isStubClass=isStubClass
+				)
+				pass
 
-		# add any future pointers if necessary
-		if needsFutureIsa:
-			futureClass = (
-				newClassAddr + objc_class_t.isa.offset,
-				classDef.isa
-			)
-			self._futureClasses.append(futureClass)
+			self._writeData(classAddr, newClassAddr, classDef)
 			pass
-		if needsFutureSuper:
-			futureClass = (
-				newClassAddr + objc_class_t.superclass.offset,
-				classDef.superclass
-			)
-			self._futureClasses.append(futureClass)
-			pass
-
-		self._classesProcessing.remove(classAddr)
-		self._classCache[classAddr] = newClassAddr
-		return newClassAddr, False
+		pass
 
-	def _processClassData(self, classDataAddr: int, isStubClass=False) -> int:
+	def _addClassData(self, classDataAddr: int, isStubClass=False) -> int:
 		if classDataAddr in self._classDataCache:
 			return self._classDataCache[classDataAddr]
 
-		classDataDef = self._slider.slideStruct(classDataAddr, objc_class_data_t)
+		newClassDataAddr = self._reserveData(
+			classDataAddr,
+			ctypes.sizeof(objc_class_data_t)
+		)
+		self._enqueue(
+			self._processClassDatas,
+			(classDataAddr, newClassDataAddr, isStubClass)
+		)
 
-		if classDataDef.ivarLayout:
-			classDataDef.ivarLayout = self._processInt(classDataDef.ivarLayout, 1)
-			pass
+		self._classDataCache[classDataAddr] = newClassDataAddr
+		return newClassDataAddr
 
-		if classDataDef.name:
-			classDataDef.name = self._processString(classDataDef.name)
-			pass
+	def _processClassDatas(self, nodes: List[Tuple[int, int, bool]]) -> None:
+		classDataDefs = self._slider.slideStructs(
+			[classDataAddr for classDataAddr, _, _ in nodes],
+			objc_class_data_t
+		)
 
-		if classDataDef.baseMethods & 0x1:
-			classDataDef.baseMethods = self._findInImageRelList(classDataDef.baseMethods & ~0x1)
-		if classDataDef.baseMethods:
-			classDataDef.baseMethods = self._processMethodList(
-				classDataDef.baseMethods,
-				noImp=isStubClass
-			)
-			pass
-		
+		for node, classDataDef in zip(nodes, classDataDefs):
+			classDataAddr, newClassDataAddr, isStubClass = node
 
-		if classDataDef.baseProtocols & 0x1:
-			classDataDef.baseProtocols = self._findInImageRelList(classDataDef.baseProtocols & ~0x1)
-		if classDataDef.baseProtocols:
-			classDataDef.baseProtocols = self._processProtocolList(classDataDef.baseProtocols)
-			pass
+			if classDataDef.ivarLayout:
+				classDataDef.ivarLayout = self._processInt(classDataDef.ivarLayout, 1)
+				pass
 
-		if classDataDef.ivars:
-			classDataDef.ivars = self._processIvarList(classDataDef.ivars)
-			pass
+			if classDataDef.name:
+				classDataDef.name = self._processString(classDataDef.name)
+				pass
 
-		if classDataDef.weakIvarLayout:
-			classDataDef.weakIvarLayout = self._processInt(
-				classDataDef.weakIvarLayout,
-				1
-			)
-			pass
+			if classDataDef.baseMethods & 0x1:
+				classDataDef.baseMethods = self._findInImageRelList(classDataDef.baseMethods & ~0x1)
+			if classDataDef.baseMethods:
+				classDataDef.baseMethods = self._addMethodList(
+					classDataDef.baseMethods,
+					noImp=isStubClass
+				)
+				pass
 
-		if classDataDef.baseProperties & 0x1:
-			classDataDef.baseProperties = self._findInImageRelList(classDataDef.baseProperties & ~0x1)
-		if classDataDef.baseProperties:
-			classDataDef.baseProperties = self._processPropertyList(classDataDef.baseProperties)
-			pass
+			if classDataDef.baseProtocols & 0x1:
+				classDataDef.baseProtocols = self._findInImageRelList(classDataDef.baseProtocols & ~0x1)
+			if classDataDef.baseProtocols:
+				classDataDef.baseProtocols = self._addProtocolList(classDataDef.baseProtocols)
+				pass
 
-		# add or update data
-		if self._machoCtx.containsAddr(classDataAddr):
-			newClassDataAddr = classDataAddr
+			if classDataDef.ivars:
+				classDataDef.ivars = self._addIvarList(classDataDef.ivars)
+				pass
 
-			file = self._machoCtx.ctxForAddr(classDataAddr)
-			defOff = self._dyldCtx.convertAddr(classDataAddr)[0]
-			file.writeBytes(defOff, classDataDef)
-			pass
+			if classDataDef.weakIvarLayout:
+				classDataDef.weakIvarLayout = self._processInt(
+					classDataDef.weakIvarLayout,
+					1
+				)
+				pass
 
-		else:
-			newClassDataAddr = self._extraDataHead
-			self._addExtraData(classDataDef)
-			pass
+			if classDataDef.baseProperties & 0x1:
+				classDataDef.baseProperties = self._findInImageRelList(classDataDef.baseProperties & ~0x1)
+			if classDataDef.baseProperties:
+				classDataDef.baseProperties = self._addPropertyList(classDataDef.baseProperties)
+				pass
 
-		self._classDataCache[classDataAddr] = newClassDataAddr
-		return newClassDataAddr
+			self._writeData(classDataAddr, newClassDataAddr, classDataDef)
+			pass
+		pass
 
-	def _processIvarList(self, ivarListAddr: int) -> int:
+	def _addIvarList(self, ivarListAddr: int) -> int:
 		if ivarListAddr in self._ivarListCache:
 			return self._ivarListCache[ivarListAddr]
 
 		ivarListDef = self._slider.slideStruct(ivarListAddr, objc_ivar_list_t)
-		ivarListData = bytearray(ivarListDef)
 
 		# check size
 		if ivarListDef.entsize != objc_ivar_t.SIZE:
-			self._logger.error(f"Ivar list at {hex(ivarListAddr)}, has an entsize that doesn't match objc_ivar_t")  # noqa
+			self._logger.error("Ivar list at %#x, has an entsize that doesn't match objc_ivar_t", ivarListAddr)  # noqa
 			return 0
 
-		for i in range(ivarListDef.count):
-			ivarAddr = (
-				ivarListAddr
-				+ objc_ivar_list_t.SIZE
-				+ (i * ivarListDef.entsize)
-			)
+		newIvarListAddr = self._reserveData(
+			ivarListAddr,
+			objc_ivar_list_t.SIZE + (ivarListDef.count * ivarListDef.entsize)
+		)
+		self._enqueue(
+			self._processIvarLists,
+			(ivarListAddr, newIvarListAddr, ivarListDef)
+		)
 
-			ivarDef = self._slider.slideStruct(ivarAddr, objc_ivar_t)
+		self._ivarListCache[ivarListAddr] = newIvarListAddr
+		return newIvarListAddr
 
-			if ivarDef.offset:
-				ivarDef.offset = self._processInt(ivarDef.offset, 4)
-				pass
+	def _processIvarLists(
+		self,
+		nodes: List[Tuple[int, int, objc_ivar_list_t]]
+	) -> None:
+		ivarAddrs = [
+			ivarListAddr + objc_ivar_list_t.SIZE + (i * ivarListDef.entsize)
+			for ivarListAddr, _, ivarListDef in nodes
+			for i in range(ivarListDef.count)
+		]
+		ivarDefs = iter(self._slider.slideStructs(ivarAddrs, objc_ivar_t))
 
-			if ivarDef.name:
-				ivarDef.name = self._processString(ivarDef.name)
-				pass
+		for ivarListAddr, newIvarListAddr, ivarListDef in nodes:
+			ivarListData = bytearray(ivarListDef)
 
-			if ivarDef.type:
-				ivarDef.type = self._processString(ivarDef.type)
-				pass
+			for _ in range(ivarListDef.count):
+				ivarDef = next(ivarDefs)
 
-			ivarListData.extend(ivarDef)
-			pass
+				if ivarDef.offset:
+					ivarDef.offset = self._processInt(ivarDef.offset, 4)
+					pass
 
-		# add or update data
-		if self._machoCtx.containsAddr(ivarListAddr):
-			newIvarListAddr = ivarListAddr
+				if ivarDef.name:
+					ivarDef.name = self._processString(ivarDef.name)
+					pass
 
-			file = self._machoCtx.ctxForAddr(ivarListAddr)
-			defOff = self._dyldCtx.convertAddr(ivarListAddr)[0]
-			file.writeBytes(defOff, ivarListData)
-			pass
-		else:
-			newIvarListAddr = self._extraDataHead
-			self._addExtraData(ivarListData)
-			pass
+				if ivarDef.type:
+					ivarDef.type = self._processString(ivarDef.type)
+					pass
 
-		self._ivarListCache[ivarListAddr] = newIvarListAddr
-		return newIvarListAddr
+				ivarListData.extend(ivarDef)
+				pass
+
+			self._writeData(ivarListAddr, newIvarListAddr, ivarListData)
+			pass
+		pass
 
-	def _processProtocolList(self, protoListAddr: int) -> int:
+	def _addProtocolList(self, protoListAddr: int) -> int:
 		if protoListAddr in self._protocolListCache:
 			return self._protocolListCache[protoListAddr]
 
 		protoListDef = self._slider.slideStruct(protoListAddr, objc_protocol_list_t)
-		protoListData = bytearray(protoListDef)
 
-		for i in range(protoListDef.count):
-			protoAddr = self._slider.slideAddress(
-				protoListAddr
-				+ objc_protocol_list_t.SIZE
-				+ (i * 8)
-			)
+		newProtoListAddr = self._reserveData(
+			protoListAddr,
+			objc_protocol_list_t.SIZE + (protoListDef.count * 8)
+		)
+		self._enqueue(
+			self._processProtocolLists,
+			(protoListAddr, newProtoListAddr, protoListDef)
+		)
 
-			newProtoAddr = self._processProtocol(protoAddr)
-			protoListData.extend(struct.pack("<Q", newProtoAddr))
-			pass
+		self._protocolListCache[protoListAddr] = newProtoListAddr
+		return newProtoListAddr
 
-		# Add or update data
-		if self._machoCtx.containsAddr(protoListAddr):
-			newProtoListAddr = protoListAddr
+	def _processProtocolLists(
+		self,
+		nodes: List[Tuple[int, int, objc_protocol_list_t]]
+	) -> None:
+		protoPtrAddrs = np.concatenate([
+			np.arange(protoListDef.count, dtype=np.uint64) * 8
+			+ np.uint64(protoListAddr + objc_protocol_list_t.SIZE)
+			for protoListAddr, _, protoListDef in nodes
+		])
+		protoAddrs = iter(self._slider.slideAddresses(protoPtrAddrs).tolist())
+
+		for protoListAddr, newProtoListAddr, protoListDef in nodes:
+			protoListData = bytearray(protoListDef)
+
+			for _ in range(protoListDef.count):
+				newProtoAddr = self._addProtocol(next(protoAddrs))
+				protoListData.extend(struct.pack("<Q", newProtoAddr))
+				pass
 
-			file = self._machoCtx.ctxForAddr(protoListAddr)
-			defOff = self._dyldCtx.convertAddr(protoListAddr)[0]
-			file.writeBytes(defOff, protoListData)
-			pass
-		else:
-			newProtoListAddr = self._extraDataHead
-			self._addExtraData(protoListData)
+			self._writeData(protoListAddr, newProtoListAddr, protoListData)
 			pass
+		pass
 
-		self._protocolListCache[protoListAddr] = newProtoListAddr
-		return newProtoListAddr
-
-	def _processProtocol(self, protoAddr: int) -> int:
+	def _addProtocol(self, protoAddr: int) -> int:
 		if protoAddr in self._protocolCache:
 			return self._protocolCache[protoAddr]
 
-		protoDef = self._slider.slideStruct(protoAddr, objc_protocol_t)
+		protoOff, context = self._dyldCtx.convertAddr(protoAddr)
+		protoSize = context.readFormat(
+			"<I",
+			protoOff + objc_protocol_t.size.offset
+		)[0]
 
-		# protocol isa's should be 0
-		protoDef.isa = 0
+		newProtoAddr = self._reserveData(
+			protoAddr,
+			min(protoSize, ctypes.sizeof(objc_protocol_t))
+		)
+		self._enqueue(self._processProtocols, (protoAddr, newProtoAddr))
 
-		if protoDef.name:
-			protoDef.name = self._processString(protoDef.name)
-			pass
+		self._protocolCache[protoAddr] = newProtoAddr
+		return newProtoAddr
 
-		if protoDef.protocols:
-			protoDef.protocols = self._processProtocolList(protoDef.protocols)
-			pass
+	def _processProtocols(self, nodes: List[Tuple[int, int]]) -> None:
+		protoDefs = self._slider.slideStructs(
+			[protoAddr for protoAddr, _ in nodes],
+			objc_protocol_t
+		)
 
-		if protoDef.instanceMethods:
-			protoDef.instanceMethods = self._processMethodList(
-				protoDef.instanceMethods,
-				noImp=True
-			)
-			pass
+		for (protoAddr, newProtoAddr), protoDef in zip(nodes, protoDefs):
+			# protocol isa's should be 0
+			protoDef.isa = 0
 
-		if protoDef.classMethods:
-			protoDef.classMethods = self._processMethodList(
-				protoDef.classMethods,
-				noImp=True
-			)
-			pass
+			if protoDef.name:
+				protoDef.name = self._processString(protoDef.name)
+				pass
 
-		if protoDef.optionalInstanceMethods:
-			protoDef.optionalInstanceMethods = self._processMethodList(
-				protoDef.optionalInstanceMethods,
-				noImp=True
-			)
-			pass
+			if protoDef.protocols:
+				protoDef.protocols = self._addProtocolList(protoDef.protocols)
+				pass
 
-		if protoDef.optionalClassMethods:
-			protoDef.optionalClassMethods = self._processMethodList(
-				protoDef.optionalClassMethods,
-				noImp=True
-			)
-			pass
+			if protoDef.instanceMethods:
+				protoDef.instanceMethods = self._addMethodList(
+					protoDef.instanceMethods,
+					noImp=True
+				)
+				pass
 
-		if protoDef.instanceProperties:
-			protoDef.instanceProperties = self._processPropertyList(
-				protoDef.instanceProperties
-			)
-			pass
+			if protoDef.classMethods:
+				protoDef.classMethods = self._addMethodList(
+					protoDef.classMethods,
+					noImp=True
+				)
+				pass
 
-		hasExtendedMethodTypes = protoDef.size < 80
-		if protoDef.extendedMethodTypes and hasExtendedMethodTypes:
-			# const char **extendedMethodTypes;
-			oldPtr = self._slider.slideAddress(protoDef.extendedMethodTypes)
-			newPtr = self._processString(oldPtr)
+			if protoDef.optionalInstanceMethods:
+				protoDef.optionalInstanceMethods = self._addMethodList(
+					protoDef.optionalInstanceMethods,
+					noImp=True
+				)
+				pass
 
-			if self._machoCtx.containsAddr(protoDef.extendedMethodTypes):
-				file = self._machoCtx.ctxForAddr(protoDef.extendedMethodTypes)
-				ptrOff = self._dyldCtx.convertAddr(protoDef.extendedMethodTypes)[0]
-				struct.pack_into("<Q", file.file, ptrOff, newPtr)
+			if protoDef.optionalClassMethods:
+				protoDef.optionalClassMethods = self._addMethodList(
+					protoDef.optionalClassMethods,
+					noImp=True
+				)
 				pass
-			else:
-				protoDef.extendedMethodTypes = self._extraDataHead
 
-				ptrData = struct.pack("<Q", newPtr)
-				self._addExtraData(ptrData)
+			if protoDef.instanceProperties:
+				protoDef.instanceProperties = self._addPropertyList(
+					protoDef.instanceProperties
+				)
 				pass
-			pass
 
-		hasDemangledName = protoDef.size < 88
-		if protoDef.demangledName and hasDemangledName:
-			protoDef.demangledName = self._processString(protoDef.demangledName)
-			pass
+			hasExtendedMethodTypes = protoDef.size < 80
+			if protoDef.extendedMethodTypes and hasExtendedMethodTypes:
+				# const char **extendedMethodTypes;
+				oldPtr = self._slider.slideAddress(protoDef.extendedMethodTypes)
+				newPtr = self._processString(oldPtr)
 
-		hasClassProperties = protoDef.size < 96
-		if protoDef.classProperties and hasClassProperties:
-			protoDef.classProperties = self._processPropertyList(
-				protoDef.classProperties
-			)
-			pass
+				if self._machoCtx.containsAddr(protoDef.extendedMethodTypes):
+					file = self._machoCtx.ctxForAddr(protoDef.extendedMethodTypes)
+					ptrOff = self._dyldCtx.convertAddr(protoDef.extendedMethodTypes)[0]
+					struct.pack_into("<Q", file.file, ptrOff, newPtr)
+					pass
+				else:
+					protoDef.extendedMethodTypes = self._extraDataHead
 
-		# Add or update data
-		protoData = bytes(protoDef)[:protoDef.size]
-		if self._machoCtx.containsAddr(protoAddr):
-			newProtoAddr = protoAddr
+					ptrData = struct.pack("<Q", newPtr)
+					self._addExtraData(ptrData)
+					pass
+				pass
 
-			file = self._machoCtx.ctxForAddr(protoAddr)
-			defOff = self._dyldCtx.convertAddr(protoAddr)[0]
-			file.writeBytes(defOff, protoData)
-			pass
-		else:
-			newProtoAddr = self._extraDataHead
-			self._addExtraData(protoData)
-			pass
+			hasDemangledName = protoDef.size < 88
+			if protoDef.demangledName and hasDemangledName:
+				protoDef.demangledName = self._processString(protoDef.demangledName)
+				pass
 
-		self._protocolCache[protoAddr] = newProtoAddr
-		return newProtoAddr
+			hasClassProperties = protoDef.size < 96
+			if protoDef.classProperties and hasClassProperties:
+				protoDef.classProperties = self._addPropertyList(
+					protoDef.classProperties
+				)
+				pass
+
+			protoData = bytes(protoDef)[:protoDef.size]
+			self._writeData(protoAddr, newProtoAddr, protoData)
+			pass
+		pass
 
-	def _processPropertyList(self, propertyListAddr: int) -> int:
+	def _addPropertyList(self, propertyListAddr: int) -> int:
 		if propertyListAddr in self._propertyListCache:
 			return self._propertyListCache[propertyListAddr]
 
@@ -1176,47 +1725,59 @@ class _ObjCFixer(object):
 
 		# check size
 		if propertyListDef.entsize != objc_property_t.SIZE:
-			self._logger.error(f"Property list at {hex(propertyListAddr)} has an entsize that doesn't match objc_property_t")  # noqa
+			self._logger.error("Property list at %#x has an entsize that doesn't match objc_property_t", propertyListAddr)  # noqa
 			return 0
 
-		propertyListData = bytearray(propertyListDef)
-		for i in range(propertyListDef.count):
-			propertyAddr = (
-				propertyListAddr
-				+ propertyListDef.SIZE
-				+ (i * propertyListDef.entsize)
-			)
+		newPropertyListAddr = self._reserveData(
+			propertyListAddr,
+			objc_property_list_t.SIZE
+			+ (propertyListDef.count * propertyListDef.entsize)
+		)
+		self._enqueue(
+			self._processPropertyLists,
+			(propertyListAddr, newPropertyListAddr, propertyListDef)
+		)
 
-			propertyDef = self._slider.slideStruct(propertyAddr, objc_property_t)
+		self._propertyListCache[propertyListAddr] = newPropertyListAddr
+		return newPropertyListAddr
 
-			if propertyDef.name:
-				propertyDef.name = self._processString(propertyDef.name)
-				pass
+	def _processPropertyLists(
+		self,
+		nodes: List[Tuple[int, int, objc_property_list_t]]
+	) -> None:
+		propertyAddrs = [
+			propertyListAddr
+			+ objc_property_list_t.SIZE
+			+ (i * propertyListDef.entsize)
+			for propertyListAddr, _, propertyListDef in nodes
+			for i in range(propertyListDef.count)
+		]
+		propertyDefs = iter(
+			self._slider.slideStructs(propertyAddrs, objc_property_t)
+		)
 
-			if propertyDef.attributes:
-				propertyDef.attributes = self._processString(propertyDef.attributes)
-				pass
+		for propertyListAddr, newPropertyListAddr, propertyListDef in nodes:
+			propertyListData = bytearray(propertyListDef)
 
-			propertyListData.extend(propertyDef)
-			pass
+			for _ in range(propertyListDef.count):
+				propertyDef = next(propertyDefs)
 
-		# Add or update data
-		if self._machoCtx.containsAddr(propertyListAddr):
-			newPropertyListAddr = propertyListAddr
+				if propertyDef.name:
+					propertyDef.name = self._processString(propertyDef.name)
+					pass
 
-			file = self._machoCtx.ctxForAddr(propertyListAddr)
-			defOff = self._dyldCtx.convertAddr(propertyListAddr)[0]
-			file.writeBytes(defOff, propertyListData)
-			pass
-		else:
-			newPropertyListAddr = self._extraDataHead
-			self._addExtraData(propertyListData)
-			pass
+				if propertyDef.attributes:
+					propertyDef.attributes = self._processString(propertyDef.attributes)
+					pass
 
-		self._propertyListCache[propertyListAddr] = newPropertyListAddr
-		return newPropertyListAddr
+				propertyListData.extend(propertyDef)
+				pass
+
+			self._writeData(propertyListAddr, newPropertyListAddr, propertyListData)
+			pass
+		pass
 
-	def _processMethodList(self, methodListAddr: int, noImp=False) -> int:
+	def _addMethodList(self, methodListAddr: int, noImp=False) -> int:
 		if methodListAddr in self._methodListCache:
 			return self._methodListCache[methodListAddr]
 
@@ -1236,100 +1797,157 @@ class _ObjCFixer(object):
 		# check if size is correct
 		if methodListDef.count != 0:
 			if usesRelativeMethods and entsize != objc_method_small_t.SIZE:
-				self._logger.error(f"Small method list at {hex(methodListAddr)}, has an entsize that doesn't match the size of objc_method_small_t")  # noqa
+				self._logger.error("Small method list at %#x, has an entsize that doesn't match the size of objc_method_small_t", methodListAddr)  # noqa
 				return 0
 			elif not usesRelativeMethods and entsize != objc_method_large_t.SIZE:
-				self._logger.error(f"Large method list at {hex(methodListAddr)}, has an entsize that doesn't match the size of objc_method_large_t")  # noqa
+				self._logger.error("Large method list at %#x, has an entsize that doesn't match the size of objc_method_large_t", methodListAddr)  # noqa
 				return 0
 
-		methodListData = bytearray(methodListDef)
+		newMethodListAddr = self._reserveData(
+			methodListAddr,
+			objc_method_list_t.SIZE + (methodListDef.count * entsize)
+		)
+		self._enqueue(
+			self._processMethodLists,
+			(methodListAddr, newMethodListAddr, methodListDef, noImp)
+		)
 
-		# fix relative pointers after we reserve a new address for the method list
-		# contains a list of tuples of field offsets and their target addresses
-		relativeFixups: List[Tuple[int, int]] = []
-		for i in range(methodListDef.count):
-			methodAddr = (
-				methodListAddr
-				+ objc_method_list_t.SIZE
-				+ (i * entsize)
-			)
+		self._methodListCache[methodListAddr] = newMethodListAddr
+		return newMethodListAddr
 
-			if usesRelativeMethods:
-				methodDef = self._slider.slideStruct(methodAddr, objc_method_small_t)
-				methodOff = objc_method_list_t.SIZE + (i * entsize)
+	def _processMethodLists(
+		self,
+		nodes: List[Tuple[int, int, objc_method_list_t, bool]]
+	) -> None:
+		for methodListAddr, newMethodListAddr, methodListDef, noImp in nodes:
+			if methodListDef.usesRelativeMethods():
+				methods = self._processSmallMethods(
+					methodListAddr,
+					newMethodListAddr,
+					methodListDef.count
+				)
+				pass
+			else:
+				methods = self._processLargeMethods(methodListAddr, methodListDef.count)
+				pass
 
-				if methodDef.name:
-					if self._usesObjcRoRelativeNames:
-						baseAddr = self._optMethodNamesAddr
-						pass
-					else:
-						baseAddr = methodAddr
-						pass
+			if noImp:
+				methods["imp"] = 0
+				pass
 
-					nameAddr = baseAddr + methodDef.name
-					newNamePtr = self._processMethodName(nameAddr)
+			methodListData = bytes(methodListDef) + methods.tobytes()
+			self._writeData(methodListAddr, newMethodListAddr, methodListData)
+			pass
+		pass
 
-					# make the name ptr relative to itself
-					methodDef.name = newNamePtr - methodAddr
-					relativeFixups.append((methodOff, newNamePtr))
-					pass
+	def _processSmallMethods(
+		self,
+		methodListAddr: int,
+		newMethodListAddr: int,
+		count: int
+	) -> np.ndarray:
+		"""Process the entries of a relative method list.
 
-				if methodDef.types:
-					typesAddr = methodAddr + 4 + methodDef.types
-					newTypesAddr = self._processString(typesAddr)
-					methodDef.types = newTypesAddr - (methodAddr + 4)
+		Args:
+			methodListAddr: The original address of the method list.
+			newMethodListAddr: The new address of the method list.
+			count: The number of methods.
 
-					relativeFixups.append((methodOff + 4, newTypesAddr))
-					pass
+		Returns:
+			The processed methods as an array of _SMALL_METHOD_DTYPE.
+		"""
 
-				if noImp:
-					methodDef.imp = 0
-					pass
+		if not count:
+			return np.zeros(0, dtype=_SMALL_METHOD_DTYPE)
 
-				methodListData.extend(methodDef)
-				pass
+		methodsOff, context = self._dyldCtx.convertAddr(
+			methodListAddr + objc_method_list_t.SIZE
+		)
+		methods = np.frombuffer(
+			context.getBytes(methodsOff, count * objc_method_small_t.SIZE),
+			dtype=_SMALL_METHOD_DTYPE
+		).copy()
+
+		methodOffs = (
+			objc_method_list_t.SIZE
+			+ np.arange(count, dtype=np.int64) * objc_method_small_t.SIZE
+		)
+		methodAddrs = methodListAddr + methodOffs
 
-			else:
-				methodDef = self._slider.slideStruct(methodAddr, objc_method_large_t)
+		# relative offsets are from the method's new address
+		newMethodAddrs = newMethodListAddr + methodOffs
 
-				if methodDef.name:
-					methodDef.name = self._processString(methodDef.name)
-					pass
+		names = methods["name"].astype(np.int64)
+		hasName = names != 0
+		if self._usesObjcRoRelativeNames:
+			nameAddrs = self._optMethodNamesAddr + names[hasName]
+			pass
+		else:
+			nameAddrs = methodAddrs[hasName] + names[hasName]
+			pass
 
-				if methodDef.types:
-					methodDef.types = self._processString(methodDef.types)
-					pass
+		# make the name ptr relative to itself
+		newNamePtrs = self._mapUnique(nameAddrs, self._processMethodName)
+		methods["name"][hasName] = newNamePtrs - newMethodAddrs[hasName]
 
-				if noImp:
-					methodDef.imp = 0
-					pass
+		types = methods["types"].astype(np.int64)
+		hasTypes = types != 0
+		typesAddrs = methodAddrs[hasTypes] + 4 + types[hasTypes]
 
-				methodListData.extend(methodDef)
-				pass
-			pass
+		newTypesAddrs = self._mapUnique(typesAddrs, self._processString)
+		methods["types"][hasTypes] = newTypesAddrs - (newMethodAddrs[hasTypes] + 4)
+		return methods
 
-		# add or update data
-		if self._machoCtx.containsAddr(methodListAddr):
-			newMethodListAddr = methodListAddr
+	def _processLargeMethods(self, methodListAddr: int, count: int) -> np.ndarray:
+		"""Process the entries of a method list with pointers.
 
-			file = self._machoCtx.ctxForAddr(methodListAddr)
-			defOff = self._dyldCtx.convertAddr(methodListAddr)[0]
-			file.writeBytes(defOff, methodListData)
-			pass
-		else:
-			newMethodListAddr = self._extraDataHead
+		Args:
+			methodListAddr: The original address of the method list.
+			count: The number of methods.
 
-			# fix relative offsets now that we changed the address
-			for fieldOff, fieldTarget in relativeFixups:
-				newValue = fieldTarget - (newMethodListAddr + fieldOff)
-				struct.pack_into("<i", methodListData, fieldOff, newValue)
-				pass
+		Returns:
+			The processed methods as an array of _LARGE_METHOD_DTYPE.
+		"""
+
+		# all the fields are pointers, slide them all at once
+		methods = self._slider.slideRange(
+			methodListAddr + objc_method_list_t.SIZE,
+			count * 3
+		).view(_LARGE_METHOD_DTYPE)
 
-			self._addExtraData(methodListData)
+		for field in ("name", "types"):
+			fieldAddrs = methods[field]
+			hasField = fieldAddrs != 0
+
+			fieldAddrs[hasField] = self._mapUnique(
+				fieldAddrs[hasField],
+				self._processString
+			)
 			pass
 
-		self._methodListCache[methodListAddr] = newMethodListAddr
-		return newMethodListAddr
+		return methods
+
+	def _mapUnique(
+		self,
+		addrs: np.ndarray,
+		processor: Callable[[int], int]
+	) -> np.ndarray:
+		"""Process each unique address once.
+
+		Args:
+			addrs: The addresses to process.
+			processor: Processes an address and returns its new address.
+
+		Returns:
+			The new addresses, in the same order as addrs.
+		"""
+
+		uniqueAddrs, inverse = np.unique(addrs, return_inverse=True)
+		newAddrs = np.array(
+			[processor(addr) for addr in uniqueAddrs.tolist()],
+			dtype=np.int64
+		)
+		return newAddrs[inverse.ravel()]
 
 	def _processString(self, stringAddr: int) -> int:
 		if stringAddr in self._stringCache:
@@ -1406,7 +2024,7 @@ class _ObjCFixer(object):
 
 		# Check entsize
 		if relListList.entsize != relative_list_t.SIZE:
-			self._logger.error(f"relative_list_list_t at {hex(relListListAddr)} has an entsize that doesn't match relative_list_t")  # noqa
+			self._logger.error("relative_list_list_t at %#x has an entsize that doesn't match relative_list_t", relListListAddr)  # noqa
 			return 0
 		
 		for i in range(relListList.count):
@@ -1424,80 +2042,6 @@ class _ObjCFixer(object):
 			
 		return 0
 	
-	def _getImageIndex(self) -> int:
-		"""Get the ObjC specific image index.
-		
-		Returns:
-			The image index or -1 if not found.
-		"""
-
-		# Read headeropt offset
-		objcOptAddr = None
-		for seg in self._libobjcImage.segments.values():
-			if b"__objc_opt_ro" in seg.sects:
-				objcOptAddr = seg.sects[b"__objc_opt_ro"].addr
-				break
-		if objcOptAddr is None:
-			self._logger.error("Unable to find __objc_opt_ro section")
-			return -1
-		
-		# Get header opt offset
-		objcOptOff, objcOptFile = self._dyldCtx.convertAddr(objcOptAddr)
-		objcOptVer = objcOptFile.readFormat("<I", objcOptOff)[0]
-
-		if objcOptVer in (12, 13):
-			headerOptOff = objc_opt_t_V12(objcOptFile.file, objcOptOff).headeropt_offset
-		elif objcOptVer in (15, 16):
-			headerOptOff = objc_opt_t_V15a(objcOptFile.file, objcOptOff).headeropt_ro_offset
-		else:
-			self._logger.error(f"Unknown objc_opt_t version: {objcOptVer}")
-			return -1
-		if headerOptOff == 0:
-			self._logger.error("libobjc does not have objc_headeropt_ro_t")
-			return -1
-		headerOptAddr = objcOptAddr + headerOptOff
-
-		# Find image index
-		imageAddr = self._machoCtx.segments[b"__TEXT"].seg.vmaddr
-		headerOptDataOff, headerOptFile = self._dyldCtx.convertAddr(headerOptAddr)
-		headerOpt = objc_headeropt_ro_t(headerOptFile.file, headerOptDataOff)
-		
-		for i in range(headerOpt.count):
-			infoOff = objc_headeropt_ro_t.SIZE + (i * headerOpt.entsize)
-			infoAddr = headerOptAddr + infoOff
-			infoDataOff = headerOptDataOff + infoOff
-			info = objc_header_info_ro_t_64(headerOptFile.file, infoDataOff)
-
-			if info.mhdr_offset + infoAddr == imageAddr:
-				return i
-			
-		return -1
-
-
-	def _finalizeFutureClasses(self) -> None:
-		extraSegStart = self._extraDataHead - len(self._extraData)
-
-		while len(self._futureClasses):
-			futureClass = self._futureClasses.pop()
-
-			newAddr, needsFuture = self._processClass(futureClass[1])
-			if needsFuture:
-				self._logger.error(f"Unable to resolve class pointer at {hex(futureClass[0])}")  # noqa
-				continue
-
-			destPtr = futureClass[0]
-			if destPtr >= extraSegStart and destPtr < self._extraDataHead:
-				ptrOffset = destPtr - extraSegStart
-				struct.pack_into("<Q", self._extraData, ptrOffset, newAddr)
-				pass
-			else:
-				file = self._machoCtx.ctxForAddr(destPtr)
-				ptrOffset = self._dyldCtx.convertAddr(destPtr)[0]
-				struct.pack_into("Q", file.file, ptrOffset, newAddr)
-				pass
-			pass
-		pass
-
 	def _checkSpaceConstraints(self) -> None:
 		"""Check if we have enough space to add the new segment.
 		"""
@@ -1617,6 +2161,6 @@ def fixObjC(extractionCtx: ExtractionContext) -> None:
 		_ObjCFixer(extractionCtx).run()
 		pass
 	except _ObjCFixerError as e:
-		extractionCtx.logger.error(f"Unable to fix ObjC, reason: {e}")
+		extractionCtx.logger.error("Unable to fix ObjC, reason: %s", e)
 		pass
 	pass
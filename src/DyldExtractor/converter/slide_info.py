@@ -1,4 +1,5 @@
 import struct
+import numpy as np
 from dataclasses import dataclass
 from typing import (
 	Type,
@@ -8,6 +9,7 @@ from typing import (
 	List
 )
 
+from DyldExtractor.cache_context import CacheContext
 from DyldExtractor.extraction_context import ExtractionContext
 from DyldExtractor.macho.macho_context import MachOContext
 from DyldExtractor.dyld.dyld_context import DyldContext
@@ -115,7 +117,7 @@ class _V2Rebaser(object):
 				pass
 			elif page & DYLD_CACHE_SLIDE_PAGE_ATTR_EXTRA:
 				pageAddr = (i * pageSize) + self.mapping.address
-				self.logger.warning(f"Unable to handle page extras at {hex(pageAddr)}")
+				self.logger.warning("Unable to handle page extras at %#x", pageAddr)
 			elif (page & DYLD_CACHE_SLIDE_PAGE_ATTR_EXTRA) == 0:
 				pageOff = (i * pageSize) + self.mapping.fileOffset
 
@@ -424,6 +426,68 @@ def _getMappingInfo(
 	return mappingInfo
 
 
+def _readPointers(context: CacheContext, offsets: np.ndarray) -> np.ndarray:
+	"""Read the raw 64bit pointers at the file offsets.
+
+	Args:
+		context: The file to read from.
+		offsets: A uint64 array of file offsets.
+
+	Returns:
+		A uint64 array of the raw pointers.
+	"""
+
+	if not len(offsets):
+		return np.zeros(0, dtype=np.uint64)
+
+	if not np.any(offsets & 7):
+		view = np.frombuffer(context.file, dtype="<u8", count=len(context.file) // 8)
+		return view[offsets >> 3].astype(np.uint64)
+
+	# unaligned pointers, gather them byte by byte
+	view = np.frombuffer(context.file, dtype=np.uint8)
+	byteIndices = offsets[:, None] + np.arange(8, dtype=np.uint64)
+	return view[byteIndices].view("<u8").reshape(-1).astype(np.uint64)
+
+
+def _decodePointers(
+	slideInfo: Union[dyld_cache_slide_info2, dyld_cache_slide_info3, dyld_cache_slide_info5],
+	rawValues: np.ndarray
+) -> np.ndarray:
+	"""Decode an array of raw pointers.
+
+	Performs the same decoding as PointerSlider.slideAddress.
+
+	Returns:
+		A uint64 array of the slid pointers, or None if the slide
+		info version is unknown.
+	"""
+
+	# regular arm64 pointer
+	if slideInfo.version == 2:
+		return rawValues & 0xfffffffff
+
+	# arm64e pointer
+	elif slideInfo.version == 3:
+		authenticated = (rawValues >> 63).astype(bool)
+		authValues = (rawValues & 0xFFFFFFFF) + np.uint64(slideInfo.auth_value_add)
+
+		value51 = rawValues & 0x0007FFFFFFFFFFFF
+		top8Bits = value51 & 0x0007F80000000000
+		bottom43Bits = value51 & 0x000007FFFFFFFFFF
+		plainValues = (top8Bits << 13) | bottom43Bits
+		return np.where(authenticated, authValues, plainValues)
+
+	# arm64e pointer (iOS 18+, macOS 14.4+)
+	elif slideInfo.version == 5:
+		# the runtime offset is the low 34 bits for both pointer kinds
+		values = (rawValues & 0x3FFFFFFFF) + np.uint64(slideInfo.value_add)
+		values[values == 0x180000000] = 0
+		return values
+
+	return None
+
+
 _T = TypeVar("_T", bound=Structure)
 
 
@@ -445,6 +509,25 @@ class PointerSlider(object):
 
 		self._dyldCtx = extractionCtx.dyldCtx
 		self._mappingInfo = _getMappingInfo(extractionCtx)
+		self.logger = extractionCtx.logger
+
+		# The addresses of mappings with an unknown slide version that
+		# were already reported.
+		self._reportedMappings = set()
+
+	def _reportUnknownVersion(self, info: _MappingInfo) -> None:
+		"""Log an unknown slide version, once for each mapping.
+		"""
+
+		if info.mapping.address in self._reportedMappings:
+			return
+
+		self._reportedMappings.add(info.mapping.address)
+		self.logger.error(
+			"Unknown slide version %d for the mapping at %#x.",
+			info.slideInfo.version,
+			info.mapping.address
+		)
 
 	def slideAddress(self, address: int) -> int:
 		"""Slide and return the pointer at the address.
@@ -499,11 +582,85 @@ class PointerSlider(object):
 					return value
 
 				else:
-					print(f"Unknown slide version: {slideInfo.version}.")
+					self._reportUnknownVersion(info)
 					return None
 
 		return None
 
+	def slideAddresses(
+		self,
+		addresses: np.ndarray,
+		withMask: bool = False
+	) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+		"""Slide the pointers at the addresses.
+
+		This is a vectorized version of slideAddress.
+
+		Args:
+			addresses: An array of pointer addresses.
+			withMask: Optional; Also return which pointers could be slid.
+
+		Returns:
+			A uint64 array of the slid pointers, pointers that could not
+			be slid are 0. If withMask is True, a tuple of that array and
+			a boolean array marking the pointers that could be slid.
+		"""
+
+		addresses = np.asarray(addresses, dtype=np.uint64)
+		values = np.zeros(addresses.shape, dtype=np.uint64)
+		slid = np.zeros(addresses.shape, dtype=bool)
+		handled = np.zeros(addresses.shape, dtype=bool)
+
+		for info in self._mappingInfo:
+			mapping = info.mapping
+			mappingHighBound = mapping.address + mapping.size
+
+			# like slideAddress, only the first containing mapping is used
+			inMapping = (
+				(addresses >= mapping.address)
+				& (addresses < mappingHighBound)
+				& ~handled
+			)
+			if not inMapping.any():
+				continue
+			handled |= inMapping
+
+			offsets = (addresses[inMapping] - mapping.address) + mapping.fileOffset
+			rawValues = _readPointers(info.dyldCtx, offsets)
+
+			newValues = _decodePointers(info.slideInfo, rawValues)
+			if newValues is None:
+				self._reportUnknownVersion(info)
+				continue
+
+			values[inMapping] = newValues
+			slid |= inMapping
+			pass
+
+		if withMask:
+			return values, slid
+		return values
+
+	def slideRange(
+		self,
+		address: int,
+		count: int,
+		withMask: bool = False
+	) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+		"""Slide an array of consecutive pointers.
+
+		Args:
+			address: The address of the first pointer.
+			count: The number of pointers.
+			withMask: Optional; Also return which pointers could be slid.
+
+		Returns:
+			The same as slideAddresses.
+		"""
+
+		addresses = np.arange(count, dtype=np.uint64) * 8 + np.uint64(address)
+		return self.slideAddresses(addresses, withMask=withMask)
+
 	def slideStruct(
 		self,
 		address: int,
@@ -536,6 +693,50 @@ class PointerSlider(object):
 
 		return structData
 
+	def slideStructs(
+		self,
+		addresses: List[int],
+		structDef: Type[_T]
+	) -> List[_T]:
+		"""Read and slide structures at the addresses.
+
+		This is a vectorized version of slideStruct, the pointers
+		of all the structures are slid at once. Pointers that could
+		not be slid are 0.
+
+		Args:
+			addresses: The addresses of the structures.
+			structDef: The structure class to fill.
+
+		Return:
+			The filled and slid structures.
+		"""
+
+		structs = []
+		for address in addresses:
+			structOff, context = self._dyldCtx.convertAddr(address)
+			structs.append(structDef(context.file, structOff))
+			pass
+
+		ptrNames = getattr(structDef, "_pointers_", None)
+		if not ptrNames or not structs:
+			return structs
+
+		fieldOffsets = np.array(
+			[getattr(structDef, ptrName).offset for ptrName in ptrNames],
+			dtype=np.uint64
+		)
+		ptrAddrs = np.asarray(addresses, dtype=np.uint64)[:, None] + fieldOffsets
+		slidPtrs = self.slideAddresses(ptrAddrs.ravel()).reshape(ptrAddrs.shape)
+
+		for structData, structPtrs in zip(structs, slidPtrs.tolist()):
+			for ptrName, slidPtr in zip(ptrNames, structPtrs):
+				setattr(structData, ptrName, slidPtr)
+				pass
+			pass
+
+		return structs
+
 class KCPointerSlider(object):
 	def __init__(self, extractionCtx: ExtractionContext) -> None:
 		"""Provides a way to slide individual pointers in kernelcaches.
@@ -550,6 +751,52 @@ class KCPointerSlider(object):
 		offset, context = offset
 		return context.readFormat("<Q", offset)[0]
 
+	def slideAddresses(
+		self,
+		addresses: np.ndarray,
+		withMask: bool = False
+	) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+		"""Read the pointers at the addresses.
+
+		See PointerSlider.slideAddresses.
+		"""
+
+		addresses = np.asarray(addresses, dtype=np.uint64)
+		values = np.zeros(addresses.shape, dtype=np.uint64)
+		found = np.zeros(addresses.shape, dtype=bool)
+
+		for mapping, context in self._dyldCtx.mappings:
+			inMapping = (
+				(addresses >= mapping.address)
+				& (addresses < mapping.address + mapping.size)
+				& ~found
+			)
+			if not inMapping.any():
+				continue
+
+			offsets = (addresses[inMapping] - mapping.address) + mapping.fileOffset
+			values[inMapping] = _readPointers(context, offsets)
+			found |= inMapping
+			pass
+
+		if withMask:
+			return values, found
+		return values
+
+	def slideRange(
+		self,
+		address: int,
+		count: int,
+		withMask: bool = False
+	) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+		"""Read an array of consecutive pointers.
+
+		See PointerSlider.slideRange.
+		"""
+
+		addresses = np.arange(count, dtype=np.uint64) * 8 + np.uint64(address)
+		return self.slideAddresses(addresses, withMask=withMask)
+
 
 def processSlideInfo(extractionCtx: ExtractionContext) -> None:
 	"""Process and remove rebase info.
@@ -1,13 +1,15 @@
 import dataclasses
 import enum
 import struct
-from typing import Iterator, List, Tuple, Dict
+import numpy as np
+from typing import Iterable, Iterator, List, Tuple, Dict
 
 from DyldExtractor.extraction_context import ExtractionContext
 from DyldExtractor.macho.macho_context import MachOContext
 from DyldExtractor.file_context import FileContext
 from DyldExtractor.converter import slide_info
 from DyldExtractor.dyld import dyld_trie
+from DyldExtractor.kc.kc_symbol_index import KCSymbolIndex
 from DyldExtractor import leb128
 
 from DyldExtractor.macho.macho_constants import *
@@ -19,7 +21,8 @@ from DyldExtractor.macho.macho_structs import (
 	linkedit_data_command,
 	nlist_64,
 	section_64,
-	symtab_command
+	symtab_command,
+	NLIST_64_DTYPE
 )
 
 
@@ -49,6 +52,10 @@ class _Symbolizer(object):
 		# Stores and address and the possible symbols at the address
 		self._symbolCache: Dict[int, List[bytes]] = {}
 
+		# Symbols shared by all images of a kernelcache, these come
+		# before the ones in _symbolCache.
+		self._sharedSymbols: Dict[int, List[bytes]] = {}
+
 		# create a map of image paths and their addresses
 		self._images: Dict[bytes, int] = {}
 		for image in self._dyldCtx.images:
@@ -70,7 +77,11 @@ class _Symbolizer(object):
 			A set of potential name of the function.
 			or None if it could not be found.
 		"""
-		if addr in self._symbolCache:
+		if addr in self._sharedSymbols:
+			if addr in self._symbolCache:
+				return self._sharedSymbols[addr] + self._symbolCache[addr]
+			return self._sharedSymbols[addr]
+		elif addr in self._symbolCache:
 			return self._symbolCache[addr]
 		else:
 			return None
@@ -98,10 +109,11 @@ class _Symbolizer(object):
 		# get an initial list of dependencies
 		# assume every image in a fileset is a dependency:
 		if self._dyldCtx.isFileset():
-			for image in self._dyldCtx.images:
-				machoOffset, context = self._dyldCtx.convertAddr(image.address)
-				context = MachOContext(context.fileObject, machoOffset)
-				self._enumerateSymbols(context)
+			kcSymbols: KCSymbolIndex = self._dyldCtx.getSharedData(
+				KCSymbolIndex.SHARED_DATA_NAME,
+				lambda: KCSymbolIndex.build(self._dyldCtx, self._logger)
+			)
+			self._sharedSymbols = kcSymbols.symbols
 		else:
 			if dylibs := self._machoCtx.getLoadCommand(DEP_LCS, multiple=True):
 				for dylib in dylibs:
@@ -164,7 +176,7 @@ class _Symbolizer(object):
 					break
 
 			if not found:
-				self._logger.warning(f"No root export for ReExport with symbol {name}")
+				self._logger.warning("No root export for ReExport with symbol %s", name)
 		pass
 
 	def _getDepInfo(
@@ -178,14 +190,14 @@ class _Symbolizer(object):
 		dylibPathOff = dylib._fileOff_ + dylib.dylib.name.offset
 		dylibPath = context.readString(dylibPathOff)
 		if dylibPath not in self._images:
-			self._logger.warning(f"Unable to find dependency: {dylibPath}")
+			self._logger.warning("Unable to find dependency: %s", dylibPath)
 			return None
 
 		imageAddr = self._images[dylibPath]
 		imageOff, dyldCtx = self._dyldCtx.convertAddr(imageAddr)
 
 		# Since we're not editing the dependencies, this should be fine.
-		context = MachOContext(dyldCtx.fileObject, imageOff)
+		context = MachOContext(dyldCtx.fileObject, imageOff, lazy=True)
 		return _DependencyInfo(dylibPath, imageAddr, context)
 
 	def _readDepExports(
@@ -195,12 +207,8 @@ class _Symbolizer(object):
 		exportOff = None
 		exportSize = None
 
-		dyldInfo: dyld_info_command = depInfo.context.getLoadCommand(
-			(LoadCommands.LC_DYLD_INFO, LoadCommands.LC_DYLD_INFO_ONLY)
-		)
-		exportTrie: linkedit_data_command = depInfo.context.getLoadCommand(
-			(LoadCommands.LC_DYLD_EXPORTS_TRIE,)
-		)
+		dyldInfo: dyld_info_command = depInfo.context.getDyldInfo()
+		exportTrie: linkedit_data_command = depInfo.context.getExportsTrie()
 
 		if dyldInfo and dyldInfo.export_size:
 			exportOff = dyldInfo.export_off
@@ -225,7 +233,7 @@ class _Symbolizer(object):
 			)
 			return depExports
 		except dyld_trie.ExportReaderError as e:
-			self._logger.warning(f"Unable to read exports of {depInfo.dylibPath}, reason: {e}")  # noqa
+			self._logger.warning("Unable to read exports of %s, reason: %s", depInfo.dylibPath, e)  # noqa
 			return []
 
 	def _cacheDepExports(
@@ -259,9 +267,7 @@ class _Symbolizer(object):
 		"""Cache potential symbols in the symbol table.
 		"""
 
-		symtab: symtab_command = machoCtx.getLoadCommand(
-			(LoadCommands.LC_SYMTAB,)
-		)
+		symtab: symtab_command = machoCtx.getSymtab()
 		if not symtab:
 			self._logger.warning("Unable to find LC_SYMTAB.")
 			return
@@ -283,7 +289,7 @@ class _Symbolizer(object):
 			if symbolAddr == 0:
 				continue
 			if not machoCtx.containsAddr(symbolAddr):
-				self._logger.warning(f"Invalid address: {symbolAddr}, for symbol entry: {symbol}.")  # noqa
+				self._logger.warning("Invalid address: %s, for symbol entry: %s.", symbolAddr, symbol)  # noqa
 				continue
 
 			# save it to the cache
@@ -323,6 +329,225 @@ class _StubFormat(enum.Enum):
 	pass
 
 
+# Instruction signatures of each stub format, in order of precedence.
+# Each instruction word has a (mask, value) pair that it must match.
+_STUB_SIGNATURES: Tuple[Tuple[_StubFormat, Tuple[Tuple[int, int], ...]], ...] = (
+	# ADRP x16, page
+	# LDR x16, [x16, pageoff]
+	# BR x16
+	(_StubFormat.StubNormal, (
+		(0x9F00001F, 0x90000010),
+		(0xFFC003FF, 0xF9400210),
+		(0xFFFFFFFF, 0xD61F0200),
+	)),
+
+	# ADRP x16, page
+	# ADD x16, x16, offset
+	# BR x16
+	(_StubFormat.StubOptimized, (
+		(0x9F00001F, 0x90000010),
+		(0xFFC003FF, 0x91000210),
+		(0xFFFFFFFF, 0xD61F0200),
+	)),
+
+	# ADRP x17, page
+	# ADD x17, x17, offset
+	# LDR x16, [x17]
+	# BRAA x16, x17
+	(_StubFormat.AuthStubNormal, (
+		(0x9F000000, 0x90000000),
+		(0xFFC00000, 0x91000000),
+		(0xFFC00000, 0xF9400000),
+		(0xFEFFF800, 0xD61F0800),
+	)),
+
+	# ADRP x16, page
+	# ADD x16, x16, offset
+	# BR x16
+	# TRAP
+	(_StubFormat.AuthStubOptimized, (
+		(0x9F000000, 0x90000000),
+		(0xFFC00000, 0x91000000),
+		(0xFFFFFFFF, 0xD61F0200),
+		(0xFFFFFFFF, 0xD4200020),
+	)),
+
+	# ADRP x16, page
+	# LDR x16, [x16, pageoff]
+	# BRAAZ x16
+	(_StubFormat.AuthStubResolver, (
+		(0x9F000000, 0x90000000),
+		(0xFFC00000, 0xF9400000),
+		(0xFEFFF800, 0xD61F0800),
+	)),
+
+	# STP, MOV, and then verified by getResolverData
+	(_StubFormat.Resolver, (
+		(0x7FC00000, 0x29800000),
+		(0x7F3FFC00, 0x11000000),
+	)),
+
+	# B target
+	(_StubFormat.Branch, (
+		(0xFC000000, 0x14000000),
+	)),
+)
+
+# The number of instruction words read for each stub.
+_STUB_WINDOW_SIZE = 4
+
+# The signatures as arrays for batch matching, unused words
+# have a mask and value of 0.
+_STUB_SIGNATURE_MASKS = np.array(
+	[
+		[mask for mask, _ in signature] + [0] * (_STUB_WINDOW_SIZE - len(signature))
+		for _, signature in _STUB_SIGNATURES
+	],
+	dtype=np.uint32
+)
+_STUB_SIGNATURE_VALUES = np.array(
+	[
+		[value for _, value in signature] + [0] * (_STUB_WINDOW_SIZE - len(signature))
+		for _, signature in _STUB_SIGNATURES
+	],
+	dtype=np.uint32
+)
+
+
+class StubResolutionTable(object):
+
+	SHARED_DATA_NAME = "stubResolutionTable"
+
+	def __init__(self) -> None:
+		"""A cache wide table of resolved stubs.
+
+		Stubs, auth stubs and branch islands are shared between images,
+		so the result of resolving them is kept here, including addresses
+		that could not be resolved. Arm64Utilities gets this table from
+		the shared data of the cache.
+		"""
+
+		super().__init__()
+
+		# Maps an address to the target and format of the stub,
+		# or None if it is not a stub.
+		self.stubs: Dict[int, Tuple[int, _StubFormat]] = {}
+
+		# Maps an address to the final target of its stub chain.
+		self.chains: Dict[int, int] = {}
+		pass
+
+	def save(self, path: str) -> None:
+		"""Save the table to a file.
+
+		Args:
+			path: The path to save to, numpy adds the ".npz" suffix if
+				it is missing.
+		"""
+
+		stubAddrs = np.fromiter(self.stubs.keys(), dtype=np.uint64, count=len(self.stubs))
+		stubTargets = np.fromiter(
+			(stub[0] if stub else 0 for stub in self.stubs.values()),
+			dtype=np.uint64,
+			count=len(self.stubs)
+		)
+		stubFormats = np.fromiter(
+			(stub[1].value if stub else 0 for stub in self.stubs.values()),
+			dtype=np.uint8,
+			count=len(self.stubs)
+		)
+
+		chainAddrs = np.fromiter(self.chains.keys(), dtype=np.uint64, count=len(self.chains))
+		chainTargets = np.fromiter(
+			self.chains.values(),
+			dtype=np.uint64,
+			count=len(self.chains)
+		)
+
+		np.savez(
+			path,
+			stubAddrs=stubAddrs,
+			stubTargets=stubTargets,
+			stubFormats=stubFormats,
+			chainAddrs=chainAddrs,
+			chainTargets=chainTargets
+		)
+		pass
+
+	@classmethod
+	def load(cls, path: str) -> "StubResolutionTable":
+		"""Load a table saved with save.
+		"""
+
+		table = cls()
+		with np.load(path) as data:
+			stubFormats = data["stubFormats"].tolist()
+			for addr, target, stubFormat in zip(
+				data["stubAddrs"].tolist(),
+				data["stubTargets"].tolist(),
+				stubFormats
+			):
+				if stubFormat:
+					table.stubs[addr] = (target, _StubFormat(stubFormat))
+				else:
+					table.stubs[addr] = None
+				pass
+
+			table.chains = dict(zip(
+				data["chainAddrs"].tolist(),
+				data["chainTargets"].tolist()
+			))
+			pass
+
+		return table
+
+	@classmethod
+	def build(cls, extractionCtx: ExtractionContext) -> "StubResolutionTable":
+		"""Resolve the stubs of every image in the cache.
+
+		The table is also stored in the shared data of the cache.
+
+		Args:
+			extractionCtx: The extraction context, only the dyld context,
+				the status bar, and the logger are used.
+
+		Returns:
+			The populated table.
+		"""
+
+		dyldCtx = extractionCtx.dyldCtx
+		statusBar = extractionCtx.statusBar
+
+		arm64Utils = Arm64Utilities(extractionCtx)
+		statusBar.update(unit="Stub Resolution")
+
+		for image in dyldCtx.images:
+			imageOff, context = dyldCtx.convertAddr(image.address)
+			machoCtx = MachOContext(context.fileObject, imageOff, lazy=True)
+
+			for segment in machoCtx.segmentsI:
+				for sect in segment.sectsI:
+					if (
+						sect.flags & SECTION_TYPE != S_SYMBOL_STUBS
+						or not sect.reserved2
+					):
+						continue
+
+					stubAddrs = range(sect.addr, sect.addr + sect.size, sect.reserved2)
+					arm64Utils.resolveStubs(stubAddrs)
+					for stubAddr in stubAddrs:
+						arm64Utils.resolveStubChain(stubAddr)
+						pass
+					pass
+				pass
+
+			statusBar.update(status="Resolving Stubs")
+			pass
+
+		return arm64Utils.resolveTable
+	pass
+
+
 class Arm64Utilities(object):
 
 	def __init__(self, extractionCtx: ExtractionContext) -> None:
@@ -331,25 +556,11 @@ class Arm64Utilities(object):
 		self._dyldCtx = extractionCtx.dyldCtx
 		self._slider = slide_info.PointerSlider(extractionCtx)
 
-		def getResolverTarget(address):
-			if resolverData := self.getResolverData(address):
-				# Don't need the size of the resolver
-				return resolverData[0]
-			else:
-				return None
-
-		self._stubResolvers = (
-			(self._getStubNormalTarget, _StubFormat.StubNormal),
-			(self._getStubOptimizedTarget, _StubFormat.StubOptimized),
-			(self._getAuthStubNormalTarget, _StubFormat.AuthStubNormal),
-			(self._getAuthStubOptimizedTarget, _StubFormat.AuthStubOptimized),
-			(self._getAuthStubResolverTarget, _StubFormat.AuthStubResolver),
-			(getResolverTarget, _StubFormat.Resolver),
-			(self._getBranchTarget, _StubFormat.Branch)
+		# Resolved stubs and stub chains, shared between all images.
+		self.resolveTable: StubResolutionTable = self._dyldCtx.getSharedData(
+			StubResolutionTable.SHARED_DATA_NAME,
+			StubResolutionTable
 		)
-
-		# A cache of resolved stub chains
-		self._resolveCache: Dict[int, int] = {}
 		pass
 
 	def generateStubNormal(self, stubAddress: int, ldrAddress: int) -> bytes:
@@ -426,8 +637,9 @@ class Arm64Utilities(object):
 			The final target of the stub chain.
 		"""
 
-		if address in self._resolveCache:
-			return self._resolveCache[address]
+		chains = self.resolveTable.chains
+		if address in chains:
+			return chains[address]
 
 		target = address
 		while True:
@@ -436,7 +648,7 @@ class Arm64Utilities(object):
 			else:
 				break
 
-		self._resolveCache[address] = target
+		chains[address] = target
 		return target
 
 	def resolveStub(self, address: int) -> Tuple[int, _StubFormat]:
@@ -451,11 +663,132 @@ class Arm64Utilities(object):
 			determined.
 		"""
 
-		for resolver, stubFormat in self._stubResolvers:
-			if (result := resolver(address)) is not None:
-				return (result, stubFormat)
+		stubs = self.resolveTable.stubs
+		if address in stubs:
+			return stubs[address]
+
+		stubData = None
+		if (words := self._readStubWindow(address)) is not None:
+			for stubFormat, signature in _STUB_SIGNATURES:
+				if any(
+					(word & mask) != value
+					for word, (mask, value) in zip(words, signature)
+				):
+					continue
+
+				target = self._decodeStubTarget(stubFormat, address, words)
+				if target is not None:
+					stubData = (target, stubFormat)
+					break
+				pass
+			pass
+
+		stubs[address] = stubData
+		return stubData
+
+	def resolveStubs(
+		self,
+		addresses: Iterable[int]
+	) -> List[Tuple[int, _StubFormat]]:
+		"""Get multiple stubs and their formats.
+
+		This is a batch version of resolveStub, the stubs are read
+		and matched against the signatures all at once.
+
+		Args:
+			addresses: The addresses of the stubs.
+
+		Returns:
+			A list with the result of resolveStub for each address.
+		"""
+
+		addresses = list(addresses)
+		stubs = self.resolveTable.stubs
+
+		pending = list(dict.fromkeys(addr for addr in addresses if addr not in stubs))
+		if pending:
+			pendingAddrs = np.array(pending, dtype=np.uint64)
+			windows, found = self._readStubWindows(pendingAddrs)
+			matches = (
+				((windows[:, None, :] & _STUB_SIGNATURE_MASKS) == _STUB_SIGNATURE_VALUES)
+				.all(axis=2)
+				& found[:, None]
+			)
+
+			# decode the possible targets of every format at once
+			words = windows.astype(np.int64)
+			adrp = words[:, 0]
+			immhi = (adrp & 0xFFFFE0) >> 3
+			immlo = (adrp & 0x60000000) >> 29
+			imm = (immhi | immlo) << 12
+			imm = np.where(imm & (1 << 32), imm - (1 << 33), imm)
+			adrpResults = (pendingAddrs.astype(np.int64) & ~0xFFF) + imm
+
+			ldrImms = (words[:, 1] & 0x3FFC00) >> 7
+			addImms = (words[:, 1] & 0x3FFC00) >> 10
+			authLdrImms = (words[:, 2] & 0x3FFC00) >> 7
+
+			branchImms = (words[:, 0] & 0x3FFFFFF) << 2
+			branchImms = np.where(
+				branchImms & (1 << 27),
+				branchImms - (1 << 28),
+				branchImms
+			)
+
+			# slide the pointers loaded by the ldr instructions
+			ldrTargets = np.where(
+				matches[:, 2],
+				adrpResults + addImms + authLdrImms,
+				adrpResults + ldrImms
+			)
+			needsSlide = matches[:, 0] | matches[:, 2] | matches[:, 4]
+			slidTargets = np.zeros(len(pending), dtype=np.uint64)
+			slidMask = np.zeros(len(pending), dtype=bool)
+			if needsSlide.any():
+				slidTargets[needsSlide], slidMask[needsSlide] = self._slider.slideAddresses(
+					ldrTargets[needsSlide].astype(np.uint64),
+					withMask=True
+				)
+				pass
+
+			slidTargets = slidTargets.tolist()
+			slidMask = slidMask.tolist()
+			optimizedTargets = (adrpResults + addImms).tolist()
+			branchTargets = (pendingAddrs.astype(np.int64) + branchImms).tolist()
+
+			for i, (address, rowMatches) in enumerate(zip(pending, matches.tolist())):
+				stubData = None
+				for (stubFormat, _), matched in zip(_STUB_SIGNATURES, rowMatches):
+					if not matched:
+						continue
+
+					if (
+						stubFormat == _StubFormat.StubNormal
+						or stubFormat == _StubFormat.AuthStubNormal
+						or stubFormat == _StubFormat.AuthStubResolver
+					):
+						target = slidTargets[i] if slidMask[i] else None
+					elif (
+						stubFormat == _StubFormat.StubOptimized
+						or stubFormat == _StubFormat.AuthStubOptimized
+					):
+						target = optimizedTargets[i]
+					elif stubFormat == _StubFormat.Resolver:
+						resolverData = self.getResolverData(address)
+						target = resolverData[0] if resolverData else None
+					else:
+						target = branchTargets[i]
+
+					if target is not None:
+						stubData = (target, stubFormat)
+						break
+					pass
+
+				stubs[address] = stubData
+				pass
 			pass
-		return None
+
+		return [stubs[addr] for addr in addresses]
 
 	def getStubHelperData(self, address: int) -> int:
 		"""Get the bind data of a stub helper.
@@ -699,195 +1032,131 @@ class Arm64Utilities(object):
 		imm = (ldr & 0x3FFC00) >> 7
 		return addResult + imm
 
-	def _getStubNormalTarget(self, address: int) -> int:
-		"""
-		ADRP x16, page
-		LDR x16, [x16, pageoff]
-		BR x16
-		"""
-
-		stubOff, ctx = self._dyldCtx.convertAddr(address) or (None, None)
-		if stubOff is None:
-			return None
+	def _readStubWindow(self, address: int) -> Tuple[int, ...]:
+		"""Read the instruction words of a stub.
 
-		adrp, ldr, br = ctx.readFormat("<III", stubOff)
+		Words past the end of the file are read as 0.
 
-		# verify
-		if (
-			(adrp & 0x9F00001F) != 0x90000010
-			or (ldr & 0xFFC003FF) != 0xF9400210
-			or br != 0xD61F0200
-		):
-			return None
-
-		# adrp
-		immlo = (adrp & 0x60000000) >> 29
-		immhi = (adrp & 0xFFFFE0) >> 3
-		imm = (immhi | immlo) << 12
-		imm = self.signExtend(imm, 33)
-		adrpResult = (address & ~0xFFF) + imm
-
-		# ldr
-		offset = (ldr & 0x3FFC00) >> 7
-		ldrTarget = adrpResult + offset
-		return self._slider.slideAddress(ldrTarget)
-
-	def _getStubOptimizedTarget(self, address: int) -> int:
-		"""
-		ADRP x16, page
-		ADD x16, x16, offset
-		BR x16
+		Returns:
+			A tuple of instruction words, or None if the address
+			is not in the cache.
 		"""
 
 		stubOff, ctx = self._dyldCtx.convertAddr(address) or (None, None)
 		if stubOff is None:
 			return None
 
-		adrp, add, br = ctx.readFormat("<III", stubOff)
+		windowSize = _STUB_WINDOW_SIZE * 4
+		data = ctx.file[stubOff:stubOff + windowSize]
+		if len(data) < windowSize:
+			data = data.ljust(windowSize, b"\x00")
+			pass
 
-		# verify
-		if (
-			(adrp & 0x9F00001F) != 0x90000010
-			or (add & 0xFFC003FF) != 0x91000210
-			or br != 0xD61F0200
-		):
-			return None
+		return struct.unpack(f"<{_STUB_WINDOW_SIZE}I", data)
 
-		# adrp
-		immlo = (adrp & 0x60000000) >> 29
-		immhi = (adrp & 0xFFFFE0) >> 3
-		imm = (immhi | immlo) << 12
-		imm = self.signExtend(imm, 33)
-		adrpResult = (address & ~0xFFF) + imm
+	def _readStubWindows(
+		self,
+		addresses: np.ndarray
+	) -> Tuple[np.ndarray, np.ndarray]:
+		"""Read the instruction words of multiple stubs.
 
-		# add
-		imm12 = (add & 0x3FFC00) >> 10
-		return adrpResult + imm12
+		Args:
+			addresses: A uint64 array of stub addresses.
 
-	def _getAuthStubNormalTarget(self, address: int) -> int:
-		"""
-		91 59 11 90  adrp  	x17,0x1e27e5000
-		31 22 0d 91  add  	x17,x17,#0x348
-		30 02 40 f9  ldr  	x16,[x17]=>->__auth_stubs::_CCRandomCopyBytes
-		11 0a 1f d7  braa  	x16=>__auth_stubs::_CCRandomCopyBytes,x17
+		Returns:
+			A tuple of a (n, _STUB_WINDOW_SIZE) uint32 array of
+			instruction words, and a boolean array marking which
+			addresses are in the cache.
 		"""
 
-		stubOff, ctx = self._dyldCtx.convertAddr(address) or (None, None)
-		if stubOff is None:
-			return None
-
-		adrp, add, ldr, braa = ctx.readFormat("<IIII", stubOff)
+		windowSize = _STUB_WINDOW_SIZE * 4
+		windows = np.zeros((len(addresses), _STUB_WINDOW_SIZE), dtype=np.uint32)
+		found = np.zeros(len(addresses), dtype=bool)
 
-		# verify
-		if (
-			(adrp & 0x9F000000) != 0x90000000
-			or (add & 0xFFC00000) != 0x91000000
-			or (ldr & 0xFFC00000) != 0xF9400000
-			or (braa & 0xFEFFF800) != 0xD61F0800
-		):
-			return None
+		# Like convertAddr, use the first mapping that contains the address
+		for mapping, ctx in self._dyldCtx.mappings:
+			inMapping = (
+				(addresses >= mapping.address)
+				& (addresses < mapping.address + mapping.size)
+				& ~found
+			)
+			if not inMapping.any():
+				continue
+			found |= inMapping
+
+			offsets = (
+				(addresses[inMapping] - mapping.address) + mapping.fileOffset
+			).astype(np.int64)
+			fileData = np.frombuffer(ctx.file, dtype=np.uint8)
+
+			byteIndices = offsets[:, None] + np.arange(windowSize)
+			inFile = byteIndices < len(fileData)
+			windowData = np.zeros(byteIndices.shape, dtype=np.uint8)
+			windowData[inFile] = fileData[byteIndices[inFile]]
+			windows[inMapping] = windowData.view("<u4")
+			pass
 
-		# adrp
-		immhi = (adrp & 0xFFFFE0) >> 3
-		immlo = (adrp & 0x60000000) >> 29
-		imm = (immhi | immlo) << 12
-		imm = self.signExtend(imm, 33)
-		adrpResult = (address & ~0xFFF) + imm
+		return windows, found
 
-		# add
-		imm = (add & 0x3FFC00) >> 10
-		addResult = adrpResult + imm
+	def _decodeStubTarget(
+		self,
+		stubFormat: _StubFormat,
+		address: int,
+		words: Tuple[int, ...]
+	) -> int:
+		"""Decode the target of a stub that matched a signature.
 
-		# ldr
-		imm = (ldr & 0x3FFC00) >> 7
-		ldrTarget = addResult + imm
-		return self._slider.slideAddress(ldrTarget)
-		pass
+		Args:
+			stubFormat: The format of the matched signature.
+			address: The address of the stub.
+			words: The instruction words of the stub.
 
-	def _getAuthStubOptimizedTarget(self, address: int) -> int:
-		"""
-		1bfcb5d20 30 47 e2 90  adrp  	x16,0x184599000
-		1bfcb5d24 10 62 30 91  add  	x16,x16,#0xc18
-		1bfcb5d28 00 02 1f d6  br  		x16=>LAB_184599c18
-		1bfcb5d2c 20 00 20 d4  trap
+		Returns:
+			The target of the stub, or None if it could not be
+			determined.
 		"""
 
-		stubOff, ctx = self._dyldCtx.convertAddr(address) or (None, None)
-		if stubOff is None:
-			return None
-
-		adrp, add, br, trap = ctx.readFormat("<IIII", stubOff)
+		if stubFormat == _StubFormat.Branch:
+			offset = self.signExtend((words[0] & 0x3FFFFFF) << 2, 28)
+			return address + offset
 
-		# verify
-		if (
-			(adrp & 0x9F000000) != 0x90000000
-			or (add & 0xFFC00000) != 0x91000000
-			or br != 0xD61F0200
-			or trap != 0xD4200020
-		):
+		elif stubFormat == _StubFormat.Resolver:
+			if resolverData := self.getResolverData(address):
+				# Don't need the size of the resolver
+				return resolverData[0]
 			return None
 
-		# adrp
+		# The rest start with an adrp
+		adrp = words[0]
 		immhi = (adrp & 0xFFFFE0) >> 3
 		immlo = (adrp & 0x60000000) >> 29
 		imm = (immhi | immlo) << 12
 		imm = self.signExtend(imm, 33)
 		adrpResult = (address & ~0xFFF) + imm
 
-		# add
-		imm = (add & 0x3FFC00) >> 10
-		return adrpResult + imm
-
-	def _getAuthStubResolverTarget(self, address: int) -> int:
-		"""
-		70 e6 26 b0  adrp 	x16,0x1e38ba000
-		10 e6 41 f9  ldr 	x16,[x16, #0x3c8]
-		1f 0a 1f d6  braaz 	x16=>FUN_195bee070
-		"""
-
-		stubOff, ctx = self._dyldCtx.convertAddr(address) or (None, None)
-		if stubOff is None:
-			return None
-
-		adrp, ldr, braaz = ctx.readFormat("<III", stubOff)
-
-		# verify
 		if (
-			(adrp & 0x9F000000) != 0x90000000
-			or (ldr & 0xFFC00000) != 0xF9400000
-			or (braaz & 0xFEFFF800) != 0xD61F0800
+			stubFormat == _StubFormat.StubNormal
+			or stubFormat == _StubFormat.AuthStubResolver
 		):
-			return None
-
-		# adrp
-		immhi = (adrp & 0xFFFFE0) >> 3
-		immlo = (adrp & 0x60000000) >> 29
-		imm = (immhi | immlo) << 12
-		imm = self.signExtend(imm, 33)
-		adrpResult = (address & ~0xFFF) + imm
+			# ldr
+			ldrTarget = adrpResult + ((words[1] & 0x3FFC00) >> 7)
+			return self._slider.slideAddress(ldrTarget)
 
-		# ldr
-		imm = (ldr & 0x3FFC00) >> 7
-		ldrTarget = adrpResult + imm
-		return self._slider.slideAddress(ldrTarget)
-	pass
+		elif (
+			stubFormat == _StubFormat.StubOptimized
+			or stubFormat == _StubFormat.AuthStubOptimized
+		):
+			# add
+			return adrpResult + ((words[1] & 0x3FFC00) >> 10)
 
-	def _getBranchTarget(self, address: int) -> int:
-		"""
-		Try to resolve a branch
-		"""
-
-		stubOff, ctx = self._dyldCtx.convertAddr(address) or (None, None)
-		if stubOff is None:
-			return None
-		
-		b = ctx.readFormat("<I", stubOff)[0]
-		if b & 0xFC000000 != 0x14000000:
-			return None
-		
-		offset = self.signExtend((b & 0x3FFFFFF) << 2, 28)
-		return address + offset
+		elif stubFormat == _StubFormat.AuthStubNormal:
+			# add and then ldr
+			addResult = adrpResult + ((words[1] & 0x3FFC00) >> 10)
+			ldrTarget = addResult + ((words[2] & 0x3FFC00) >> 7)
+			return self._slider.slideAddress(ldrTarget)
 
+		return None
+	pass
 
 
 @dataclasses.dataclass
@@ -902,12 +1171,12 @@ class _BindRecord(object):
 	pass
 
 
-def _bindReader(
+def _readBinds(
 	fileCtx: FileContext,
 	bindOff: int,
 	bindSize: int
-) -> Iterator[_BindRecord]:
-	"""Read all the bind records
+) -> Iterator[tuple]:
+	"""Interpret a bind opcode stream.
 
 	Args:
 		fileCtx: The source file to read from.
@@ -915,7 +1184,8 @@ def _bindReader(
 		bindSize: The total size of the bind data.
 
 	Returns:
-		A list of bind records.
+		A tuple for each bind, containing the offset that the bind
+		state was last reset at, followed by the fields of _BindRecord.
 
 	Raises:
 		KeyError: If the reader encounters an unknown bind opcode.
@@ -923,7 +1193,9 @@ def _bindReader(
 
 	file = fileCtx.file
 
-	currentRecord = _BindRecord()
+	entryOff = bindOff
+	ordinal = flags = symbol = symbolType = addend = segment = offset = None
+
 	bindDataEnd = bindOff + bindSize
 	while bindOff < bindDataEnd:
 		bindOpcodeImm = file[bindOff]
@@ -934,72 +1206,73 @@ def _bindReader(
 
 		if opcode == BIND_OPCODE_DONE:
 			# Only resets the record apparently
-			currentRecord = _BindRecord()
+			ordinal = flags = symbol = symbolType = addend = segment = offset = None
+			entryOff = bindOff
 			pass
 
 		elif opcode == BIND_OPCODE_SET_DYLIB_ORDINAL_IMM:
-			currentRecord.ordinal = imm
+			ordinal = imm
 			pass
 
 		elif opcode == BIND_OPCODE_SET_DYLIB_ORDINAL_ULEB:
-			currentRecord.ordinal, bindOff = leb128.decodeUleb128(file, bindOff)
+			ordinal, bindOff = leb128.decodeUleb128(file, bindOff)
 			pass
 
 		elif opcode == BIND_OPCODE_SET_DYLIB_SPECIAL_IMM:
 			if imm == 0:
-				currentRecord.ordinal = BIND_SPECIAL_DYLIB_SELF
+				ordinal = BIND_SPECIAL_DYLIB_SELF
 			else:
 				if imm == 1:
-					currentRecord.ordinal = BIND_SPECIAL_DYLIB_MAIN_EXECUTABLE
+					ordinal = BIND_SPECIAL_DYLIB_MAIN_EXECUTABLE
 				elif imm == 2:
-					currentRecord.ordinal = BIND_SPECIAL_DYLIB_FLAT_LOOKUP
+					ordinal = BIND_SPECIAL_DYLIB_FLAT_LOOKUP
 				elif imm == 3:
-					currentRecord.ordinal = BIND_SPECIAL_DYLIB_WEAK_LOOKUP
+					ordinal = BIND_SPECIAL_DYLIB_WEAK_LOOKUP
 				else:
 					raise KeyError(f"Unknown special ordinal: {imm}")
 			pass
 
 		elif opcode == BIND_OPCODE_SET_SYMBOL_TRAILING_FLAGS_IMM:
-			currentRecord.flags = imm
-			currentRecord.symbol = fileCtx.readString(bindOff)
-			bindOff += len(currentRecord.symbol)
+			flags = imm
+			symbol = fileCtx.readString(bindOff)
+			bindOff += len(symbol)
 			pass
 
 		elif opcode == BIND_OPCODE_SET_TYPE_IMM:
-			currentRecord.symbolType = imm
+			symbolType = imm
 			pass
 
 		elif opcode == BIND_OPCODE_SET_ADDEND_SLEB:
-			currentRecord.addend, bindOff = leb128.decodeSleb128(file, bindOff)
+			addend, bindOff = leb128.decodeSleb128(file, bindOff)
 			pass
 
 		elif opcode == BIND_OPCODE_SET_SEGMENT_AND_OFFSET_ULEB:
-			currentRecord.segment = imm
-			currentRecord.offset, bindOff = leb128.decodeUleb128(file, bindOff)
+			segment = imm
+			offset, bindOff = leb128.decodeUleb128(file, bindOff)
 			pass
 
 		elif opcode == BIND_OPCODE_ADD_ADDR_ULEB:
 			add, bindOff = leb128.decodeUleb128(file, bindOff)
 			add = Arm64Utilities.signExtend(add, 64)
-			currentRecord.offset += add
+			offset += add
 			pass
 
 		elif opcode == BIND_OPCODE_DO_BIND:
-			yield dataclasses.replace(currentRecord)
-			currentRecord.offset += 8
+			yield (entryOff, ordinal, flags, symbol, symbolType, addend, segment, offset)
+			offset += 8
 			pass
 
 		elif opcode == BIND_OPCODE_DO_BIND_ADD_ADDR_ULEB:
-			yield dataclasses.replace(currentRecord)
+			yield (entryOff, ordinal, flags, symbol, symbolType, addend, segment, offset)
 
 			add, bindOff = leb128.decodeUleb128(file, bindOff)
 			add = Arm64Utilities.signExtend(add, 64)
-			currentRecord.offset += add + 8
+			offset += add + 8
 			pass
 
 		elif opcode == BIND_OPCODE_DO_BIND_ADD_ADDR_IMM_SCALED:
-			yield dataclasses.replace(currentRecord)
-			currentRecord.offset += (imm * 8) + 8
+			yield (entryOff, ordinal, flags, symbol, symbolType, addend, segment, offset)
+			offset += (imm * 8) + 8
 			pass
 
 		elif opcode == BIND_OPCODE_DO_BIND_ULEB_TIMES_SKIPPING_ULEB:
@@ -1007,8 +1280,8 @@ def _bindReader(
 			skip, bindOff = leb128.decodeUleb128(file, bindOff)
 
 			for _ in range(count):
-				yield dataclasses.replace(currentRecord)
-				currentRecord.offset += skip + 8
+				yield (entryOff, ordinal, flags, symbol, symbolType, addend, segment, offset)
+				offset += skip + 8
 			pass
 
 		else:
@@ -1017,6 +1290,126 @@ def _bindReader(
 	pass
 
 
+def _readBindEntry(
+	fileCtx: FileContext,
+	entryOff: int,
+	bindSize: int
+) -> _BindRecord:
+	"""Read the first bind record from an offset in a bind stream.
+
+	Returns:
+		The bind record, or None if there isn't one.
+
+	Raises:
+		KeyError: If the reader encounters an unknown bind opcode.
+	"""
+
+	row = next(_readBinds(fileCtx, entryOff, bindSize), None)
+	return _BindRecord(*row[1:]) if row else None
+
+
+class _BindTable(object):
+
+	def __init__(
+		self,
+		fileCtx: FileContext,
+		bindOff: int,
+		bindSize: int
+	) -> None:
+		"""A decoded bind opcode stream.
+
+		The stream is interpreted once into parallel columns, with an
+		index from the offset of each bind entry to its first record.
+
+		Args:
+			fileCtx: The source file to read from.
+			bindOff: The offset in the fileCtx to read from.
+			bindSize: The total size of the bind data.
+
+		Raises:
+			KeyError: If the reader encounters an unknown bind opcode.
+		"""
+
+		super().__init__()
+
+		self.fileCtx = fileCtx
+		self.bindSize = bindSize
+
+		self.entryOffsets: List[int] = []
+		self.ordinals: List[int] = []
+		self.flags: List[int] = []
+		self.symbols: List[bytes] = []
+		self.symbolTypes: List[int] = []
+		self.addends: List[int] = []
+		self.segments: List[int] = []
+		self.offsets: List[int] = []
+
+		# Maps an entry offset to the index of its first record
+		self._entryIndex: Dict[int, int] = {}
+
+		columns = (
+			self.entryOffsets,
+			self.ordinals,
+			self.flags,
+			self.symbols,
+			self.symbolTypes,
+			self.addends,
+			self.segments,
+			self.offsets
+		)
+		for i, row in enumerate(_readBinds(fileCtx, bindOff, bindSize)):
+			if row[0] not in self._entryIndex:
+				self._entryIndex[row[0]] = i
+
+			for column, value in zip(columns, row):
+				column.append(value)
+				pass
+			pass
+		pass
+
+	def __len__(self) -> int:
+		return len(self.entryOffsets)
+
+	def record(self, index: int) -> _BindRecord:
+		"""Get a record in the table.
+		"""
+
+		return _BindRecord(
+			self.ordinals[index],
+			self.flags[index],
+			self.symbols[index],
+			self.symbolTypes[index],
+			self.addends[index],
+			self.segments[index],
+			self.offsets[index]
+		)
+
+	def recordForEntry(self, entryOff: int) -> _BindRecord:
+		"""Get the first record of the entry starting at an offset.
+
+		This gives the same record as interpreting the stream from
+		the offset, which is how the stub helpers reference it.
+
+		Args:
+			entryOff: The offset of the entry in the fileCtx.
+
+		Returns:
+			The bind record, or None if there isn't one.
+
+		Raises:
+			KeyError: If reading from the offset encounters an unknown
+				bind opcode.
+		"""
+
+		if entryOff in self._entryIndex:
+			return self.record(self._entryIndex[entryOff])
+
+		# The offset is not at the start of an entry in the table,
+		# interpret the stream from it.
+		return _readBindEntry(self.fileCtx, entryOff, self.bindSize)
+	pass
+
+
 class _StubFixerError(Exception):
 	pass
 
@@ -1039,18 +1432,15 @@ class _StubFixer(object):
 		self._arm64Utils = Arm64Utilities(self._extractionCtx)
 		self._slider = slide_info.PointerSlider(self._extractionCtx)
 
-		self._symtab: symtab_command = self._machoCtx.getLoadCommand(
-			(LoadCommands.LC_SYMTAB,)
-		)
+		self._symtab: symtab_command = self._machoCtx.getSymtab()
 		if not self._symtab:
 			raise _StubFixerError("Unable to get symtab_command.")
 
-		self._dysymtab: dysymtab_command = self._machoCtx.getLoadCommand(
-			(LoadCommands.LC_DYSYMTAB,)
-		)
+		self._dysymtab: dysymtab_command = self._machoCtx.getDysymtab()
 		if not self._dysymtab:
 			raise _StubFixerError("Unable to get dysymtab_command.")
 
+		self._lazyBindTable: _BindTable = None
 		symbolPtrs = self._enumerateSymbolPointers()
 		self._fixStubHelpers()
 
@@ -1064,55 +1454,49 @@ class _StubFixer(object):
 		"""
 
 		# read all the bind records as they're a source of symbolic info
-		bindRecords: Dict[int, _BindRecord] = {}
-		dyldInfo: dyld_info_command = self._machoCtx.getLoadCommand(
-			(LoadCommands.LC_DYLD_INFO, LoadCommands.LC_DYLD_INFO_ONLY)
-		)
+		bindRecords: Dict[int, bytes] = {}
+		dyldInfo: dyld_info_command = self._machoCtx.getDyldInfo()
 
 		linkeditFile = self._machoCtx.ctxForAddr(
 			self._machoCtx.segments[b"__LINKEDIT"].seg.vmaddr
 		)
 
 		if dyldInfo:
-			records: List[_BindRecord] = []
+			tables: List[_BindTable] = []
 			try:
 				if dyldInfo.weak_bind_size:
 					# usually contains records for c++ symbols like "new"
-					records.extend(
-						_bindReader(
-							linkeditFile,
-							dyldInfo.weak_bind_off,
-							dyldInfo.weak_bind_size
-						)
-					)
+					tables.append(_BindTable(
+						linkeditFile,
+						dyldInfo.weak_bind_off,
+						dyldInfo.weak_bind_size
+					))
 					pass
 
 				if dyldInfo.lazy_bind_off:
-					records.extend(
-						_bindReader(
-							linkeditFile,
-							dyldInfo.lazy_bind_off,
-							dyldInfo.lazy_bind_size
-						)
+					self._lazyBindTable = _BindTable(
+						linkeditFile,
+						dyldInfo.lazy_bind_off,
+						dyldInfo.lazy_bind_size
 					)
+					tables.append(self._lazyBindTable)
 					pass
 
-				for record in records:
-					# check if we have the info needed
-					if (
-						record.symbol is None
-						or record.segment is None
-						or record.offset is None
+				segmentAddrs = [seg.seg.vmaddr for seg in self._machoCtx.segmentsI]
+				for table in tables:
+					for i, (symbol, segment, offset) in enumerate(
+						zip(table.symbols, table.segments, table.offsets)
 					):
-						self._logger.warning(f"Incomplete lazy bind record: {record}")
-						continue
+						# check if we have the info needed
+						if symbol is None or segment is None or offset is None:
+							self._logger.warning("Incomplete lazy bind record: %s", table.record(i))  # noqa
+							continue
 
-					bindAddr = self._machoCtx.segmentsI[record.segment].seg.vmaddr
-					bindAddr += record.offset
-					bindRecords[bindAddr] = record
+						bindRecords[segmentAddrs[segment] + offset] = symbol
+						pass
 					pass
 			except KeyError as e:
-				self._logger.error(f"Unable to read bind records, reasons: {e}")
+				self._logger.error("Unable to read bind records, reasons: %s", e)
 			pass
 
 		# enumerate all symbol pointers
@@ -1129,58 +1513,89 @@ class _StubFixer(object):
 				symbolPtrs[ptrSymbol] = [ptrAddr]
 			pass
 
+		bindAddrs = np.fromiter(bindRecords.keys(), dtype=np.uint64, count=len(bindRecords))
+
 		for segment in self._machoCtx.segmentsI:
 			for sect in segment.sectsI:
 				sectType = sect.flags & SECTION_TYPE
 				if (
-					sectType == S_NON_LAZY_SYMBOL_POINTERS
-					or sectType == S_LAZY_SYMBOL_POINTERS
+					sectType != S_NON_LAZY_SYMBOL_POINTERS
+					and sectType != S_LAZY_SYMBOL_POINTERS
 				):
-					for i in range(int(sect.size / 8)):
-						self._statusBar.update(status="Caching Symbol Pointers")
+					continue
 
-						ptrAddr = sect.addr + (i * 8)
+				self._statusBar.update(status="Caching Symbol Pointers")
 
-						# Try to symbolize through bind records
-						if ptrAddr in bindRecords:
-							_addToMap(bindRecords[ptrAddr].symbol, ptrAddr, sect)
-							continue
+				ptrCount = int(sect.size / 8)
+				ptrAddrs = (
+					np.arange(ptrCount, dtype=np.uint64) * np.uint64(8)
+					+ np.uint64(sect.addr)
+				)
 
-						# Try to symbolize though indirect symbol entries
-						symbolIndex = linkeditFile.readFormat(
-							"<I",
-							self._dysymtab.indirectsymoff + ((sect.reserved1 + i) * 4)
-						)[0]
-						if (
-							symbolIndex != 0
-							and symbolIndex != INDIRECT_SYMBOL_ABS
-							and symbolIndex != INDIRECT_SYMBOL_LOCAL
-							and symbolIndex != (INDIRECT_SYMBOL_ABS | INDIRECT_SYMBOL_LOCAL)
-						):
-							symbolEntry = nlist_64(
-								linkeditFile.file,
-								self._symtab.symoff + (symbolIndex * nlist_64.SIZE)
-							)
-							symbol = linkeditFile.readString(
-								self._symtab.stroff + symbolEntry.n_strx
-							)
+				# The symbols of each pointer, None if it has none
+				ptrSymbols: List[Tuple[bytes, ...]] = [None] * ptrCount
 
-							_addToMap(symbol, ptrAddr, sect)
-							continue
+				# Try to symbolize through bind records
+				isBound = np.isin(ptrAddrs, bindAddrs)
+				for i in np.flatnonzero(isBound).tolist():
+					ptrSymbols[i] = (bindRecords[sect.addr + (i * 8)],)
+					pass
 
-						# Try to symbolize though the pointers target
-						ptrTarget = self._slider.slideAddress(ptrAddr)
-						ptrFunc = self._arm64Utils.resolveStubChain(ptrTarget)
-						if symbols := self._symbolizer.symbolizeAddr(ptrFunc):
-							for sym in symbols:
-								_addToMap(sym, ptrAddr, sect)
-							continue
+				# Try to symbolize though indirect symbol entries
+				symbolIndexes = np.frombuffer(
+					linkeditFile.file,
+					dtype="<u4",
+					count=ptrCount,
+					offset=self._dysymtab.indirectsymoff + (sect.reserved1 * 4)
+				)
+				hasSymbol = (
+					~isBound
+					& (symbolIndexes != 0)
+					& (symbolIndexes != INDIRECT_SYMBOL_ABS)
+					& (symbolIndexes != INDIRECT_SYMBOL_LOCAL)
+					& (symbolIndexes != (INDIRECT_SYMBOL_ABS | INDIRECT_SYMBOL_LOCAL))
+				)
+				symbolSlots = np.flatnonzero(hasSymbol)
+				symbols = self._readSymbols(linkeditFile, symbolIndexes[symbolSlots])
+				for i, symbol in zip(symbolSlots.tolist(), symbols):
+					ptrSymbols[i] = (symbol,)
+					pass
 
-						# Skip special cases like __csbitmaps in CoreFoundation
-						if self._machoCtx.containsAddr(ptrTarget):
-							continue
+				# Try to symbolize though the pointers target
+				targetSlots = np.flatnonzero(~isBound & ~hasSymbol)
+				ptrTargets, isSlid = self._slider.slideAddresses(
+					ptrAddrs[targetSlots],
+					withMask=True
+				)
+				for i, ptrTarget, slid in zip(
+					targetSlots.tolist(),
+					ptrTargets.tolist(),
+					isSlid.tolist()
+				):
+					if not slid:
+						ptrTarget = None
+						pass
 
-						self._logger.warning(f"Unable to symbolize pointer at {hex(ptrAddr)}, with indirect entry index {hex(sect.reserved1 + i)}, with target function {hex(ptrFunc)}")  # noqa
+					ptrFunc = self._arm64Utils.resolveStubChain(ptrTarget)
+					if symbols := self._symbolizer.symbolizeAddr(ptrFunc):
+						ptrSymbols[i] = symbols
+						continue
+
+					# Skip special cases like __csbitmaps in CoreFoundation
+					if self._machoCtx.containsAddr(ptrTarget):
+						continue
+
+					self._logger.warning("Unable to symbolize pointer at %#x, with indirect entry index %#x, with target function %#x", sect.addr + (i * 8), sect.reserved1 + i, ptrFunc)  # noqa
+					pass
+
+				# add them in order of the pointers
+				for i, symbols in enumerate(ptrSymbols):
+					if symbols is None:
+						continue
+
+					ptrAddr = sect.addr + (i * 8)
+					for symbol in symbols:
+						_addToMap(symbol, ptrAddr, sect)
 						pass
 					pass
 				pass
@@ -1188,6 +1603,40 @@ class _StubFixer(object):
 
 		return symbolPtrs
 
+	def _readSymbols(
+		self,
+		linkeditFile: FileContext,
+		symbolIndexes: np.ndarray
+	) -> List[bytes]:
+		"""Read the names of symbol table entries.
+
+		Each distinct name is only read once.
+
+		Args:
+			linkeditFile: The file of the symbol table.
+			symbolIndexes: Indexes into the symbol table.
+
+		Returns:
+			The name of each entry.
+		"""
+
+		if not len(symbolIndexes):
+			return []
+
+		strx = np.frombuffer(
+			linkeditFile.file,
+			dtype=NLIST_64_DTYPE,
+			count=self._symtab.nsyms,
+			offset=self._symtab.symoff
+		)[symbolIndexes]["n_strx"]
+
+		uniqueStrx, strxIndexes = np.unique(strx, return_inverse=True)
+		names = [
+			linkeditFile.readString(self._symtab.stroff + i)
+			for i in uniqueStrx.tolist()
+		]
+		return [names[i] for i in strxIndexes.tolist()]
+
 	def _fixStubHelpers(self) -> None:
 		"""Relink symbol pointers to stub helpers.
 		"""
@@ -1200,9 +1649,7 @@ class _StubFixer(object):
 		except KeyError:
 			return
 
-		dyldInfo: dyld_info_command = self._machoCtx.getLoadCommand(
-			(LoadCommands.LC_DYLD_INFO, LoadCommands.LC_DYLD_INFO_ONLY)
-		)
+		dyldInfo: dyld_info_command = self._machoCtx.getDyldInfo()
 		if not dyldInfo:
 			return
 		elif not dyldInfo.lazy_bind_size:
@@ -1213,6 +1660,19 @@ class _StubFixer(object):
 			self._machoCtx.segments[b"__LINKEDIT"].seg.vmaddr
 		)
 
+		lazyTable = self._lazyBindTable
+		if lazyTable is None:
+			try:
+				lazyTable = _BindTable(
+					linkeditFile,
+					dyldInfo.lazy_bind_off,
+					dyldInfo.lazy_bind_size
+				)
+			except KeyError:
+				# entries before the bad opcode can still be read
+				pass
+			pass
+
 		# the stub helper section has the stub binder in
 		# beginning, skip it.
 		helperAddr = helperSect.addr + STUB_BINDER_SIZE
@@ -1222,14 +1682,11 @@ class _StubFixer(object):
 			self._statusBar.update(status="Fixing Lazy symbol Pointers")
 
 			if (bindOff := self._arm64Utils.getStubHelperData(helperAddr)) is not None:
-				record = next(
-					_bindReader(
-						linkeditFile,
-						dyldInfo.lazy_bind_off + bindOff,
-						dyldInfo.lazy_bind_size,
-					),
-					None
-				)
+				entryOff = dyldInfo.lazy_bind_off + bindOff
+				if lazyTable is not None:
+					record = lazyTable.recordForEntry(entryOff)
+				else:
+					record = _readBindEntry(linkeditFile, entryOff, dyldInfo.lazy_bind_size)
 
 				if (
 					record is None
@@ -1237,7 +1694,7 @@ class _StubFixer(object):
 					or record.segment is None
 					or record.offset is None
 				):
-					self._logger.warning(f"Bind record for stub helper is incomplete: {record}")  # noqa
+					self._logger.warning("Bind record for stub helper is incomplete: %s", record)  # noqa
 					helperAddr += REG_HELPER_SIZE
 					continue
 
@@ -1255,12 +1712,12 @@ class _StubFixer(object):
 			if resolverInfo := self._arm64Utils.getResolverData(helperAddr):
 				# it shouldn't need fixing but check it just in case.
 				if not self._machoCtx.containsAddr(resolverInfo[0]):
-					self._logger.warning(f"Unable to fix resolver at {hex(helperAddr)}")
+					self._logger.warning("Unable to fix resolver at %#x", helperAddr)
 
 				helperAddr += resolverInfo[1]  # add by resolver size
 				continue
 
-			self._logger.warning(f"Unknown stub helper format at {hex(helperAddr)}")
+			self._logger.warning("Unknown stub helper format at %#x", helperAddr)
 			helperAddr += REG_HELPER_SIZE
 			pass
 		pass
@@ -1306,6 +1763,7 @@ class _StubFixer(object):
 						segment.seg.filesize += sect.size
 						self._machoCtx.writeBytes(sect._fileOff_, sect)
 						self._machoCtx.writeBytes(segment.seg._fileOff_, segment.seg)
+						self._machoCtx.invalidateAddrIndex()
 
 						for i, (key, targets) in enumerate(symbolPtrs.items()):
 							self._statusBar.update(status="Fixing Stubs")
@@ -1374,7 +1832,7 @@ class _StubFixer(object):
 							pass
 
 						if not stubNames:
-							self._logger.warning(f"Unable to symbolize stub at {hex(stubAddr)}")
+							self._logger.warning("Unable to symbolize stub at %#x", stubAddr)
 							continue
 
 						for name in stubNames:
@@ -1396,7 +1854,7 @@ class _StubFixer(object):
 							pass
 
 						if not symPtrAddr:
-							self._logger.warning(f"Unable to find a symbol pointer for stub at {hex(stubAddr)}, with names {stubNames}")  # noqa
+							self._logger.warning("Unable to find a symbol pointer for stub at %#x, with names %s", stubAddr, stubNames)  # noqa
 							continue
 
 						# relink the stub if necessary
@@ -1440,12 +1898,12 @@ class _StubFixer(object):
 							elif stubFormat == _StubFormat.AuthStubResolver:
 								# These shouldn't need fixing but check just in case
 								if not self._machoCtx.containsAddr(stubData[0]):
-									self._logger.error(f"Unable to fix auth stub resolver at {hex(stubAddr)}")  # noqa
+									self._logger.error("Unable to fix auth stub resolver at %#x", stubAddr)  # noqa
 								continue
 
 							elif stubFormat == _StubFormat.Resolver:
 								# how did we get here???
-								self._logger.warning(f"Encountered a resolver at {hex(stubAddr)} while fixing stubs")  # noqa
+								self._logger.warning("Encountered a resolver at %#x while fixing stubs", stubAddr)  # noqa
 								continue
 
 							elif stubFormat == _StubFormat.AuthStubBRAA:
@@ -1460,10 +1918,10 @@ class _StubFixer(object):
 								continue
 
 							else:
-								self._logger.error(f"Unknown stub format: {stubFormat}, at {hex(stubAddr)}")  # noqa
+								self._logger.error("Unknown stub format: %s, at %#x", stubFormat, stubAddr)  # noqa
 								continue
 						else:
-							self._logger.warning(f"Unknown stub format at {hex(stubAddr)}")
+							self._logger.warning("Unknown stub format at %#x", stubAddr)
 							continue
 					pass
 				pass
@@ -1525,7 +1983,7 @@ class _StubFixer(object):
 				):
 					continue
 
-				self._logger.warning(f"Unable to symbolize branch at {hex(brAddr)}, targeting {hex(brTargetFunc)}")  # noqa
+				self._logger.warning("Unable to symbolize branch at %#x, targeting %#x", brAddr, brTargetFunc)  # noqa
 				continue
 
 			stubSymbol = next((sym for sym in funcSymbols if sym in stubMap), None)
@@ -1539,7 +1997,7 @@ class _StubFixer(object):
 				):
 					continue
 
-				self._logger.warning(f"Unable to find a stub for branch at {hex(brAddr)}, potential symbols: {funcSymbols}")  # noqa
+				self._logger.warning("Unable to find a stub for branch at %#x, potential symbols: %s", brAddr, funcSymbols)  # noqa
 				continue
 
 			# repoint the branch to the stub
@@ -1577,6 +2035,15 @@ class _StubFixer(object):
 		currentSymbolIndex = self._dysymtab.iundefsym + self._dysymtab.nundefsym
 		currentStringIndex = self._symtab.strsize
 
+		# Each entry is a 32bit index into the symbol table
+		indirectSymbols = np.frombuffer(
+			linkeditFile.getBytes(
+				self._dysymtab.indirectsymoff,
+				self._dysymtab.nindirectsyms * 4
+			),
+			dtype="<u4"
+		).copy()
+
 		newSymbols = bytearray()
 		newStrings = bytearray()
 
@@ -1587,22 +2054,19 @@ class _StubFixer(object):
 				if sectType == S_SYMBOL_STUBS:
 					indirectStart = sect.reserved1
 					indirectEnd = sect.reserved1 + int(sect.size / sect.reserved2)
-					for i in range(indirectStart, indirectEnd):
-						self._statusBar.update()
-
-						entryOffset = self._dysymtab.indirectsymoff + (i * 4)
-						entry = linkeditFile.readFormat("<I", entryOffset)[0]
-
-						if entry != 0:
-							continue
+					self._statusBar.update()
 
+					redactedEntries = np.flatnonzero(
+						indirectSymbols[indirectStart:indirectEnd] == 0
+					) + indirectStart
+					for i in redactedEntries.tolist():
 						stubAddr = sect.addr + ((i - indirectStart) * sect.reserved2)
 						stubSymbol = next(
 							(sym for (sym, ptrs) in stubMap.items() if stubAddr in ptrs),
 							None
 						)
 						if not stubSymbol:
-							self._logger.warning(f"Unable to symbolize indirect stub symbol at {hex(stubAddr)}, indirect symbol index {i}")  # noqa
+							self._logger.warning("Unable to symbolize indirect stub symbol at %#x, indirect symbol index %s", stubAddr, i)  # noqa
 							continue
 
 						# create the entry and add the string
@@ -1614,10 +2078,7 @@ class _StubFixer(object):
 						currentStringIndex += len(stubSymbol)
 
 						# update the indirect entry and add it
-						linkeditFile.writeBytes(
-							entryOffset,
-							struct.pack("<I", currentSymbolIndex)
-						)
+						indirectSymbols[i] = currentSymbolIndex
 
 						newSymbols.extend(newSymbolEntry)
 						currentSymbolIndex += 1
@@ -1630,23 +2091,19 @@ class _StubFixer(object):
 				):
 					indirectStart = sect.reserved1
 					indirectEnd = sect.reserved1 + int(sect.size / 8)
+					self._statusBar.update()
 
-					for i in range(indirectStart, indirectEnd):
-						self._statusBar.update()
-
-						entryOffset = self._dysymtab.indirectsymoff + (i * 4)
-						entry = linkeditFile.readFormat("<I", entryOffset)[0]
-
-						if entry != 0:
-							continue
-
+					redactedEntries = np.flatnonzero(
+						indirectSymbols[indirectStart:indirectEnd] == 0
+					) + indirectStart
+					for i in redactedEntries.tolist():
 						ptrAddr = sect.addr + ((i - indirectStart) * 8)
 						ptrSymbol = next(
 							(sym for (sym, ptrs) in symbolPtrs.items() if ptrAddr in ptrs),
 							None
 						)
 						if not ptrSymbol:
-							self._logger.warning(f"Unable to symbolize pointer at {hex(ptrAddr)}, indirect entry index {i}")  # noqa
+							self._logger.warning("Unable to symbolize pointer at %#x, indirect entry index %s", ptrAddr, i)  # noqa
 							continue
 
 						# create the entry and add the string
@@ -1658,10 +2115,7 @@ class _StubFixer(object):
 						currentStringIndex += len(ptrSymbol)
 
 						# update the indirect entry and add it
-						linkeditFile.writeBytes(
-							entryOffset,
-							struct.pack("<I", currentSymbolIndex)
-						)
+						indirectSymbols[i] = currentSymbolIndex
 
 						newSymbols.extend(newSymbolEntry)
 						currentSymbolIndex += 1
@@ -1674,32 +2128,18 @@ class _StubFixer(object):
 				):
 					indirectStart = sect.reserved1
 					indirectEnd = sect.reserved1 + int(sect.size / 8)
+					self._statusBar.update()
 
-					for i in range(indirectStart, indirectEnd):
-						self._statusBar.update()
-
-						entryOffset = self._dysymtab.indirectsymoff + (i * 4)
-						entry = linkeditFile.readFormat("<I", entryOffset)[0]
-
-						if entry != 0:
-							continue
-
+					if np.any(indirectSymbols[indirectStart:indirectEnd] == 0):
 						raise NotImplementedError
 					pass
 
 				elif sectType == S_16BYTE_LITERALS:
 					indirectStart = sect.reserved1
 					indirectEnd = sect.reserved1 + int(sect.size / 16)
+					self._statusBar.update()
 
-					for i in range(indirectStart, indirectEnd):
-						self._statusBar.update()
-
-						entryOffset = self._dysymtab.indirectsymoff + (i * 4)
-						entry = linkeditFile.readFormat("<I", entryOffset)[0]
-
-						if entry != 0:
-							continue
-
+					if np.any(indirectSymbols[indirectStart:indirectEnd] == 0):
 						raise NotImplementedError
 					pass
 
@@ -1719,6 +2159,10 @@ class _StubFixer(object):
 		self._statusBar.update()
 
 		# add the new data and update the load commands
+		linkeditFile.writeBytes(
+			self._dysymtab.indirectsymoff,
+			indirectSymbols.tobytes()
+		)
 		linkeditFile.writeBytes(
 			self._symtab.symoff + (self._symtab.nsyms * nlist_64.SIZE),
 			newSymbols
@@ -1738,6 +2182,7 @@ class _StubFixer(object):
 		linkedit = self._machoCtx.segments[b"__LINKEDIT"].seg
 		linkedit.vmsize += newStringSize
 		linkedit.filesize += newStringSize
+		self._machoCtx.invalidateAddrIndex()
 
 		self._statusBar.update()
 		pass
@@ -1750,5 +2195,5 @@ def fixStubs(extractionCtx: ExtractionContext) -> None:
 	try:
 		_StubFixer(extractionCtx).run()
 	except _StubFixerError as e:
-		extractionCtx.logger.error(f"Unable to fix stubs, reason: {e}")
+		extractionCtx.logger.error("Unable to fix stubs, reason: %s", e)
 	pass
@@ -0,0 +1,145 @@
+import dataclasses
+import logging
+from typing import (
+	Dict,
+	List,
+	Tuple,
+	Union
+)
+
+
+# The default number of records kept for each category.
+MAX_EXAMPLES = 3
+
+
+@dataclasses.dataclass
+class Diagnostic(object):
+	"""A category of log records, with the first few of them.
+	"""
+
+	levelname: str
+
+	# The unformatted message.
+	category: str
+
+	# The file and line that logged it.
+	location: str
+
+	count: int
+	examples: List[str]
+	pass
+
+
+class DiagnosticsCollector(logging.Handler):
+
+	def __init__(
+		self,
+		maxExamples: int = MAX_EXAMPLES,
+		level: int = logging.NOTSET
+	) -> None:
+		"""A logging handler that counts records by category.
+
+		The category of a record is its unformatted message and where it
+		was logged. Only the first few records of a category are kept,
+		and they are only formatted when the diagnostics are collected.
+
+		Args:
+			maxExamples: Optional; The number of records kept for each
+				category.
+			level: Optional; The level of the handler.
+		"""
+
+		super().__init__(level)
+
+		self.maxExamples = maxExamples
+
+		# Maps a category to its levelname, count and examples.
+		self._categories: Dict[
+			Tuple[str, int, str],
+			Tuple[str, List[int], List[Union[logging.LogRecord, str]]]
+		] = {}
+		pass
+
+	def emit(self, record: logging.LogRecord) -> None:
+		key = (record.pathname, record.lineno, str(record.msg))
+
+		category = self._categories.get(key)
+		if category is None:
+			category = (record.levelname, [0], [])
+			self._categories[key] = category
+			pass
+
+		_, count, examples = category
+		count[0] += 1
+
+		if len(examples) < self.maxExamples:
+			if record.exc_info:
+				# don't keep the frames of the traceback alive
+				examples.append(self.format(record))
+			else:
+				examples.append(record)
+			pass
+		pass
+
+	def getDiagnostics(self) -> List[Diagnostic]:
+		"""Get the categories in the order they were first logged.
+
+		Returns:
+			Diagnostics that only contain strings, which are cheap to
+			send to another process.
+		"""
+
+		diagnostics: List[Diagnostic] = []
+		for (pathname, lineno, message), category in self._categories.items():
+			levelname, count, examples = category
+			diagnostics.append(Diagnostic(
+				levelname,
+				message,
+				f"{pathname.split('/')[-1]}:{lineno}",
+				count[0],
+				[
+					example if isinstance(example, str) else self.format(example)
+					for example in examples
+				]
+			))
+			pass
+
+		return diagnostics
+	pass
+
+
+def formatDiagnostics(diagnostics: List[Diagnostic]) -> str:
+	"""Format the diagnostics of a collector.
+
+	Returns:
+		The examples of each category, followed by the number of records
+		that were left out.
+	"""
+
+	lines: List[str] = []
+	for diagnostic in diagnostics:
+		lines.extend(diagnostic.examples)
+
+		remaining = diagnostic.count - len(diagnostic.examples)
+		if remaining > 0:
+			lines.append(f"... {remaining} more [{diagnostic.levelname}] {diagnostic.location} : {diagnostic.category}")  # noqa
+			pass
+		pass
+
+	return "".join(line + "\n" for line in lines)
+
+
+def summarizeDiagnostics(diagnostics: List[Diagnostic]) -> str:
+	"""Count the records of each level.
+
+	Returns:
+		The counts, like "12 WARNING, 1 ERROR", or an empty string if
+		there are no records.
+	"""
+
+	counts: Dict[str, int] = {}
+	for diagnostic in diagnostics:
+		counts[diagnostic.levelname] = counts.get(diagnostic.levelname, 0) + diagnostic.count
+		pass
+
+	return ", ".join(f"{count} {levelname}" for levelname, count in counts.items())
@@ -0,0 +1,156 @@
+import bisect
+import ctypes
+import os
+import struct
+from typing import (
+	List,
+	Tuple,
+	BinaryIO
+)
+
+from DyldExtractor.dyld.dyld_structs import (
+	dyld_cache_header,
+	dyld_cache_image_info
+)
+
+
+# The longest path that is read for an image
+_MAX_PATH_SIZE = 1024
+
+
+def _pread(fileObject: BinaryIO, size: int, offset: int) -> bytes:
+	"""Read from a file without reading the rest of it.
+	"""
+
+	if hasattr(os, "pread"):
+		return os.pread(fileObject.fileno(), size, offset)
+
+	# pread is not available on windows
+	fileObject.seek(offset)
+	return fileObject.read(size)
+
+
+class DyldImageTable(object):
+
+	def __init__(self, fileObject: BinaryIO) -> None:
+		"""The image paths and addresses of a dyld cache.
+
+		Only the header, the image infos, and the path strings are read,
+		which makes this much cheaper than a DyldContext when only the
+		images are needed.
+
+		Args:
+			fileObject: An open dyld file, the main cache in the case of
+				sub caches.
+
+		Raises:
+			ValueError: If the file is not a dyld cache.
+		"""
+
+		super().__init__()
+
+		headerSize = ctypes.sizeof(dyld_cache_header)
+		headerData = bytearray(headerSize)
+		data = _pread(fileObject, headerSize, 0)
+		headerData[0:len(data)] = data
+		self.header = dyld_cache_header(headerData)
+
+		if self.header.magic[0:4] != b"dyld":
+			raise ValueError("Cache's magic does not start with 'dyld', most likely given a file that's not a cache or the file is broken.")  # noqa
+
+		# The mapping info is directly after the header, so newer fields
+		# are only valid if they are before it.
+		if dyld_cache_header.imagesCount.offset < self.header.mappingOffset:
+			imagesCount = self.header.imagesCount
+			imagesOffset = self.header.imagesOffset
+			pass
+		else:
+			imagesCount = self.header.imagesCountOld
+			imagesOffset = self.header.imagesOffsetOld
+			pass
+
+		imagesData = _pread(
+			fileObject,
+			imagesCount * dyld_cache_image_info.SIZE,
+			imagesOffset
+		)
+
+		self.addresses: List[int] = []
+		pathOffsets: List[int] = []
+		for address, _, _, pathOffset, _ in struct.iter_unpack(
+			"<QQQII",
+			imagesData
+		):
+			self.addresses.append(address)
+			pathOffsets.append(pathOffset)
+			pass
+
+		# The path strings are usually packed together, read them at once.
+		self.paths: List[str] = []
+		if pathOffsets:
+			pathsStart = min(pathOffsets)
+			pathsData = _pread(
+				fileObject,
+				max(pathOffsets) - pathsStart + _MAX_PATH_SIZE,
+				pathsStart
+			)
+
+			for pathOffset in pathOffsets:
+				start = pathOffset - pathsStart
+				end = pathsData.find(b"\x00", start)
+				if end == -1:
+					end = len(pathsData)
+				self.paths.append(pathsData[start:end].decode("utf-8"))
+				pass
+			pass
+
+		# image indexes sorted by address for lookups
+		self._sortedIndexes = sorted(
+			range(len(self.addresses)),
+			key=lambda i: self.addresses[i]
+		)
+		self._sortedAddresses = [self.addresses[i] for i in self._sortedIndexes]
+		pass
+
+	def __len__(self) -> int:
+		return len(self.addresses)
+
+	def imagesByAddress(self) -> List[Tuple[int, str]]:
+		"""Get the address and path of every image, in address order.
+		"""
+
+		return [(self.addresses[i], self.paths[i]) for i in self._sortedIndexes]
+
+	def lookup(self, address: int) -> int:
+		"""Find the image that an address lives in.
+
+		Images are assumed to extend to the start of the next image,
+		and the last image to the end of the cache.
+
+		Args:
+			address: The VM address to lookup.
+
+		Returns:
+			The index of the image, or None if the address is before
+			the first image.
+		"""
+
+		i = bisect.bisect_right(self._sortedAddresses, address)
+		if i == 0:
+			return None
+
+		return self._sortedIndexes[i - 1]
+
+	def findImages(self, filterTerm: str) -> List[int]:
+		"""Find images that contain a term in their path.
+
+		Args:
+			filterTerm: The case insensitive term to search for.
+
+		Returns:
+			The indexes of the matching images, in image order.
+		"""
+
+		filterTerm = filterTerm.lower()
+		return [i for i, path in enumerate(self.paths) if filterTerm in path.lower()]
+	pass
@@ -0,0 +1,332 @@
+import dataclasses
+import logging
+import numpy as np
+from typing import (
+	Dict,
+	Iterable,
+	List,
+	Tuple
+)
+
+from DyldExtractor.dyld import dyld_trie
+from DyldExtractor.dyld.dyld_context import DyldContext
+from DyldExtractor.dyld.dyld_structs import dyld_cache_local_symbols_info
+from DyldExtractor.macho.macho_context import MachOContext
+from DyldExtractor.macho.macho_constants import *
+from DyldExtractor.macho.macho_structs import (
+	dyld_info_command,
+	linkedit_data_command,
+	NLIST_64_DTYPE
+)
+
+
+_LOCAL_SYMBOLS_ENTRY_DTYPE = np.dtype([
+	("dylibOffset", "<u4"),
+	("nlistStartIndex", "<u4"),
+	("nlistCount", "<u4"),
+])
+
+_LOCAL_SYMBOLS_ENTRY64_DTYPE = np.dtype([
+	("dylibOffset", "<u8"),
+	("nlistStartIndex", "<u4"),
+	("nlistCount", "<u4"),
+])
+
+
+@dataclasses.dataclass
+class Symbolication(object):
+	address: int
+	imagePath: str = None
+	imageOffset: int = None
+	symbol: bytes = None
+	symbolOffset: int = None
+	pass
+
+
+class _ImageSymbols(object):
+
+	def __init__(
+		self,
+		exportAddrs: np.ndarray,
+		exportNames: List[bytes],
+		localAddrs: np.ndarray,
+		localStrx: np.ndarray
+	) -> None:
+		"""The sorted symbols of an image.
+
+		Local symbol names are only read when they are needed.
+		"""
+
+		super().__init__()
+
+		exportOrder = np.argsort(exportAddrs, kind="stable")
+		self.exportAddrs = exportAddrs[exportOrder]
+		self.exportNames = [exportNames[i] for i in exportOrder]
+
+		localOrder = np.argsort(localAddrs, kind="stable")
+		self.localAddrs = localAddrs[localOrder]
+		self.localStrx = localStrx[localOrder]
+		pass
+	pass
+
+
+class DyldSymbolicator(object):
+
+	def __init__(self, dyldCtx: DyldContext, logger: logging.Logger) -> None:
+		"""Symbolicate addresses in a dyld cache.
+
+		The images are indexed once, and the symbols of an image are
+		indexed the first time an address lands in it. Exports are read
+		from the export trie and locals from the local symbols info.
+
+		Args:
+			dyldCtx: The cache, with any sub caches already added.
+			logger: Used to report images that can't be read.
+		"""
+
+		super().__init__()
+
+		self._dyldCtx = dyldCtx
+		self._logger = logger
+
+		imageAddrs = np.array(
+			[image.address for image in dyldCtx.images],
+			dtype=np.uint64
+		)
+		self._imageOrder = np.argsort(imageAddrs, kind="stable")
+		self._imageAddrs = imageAddrs[self._imageOrder]
+		self._imagePaths: Dict[int, str] = {}
+		self._imageSymbols: Dict[int, _ImageSymbols] = {}
+
+		self._readLocalSymbolsInfo()
+		pass
+
+	def symbolicate(self, addresses: Iterable[int]) -> List[Symbolication]:
+		"""Symbolicate a batch of addresses.
+
+		Args:
+			addresses: The VM addresses to symbolicate.
+
+		Returns:
+			A Symbolication for each address, in the same order. Fields
+			that could not be found are None.
+		"""
+
+		addresses = list(addresses)
+		results = [Symbolication(address) for address in addresses]
+		if not addresses or not len(self._imageAddrs):
+			return results
+
+		addrArray = np.array(addresses, dtype=np.uint64)
+		imageSlots = np.searchsorted(self._imageAddrs, addrArray, side="right") - 1
+
+		# group the addresses by image, so that each image is only indexed once
+		for slot in np.unique(imageSlots):
+			if slot < 0:
+				# before the first image
+				continue
+
+			imageIndex = int(self._imageOrder[slot])
+			imageAddr = int(self._imageAddrs[slot])
+			imagePath = self._getImagePath(imageIndex)
+			symbols = self._getImageSymbols(imageIndex)
+
+			resultIndexes = np.flatnonzero(imageSlots == slot)
+			imageAddresses = addrArray[resultIndexes]
+
+			exportSlots = np.searchsorted(
+				symbols.exportAddrs,
+				imageAddresses,
+				side="right"
+			) - 1
+			localSlots = np.searchsorted(
+				symbols.localAddrs,
+				imageAddresses,
+				side="right"
+			) - 1
+
+			for resultIndex, exportSlot, localSlot in zip(
+				resultIndexes,
+				exportSlots,
+				localSlots
+			):
+				result = results[resultIndex]
+				result.imagePath = imagePath
+				result.imageOffset = result.address - imageAddr
+
+				# use the closest symbol, preferring exports
+				exportAddr = -1
+				if exportSlot >= 0:
+					exportAddr = int(symbols.exportAddrs[exportSlot])
+				localAddr = -1
+				if localSlot >= 0:
+					localAddr = int(symbols.localAddrs[localSlot])
+
+				if exportAddr != -1 and exportAddr >= localAddr:
+					result.symbol = symbols.exportNames[exportSlot]
+					result.symbolOffset = result.address - exportAddr
+				elif localAddr != -1:
+					strx = int(symbols.localStrx[localSlot])
+					result.symbol = self._readLocalName(strx)
+					result.symbolOffset = result.address - localAddr
+				pass
+			pass
+
+		return results
+
+	def _getImagePath(self, imageIndex: int) -> str:
+		if imageIndex not in self._imagePaths:
+			image = self._dyldCtx.images[imageIndex]
+			path = self._dyldCtx.readString(image.pathFileOffset)[0:-1]
+			self._imagePaths[imageIndex] = path.decode("utf-8")
+			pass
+
+		return self._imagePaths[imageIndex]
+
+	def _readLocalSymbolsInfo(self) -> None:
+		"""Index the local symbols entries by their dylib offset.
+		"""
+
+		self._localEntries: Dict[int, Tuple[int, int]] = {}
+		self._localsUseVMOffset = self._dyldCtx.headerContainsField("symbolFileUUID")
+
+		symbolsCache = self._dyldCtx.getSymbolsCache()
+		if not symbolsCache or symbolsCache.header.localSymbolsOffset == 0:
+			self._logger.warning("Symbols Cache doesn't contain local symbols.")
+			return
+
+		self._symbolsCache = symbolsCache
+		self._localSymbolsInfo = dyld_cache_local_symbols_info(
+			symbolsCache.file,
+			symbolsCache.header.localSymbolsOffset
+		)
+
+		# Newer caches use the vm offset to the mach header,
+		# older ones use the file offset.
+		if self._localsUseVMOffset:
+			entryDtype = _LOCAL_SYMBOLS_ENTRY64_DTYPE
+		else:
+			entryDtype = _LOCAL_SYMBOLS_ENTRY_DTYPE
+
+		entries = np.frombuffer(
+			symbolsCache.file,
+			dtype=entryDtype,
+			count=self._localSymbolsInfo.entriesCount,
+			offset=(
+				self._localSymbolsInfo._fileOff_
+				+ self._localSymbolsInfo.entriesOffset
+			)
+		)
+
+		for dylibOffset, start, count in entries.tolist():
+			self._localEntries[dylibOffset] = (start, count)
+			pass
+		pass
+
+	def _readLocalName(self, strx: int) -> bytes:
+		stringsOff = (
+			self._localSymbolsInfo._fileOff_
+			+ self._localSymbolsInfo.stringsOffset
+		)
+		return self._symbolsCache.readString(stringsOff + strx)[0:-1]
+
+	def _getImageSymbols(self, imageIndex: int) -> _ImageSymbols:
+		if imageIndex in self._imageSymbols:
+			return self._imageSymbols[imageIndex]
+
+		image = self._dyldCtx.images[imageIndex]
+		imageOff, context = self._dyldCtx.convertAddr(image.address)
+		machoCtx = MachOContext(context.fileObject, imageOff, lazy=True)
+
+		exportAddrs, exportNames = self._readExports(imageIndex, machoCtx)
+
+		if self._localsUseVMOffset:
+			dylibOffset = image.address - self._dyldCtx.header.sharedRegionStart
+		else:
+			dylibOffset = imageOff
+
+		localAddrs = np.zeros(0, dtype=np.uint64)
+		localStrx = np.zeros(0, dtype=np.uint32)
+		if dylibOffset in self._localEntries:
+			start, count = self._localEntries[dylibOffset]
+			nlists = np.frombuffer(
+				self._symbolsCache.file,
+				dtype=NLIST_64_DTYPE,
+				count=count,
+				offset=(
+					self._localSymbolsInfo._fileOff_
+					+ self._localSymbolsInfo.nlistOffset
+					+ (start * NLIST_64_DTYPE.itemsize)
+				)
+			)
+
+			# only symbols defined in a section
+			defined = (
+				((nlists["n_type"] & N_STAB) == 0)
+				& ((nlists["n_type"] & N_TYPE) == N_SECT)
+			)
+			localAddrs = nlists["n_value"][defined]
+			localStrx = nlists["n_strx"][defined]
+			pass
+
+		symbols = _ImageSymbols(exportAddrs, exportNames, localAddrs, localStrx)
+		self._imageSymbols[imageIndex] = symbols
+		return symbols
+
+	def _readExports(
+		self,
+		imageIndex: int,
+		machoCtx: MachOContext
+	) -> Tuple[np.ndarray, List[bytes]]:
+		"""Read the exports of an image.
+
+		Returns:
+			The export addresses and their names.
+		"""
+
+		exportOff = None
+		exportSize = None
+
+		dyldInfo: dyld_info_command = machoCtx.getDyldInfo()
+		exportTrie: linkedit_data_command = machoCtx.getExportsTrie()
+
+		if dyldInfo and dyldInfo.export_size:
+			exportOff = dyldInfo.export_off
+			exportSize = dyldInfo.export_size
+		elif exportTrie and exportTrie.datasize:
+			exportOff = exportTrie.dataoff
+			exportSize = exportTrie.datasize
+
+		if exportOff is None:
+			return np.zeros(0, dtype=np.uint64), []
+
+		linkeditFile = self._dyldCtx.convertAddr(
+			machoCtx.segments[b"__LINKEDIT"].seg.vmaddr
+		)[1].file
+
+		try:
+			exports = dyld_trie.ReadExports(linkeditFile, exportOff, exportSize)
+		except dyld_trie.ExportReaderError as e:
+			self._logger.warning("Unable to read exports of %s, reason: %s", self._getImagePath(imageIndex), e)  # noqa
+			return np.zeros(0, dtype=np.uint64), []
+
+		imageAddr = self._dyldCtx.images[imageIndex].address
+		addrs = []
+		names = []
+		for export in exports:
+			if export.flags & EXPORT_SYMBOL_FLAGS_REEXPORT or not export.address:
+				continue
+
+			addrs.append(imageAddr + export.address)
+			names.append(bytes(export.name[0:-1]))
+
+			if export.flags & EXPORT_SYMBOL_FLAGS_STUB_AND_RESOLVER:
+				# The address points to the stub, while "other" points
+				# to the function itself. Add the function as well.
+				addrs.append(imageAddr + export.other)
+				names.append(bytes(export.name[0:-1]))
+				pass
+			pass
+
+		return np.array(addrs, dtype=np.uint64), names
+	pass
@@ -1,5 +1,8 @@
 import struct
 import mmap
+import os
+import threading
+import weakref
 
 from typing import (
 	Any,
@@ -8,6 +11,65 @@ from typing import (
 )
 
 
+class _MappingPool(object):
+
+	def __init__(self) -> None:
+		"""A process wide registry of file mappings.
+
+		Read only mappings are shared between all contexts that map the
+		same file, instead of mapping the whole file again for each one.
+		Mappings are only kept alive while a context still references them.
+		"""
+
+		super().__init__()
+
+		self._mappings: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+		self._lock = threading.Lock()
+		pass
+
+	@staticmethod
+	def getFileKey(fileObject: BinaryIO) -> Tuple[int, int]:
+		"""Get a key that identifies the file behind the file object.
+
+		Returns:
+			A tuple containing the device and inode of the file.
+		"""
+
+		stat = os.fstat(fileObject.fileno())
+		return (stat.st_dev, stat.st_ino)
+
+	def getMapping(self, fileObject: BinaryIO, access: int) -> mmap.mmap:
+		"""Get a mapping of the whole file.
+
+		Args:
+			fileObject: The file to map.
+			access: The mmap access mode.
+
+		Returns:
+			A shared mapping if the access mode is read only, otherwise
+			a new private mapping.
+		"""
+
+		if access != mmap.ACCESS_READ:
+			# writable and copy on write mappings can't be shared.
+			return mmap.mmap(fileObject.fileno(), 0, access=access)
+
+		key = (self.getFileKey(fileObject), access)
+		with self._lock:
+			mapping = self._mappings.get(key)
+			if mapping is None or mapping.closed:
+				mapping = mmap.mmap(fileObject.fileno(), 0, access=access)
+				self._mappings[key] = mapping
+				pass
+			pass
+
+		return mapping
+	pass
+
+
+mappingPool = _MappingPool()
+
+
 class FileContext:
 
 	def __init__(
@@ -16,10 +78,10 @@ class FileContext:
 		copyMode: bool = False
 	) -> None:
 		self.fileObject = fileObject
-		self.file = mmap.mmap(
-			fileObject.fileno(),
-			0,
-			access=mmap.ACCESS_COPY if copyMode else mmap.ACCESS_READ
+		self.fileKey = mappingPool.getFileKey(fileObject)
+		self.file = mappingPool.getMapping(
+			fileObject,
+			mmap.ACCESS_COPY if copyMode else mmap.ACCESS_READ
 		)
 		pass
 
@@ -29,7 +29,7 @@ class KCContext(CacheContext):
 
 		super().__init__(fileObject, copyMode=copyMode)
 		
-		machoCtx = MachOContext(fileObject, 0, False)
+		machoCtx = MachOContext(fileObject, 0, False, lazy=True)
 		self._machoCtx = machoCtx
 		self.header = machoCtx.header
 
@@ -0,0 +1,107 @@
+import logging
+import numpy as np
+from typing import (
+	Dict,
+	List
+)
+
+from DyldExtractor.kc.kc_context import KCContext
+from DyldExtractor.macho.macho_context import MachOContext
+
+from DyldExtractor.macho.macho_structs import (
+	NLIST_64_DTYPE,
+	symtab_command
+)
+
+
+class KCSymbolIndex(object):
+
+	SHARED_DATA_NAME = "kcSymbolIndex"
+
+	def __init__(self) -> None:
+		"""The symbols of every fileset entry in a kernelcache.
+
+		Maps each address to the symbols defined at it, and to the
+		fileset entries that define them.
+		"""
+
+		super().__init__()
+
+		# Maps an address to the symbols at the address, in the
+		# order of the fileset entries and their symbol tables.
+		self.symbols: Dict[int, List[bytes]] = {}
+
+		# Which kext owns each symbol. Maps an address to the index in
+		# KCContext.images of the fileset entry of each of its symbols,
+		# parallel to the list in symbols.
+		self.owners: Dict[int, List[int]] = {}
+		pass
+
+	@classmethod
+	def build(cls, kcCtx: KCContext, logger: logging.Logger) -> "KCSymbolIndex":
+		"""Read the symbol tables of all the fileset entries.
+
+		Args:
+			kcCtx: The kernelcache.
+			logger: Used to report invalid symbols.
+
+		Returns:
+			The symbol index.
+		"""
+
+		index = cls()
+		for imageIndex, image in enumerate(kcCtx.images):
+			machoOffset, context = kcCtx.convertAddr(image.address)
+			machoCtx = MachOContext(context.fileObject, machoOffset, lazy=True)
+			index._addSymbols(imageIndex, machoCtx, logger)
+			pass
+
+		return index
+
+	def _addSymbols(
+		self,
+		imageIndex: int,
+		machoCtx: MachOContext,
+		logger: logging.Logger
+	) -> None:
+		symtab: symtab_command = machoCtx.getSymtab()
+		if not symtab:
+			logger.warning("Unable to find LC_SYMTAB.")
+			return
+
+		linkeditFile = machoCtx.ctxForAddr(
+			machoCtx.segments[b"__LINKEDIT"].seg.vmaddr
+		)
+
+		symbols = np.frombuffer(
+			linkeditFile.file,
+			dtype=NLIST_64_DTYPE,
+			count=symtab.nsyms,
+			offset=symtab.symoff
+		)
+		symbolAddrs = symbols["n_value"]
+
+		definedSymbols = symbolAddrs != 0
+		validSymbols = definedSymbols & machoCtx.containsAddrs(symbolAddrs)
+
+		for i in np.flatnonzero(definedSymbols & ~validSymbols):
+			symbol = linkeditFile.readString(symtab.stroff + int(symbols["n_strx"][i]))
+			logger.warning("Invalid address: %s, for symbol entry: %s.", int(symbolAddrs[i]), symbol)  # noqa
+			pass
+
+		validIndexes = np.flatnonzero(validSymbols)
+		for symbolAddr, strx in zip(
+			symbolAddrs[validIndexes].tolist(),
+			symbols["n_strx"][validIndexes].tolist()
+		):
+			symbol = bytes(linkeditFile.readString(symtab.stroff + strx))
+
+			if symbolAddr in self.symbols:
+				self.symbols[symbolAddr].append(symbol)
+				self.owners[symbolAddr].append(imageIndex)
+			else:
+				self.symbols[symbolAddr] = [symbol]
+				self.owners[symbolAddr] = [imageIndex]
+			pass
+		pass
+	pass
@@ -1,11 +1,14 @@
 import struct
+import bisect
+import numpy as np
 from typing import (
 	Union,
 	List,
 	Dict,
 	Tuple,
 	BinaryIO,
-	Protocol
+	Protocol,
+	Optional
 )
 
 from DyldExtractor.file_context import FileContext
@@ -15,9 +18,13 @@ from DyldExtractor.macho.macho_structs import (
 	LoadCommandMap,
 	LoadCommands,
 	load_command,
-	UnknownLoadCommand,
 	mach_header_64,
-	segment_command_64
+	segment_command_64,
+	section_64,
+	symtab_command,
+	dysymtab_command,
+	dyld_info_command,
+	linkedit_data_command
 )
 
 
@@ -28,16 +35,12 @@ class MappingInfo(Protocol):
 
 class MachOContext(FileContext):
 
-	loadCommands: List[load_command]
-
-	segments: Dict[bytes, SegmentContext]
-	segmentsI: List[SegmentContext]
-
 	def __init__(
 		self,
 		fileObject: BinaryIO,
 		offset: int = 0,
-		copyMode: bool = False
+		copyMode: bool = False,
+		lazy: bool = False
 	) -> None:
 		"""A wrapper around a MachO file.
 
@@ -46,10 +49,15 @@ class MachOContext(FileContext):
 		Args:
 			file: The macho file.
 			offset: The offset to the header in the file.
+			copyMode: Optional; Make a private writable copy of the file.
+			lazy: Optional; Only index the load commands, and create them,
+				the segments, and the sections when they are first accessed.
+				Useful for read only contexts that only need a few commands.
 		"""
 
 		super().__init__(fileObject, copyMode=copyMode)
 		self.fileOffset = offset
+		self._lazy = lazy
 
 		self.header = mach_header_64(self.file, self.fileOffset)
 		self._mappings: List[Tuple[MappingInfo, "MachOContext"]] = []
@@ -62,6 +70,28 @@ class MachOContext(FileContext):
 		self._parseLoadCommands()
 		pass
 
+	@property
+	def loadCommands(self) -> List[load_command]:
+		if self._loadCommands is None:
+			self._loadCommands = [
+				self._getCommandAt(cmdOff) for cmdOff, _ in self._commandIndex
+			]
+			pass
+
+		return self._loadCommands
+
+	@property
+	def segments(self) -> Dict[bytes, SegmentContext]:
+		if self._segments is None:
+			self._createSegments()
+		return self._segments
+
+	@property
+	def segmentsI(self) -> List[SegmentContext]:
+		if self._segmentsI is None:
+			self._createSegments()
+		return self._segmentsI
+
 	def getLoadCommand(
 		self,
 		cmdFilter: Tuple[LoadCommands],
@@ -79,18 +109,59 @@ class MachOContext(FileContext):
 			of matches.
 		"""
 
-		matches = []
-		for loadCommand in self.loadCommands:
-			if loadCommand.cmd in cmdFilter:
-				if not multiple:
-					return loadCommand
-				else:
-					matches.append(loadCommand)
+		if len(cmdFilter) == 1:
+			offsets = self._commandTypes.get(cmdFilter[0])
+		else:
+			# merge the offsets so that the results are in load command order
+			offsets = sorted(
+				cmdOff
+				for cmd in set(cmdFilter)
+				for cmdOff in self._commandTypes.get(cmd, ())
+			)
+			pass
 
-		if len(matches) == 0:
+		if not offsets:
 			return None
 
-		return matches
+		if not multiple:
+			return self._getCommandAt(offsets[0])
+
+		return [self._getCommandAt(cmdOff) for cmdOff in offsets]
+
+	def getSymtab(self) -> symtab_command:
+		"""Get the LC_SYMTAB command, or None if there isn't one.
+		"""
+
+		return self.getLoadCommand((LoadCommands.LC_SYMTAB,))
+
+	def getDysymtab(self) -> dysymtab_command:
+		"""Get the LC_DYSYMTAB command, or None if there isn't one.
+		"""
+
+		return self.getLoadCommand((LoadCommands.LC_DYSYMTAB,))
+
+	def getDyldInfo(self) -> dyld_info_command:
+		"""Get the LC_DYLD_INFO or LC_DYLD_INFO_ONLY command.
+
+		Returns:
+			The first of either command, or None if there isn't one.
+		"""
+
+		return self.getLoadCommand(
+			(LoadCommands.LC_DYLD_INFO, LoadCommands.LC_DYLD_INFO_ONLY)
+		)
+
+	def getExportsTrie(self) -> linkedit_data_command:
+		"""Get the LC_DYLD_EXPORTS_TRIE command, or None if there isn't one.
+		"""
+
+		return self.getLoadCommand((LoadCommands.LC_DYLD_EXPORTS_TRIE,))
+
+	def getChainedFixups(self) -> linkedit_data_command:
+		"""Get the LC_DYLD_CHAINED_FIXUPS command, or None if there isn't one.
+		"""
+
+		return self.getLoadCommand((LoadCommands.LC_DYLD_CHAINED_FIXUPS,))
 
 	def containsAddr(self, address: int) -> bool:
 		"""Check if the address is contained in the MachO file.
@@ -103,49 +174,215 @@ class MachOContext(FileContext):
 			of this MachO file.
 		"""
 
-		for segment in self.segmentsI:
-			seg = segment.seg
-			lowBound = seg.vmaddr
-			highBound = lowBound + seg.vmsize
+		if self._addrRanges is None:
+			self._buildSegmentIndex()
+
+		starts, ends = self._addrRanges
+		i = bisect.bisect_right(starts, address) - 1
+		return i >= 0 and address < ends[i]
+
+	def containsAddrs(self, addresses: np.ndarray) -> np.ndarray:
+		"""Vectorized version of containsAddr.
+
+		Args:
+			addresses: An array of VM addresses to check.
+
+		Returns:
+			A boolean array with an element for each address.
+		"""
+
+		if self._addrRanges is None:
+			self._buildSegmentIndex()
+
+		starts, ends = self._addrRangesArr
+		addresses = np.asarray(addresses, dtype=np.uint64)
+		if not len(starts):
+			return np.zeros(addresses.shape, dtype=bool)
+
+		i = np.searchsorted(starts, addresses, side="right").astype(np.int64) - 1
+		return (i >= 0) & (addresses < ends[np.maximum(i, 0)])
 
-			if address >= lowBound and address < highBound:
-				return True
+	def segmentForAddr(self, address: int) -> Optional[SegmentContext]:
+		"""Get the segment that contains the address.
+
+		Args:
+			address: the VM address.
+
+		Returns:
+			The segment context, or None if no segment contains the address.
+		"""
 
-		return False
+		if self._segmentIndex is None:
+			self._buildSegmentIndex()
+
+		starts, ends, segments = self._segmentIndex
+		i = bisect.bisect_right(starts, address) - 1
+		if i >= 0 and address < ends[i]:
+			return segments[i]
+
+		return None
+
+	def sectionForAddr(
+		self,
+		address: int
+	) -> Optional[Tuple[SegmentContext, section_64]]:
+		"""Get the section that contains the address.
+
+		Args:
+			address: the VM address.
+
+		Returns:
+			A tuple of the segment and the section, or None if no section
+			contains the address.
+		"""
+
+		if self._sectionIndex is None:
+			self._buildSectionIndex()
+
+		starts, ends, sections = self._sectionIndex
+		i = bisect.bisect_right(starts, address) - 1
+		if i >= 0 and address < ends[i]:
+			return sections[i]
+
+		return None
+
+	def invalidateAddrIndex(self) -> None:
+		"""Discard the segment and section address indexes.
+
+		Must be called after changing the address or size of a segment
+		or section in place, reloading the load commands does this
+		automatically.
+		"""
+
+		self._addrRanges = None
+		self._addrRangesArr = None
+		self._segmentIndex = None
+		self._sectionIndex = None
+		pass
+
+	def _buildSegmentIndex(self) -> None:
+		"""Create the sorted segment intervals.
+		"""
+
+		segments = sorted(
+			(seg for seg in self.segmentsI if seg.seg.vmsize),
+			key=lambda seg: seg.seg.vmaddr
+		)
+		self._segmentIndex = (
+			[seg.seg.vmaddr for seg in segments],
+			[seg.seg.vmaddr + seg.seg.vmsize for seg in segments],
+			segments
+		)
+
+		# merge overlapping segments for containment checks
+		starts = []
+		ends = []
+		for segment in segments:
+			lowBound = segment.seg.vmaddr
+			highBound = lowBound + segment.seg.vmsize
+
+			if ends and lowBound <= ends[-1]:
+				ends[-1] = max(ends[-1], highBound)
+			else:
+				starts.append(lowBound)
+				ends.append(highBound)
+			pass
+
+		self._addrRanges = (starts, ends)
+		self._addrRangesArr = (
+			np.array(starts, dtype=np.uint64),
+			np.array(ends, dtype=np.uint64)
+		)
+		pass
+
+	def _buildSectionIndex(self) -> None:
+		"""Create the sorted section intervals.
+		"""
+
+		sections = sorted(
+			(
+				(segment, sect)
+				for segment in self.segmentsI
+				for sect in segment.sectsI
+				if sect.size
+			),
+			key=lambda item: item[1].addr
+		)
+		self._sectionIndex = (
+			[sect.addr for _, sect in sections],
+			[sect.addr + sect.size for _, sect in sections],
+			sections
+		)
+		pass
 
 	def _parseLoadCommands(self) -> None:
 		"""Parse the load commands
 
-		Parse the load commands and set the loadCommands attribute.
+		Index the load commands by their offset and type, and create
+		them unless the context is lazy.
 		"""
 		self.header = mach_header_64(self.file, self.fileOffset)
 
-		self.loadCommands = []
+		# A list of tuples containing the offset and type of each command
+		self._commandIndex: List[Tuple[int, int]] = []
+		self._commandCache: Dict[int, load_command] = {}
+		# Maps each command type to the offsets of its commands, in order
+		self._commandTypes: Dict[int, List[int]] = {}
 
-		self.segments = {}
-		self.segmentsI = []
+		self._loadCommands: List[load_command] = None
+		self._segments: Dict[bytes, SegmentContext] = None
+		self._segmentsI: List[SegmentContext] = None
+		self.invalidateAddrIndex()
 
 		cmdOff = len(self.header) + self.fileOffset
 		for _ in range(self.header.ncmds):
-			self.file.seek(cmdOff)
-			cmd = struct.unpack("<I", self.file.read(4))[0]
+			# The mapping may be shared, so avoid using its file position.
+			cmd, cmdsize = struct.unpack_from("<II", self.file, cmdOff)
 
-			command = LoadCommandMap.get(cmd, UnknownLoadCommand)
-			if command == UnknownLoadCommand:
+			if cmd not in LoadCommandMap:
 				raise Exception(f"Unknown LoadCommand: {cmd}")
 
-			command = command(self.file, cmdOff)
+			self._commandIndex.append((cmdOff, cmd))
+			self._commandTypes.setdefault(cmd, []).append(cmdOff)
+			cmdOff += cmdsize
+			pass
+
+		if not self._lazy:
+			self._loadCommands = [
+				self._getCommandAt(cmdOff) for cmdOff, _ in self._commandIndex
+			]
+			self._createSegments()
+			pass
+		pass
+
+	def _getCommandAt(self, cmdOff: int) -> load_command:
+		"""Get the load command at the offset, creating it if needed.
+		"""
+
+		if (command := self._commandCache.get(cmdOff)) is not None:
+			return command
+
+		cmd = struct.unpack_from("<I", self.file, cmdOff)[0]
+		command = LoadCommandMap[cmd](self.file, cmdOff)
+		self._commandCache[cmdOff] = command
+		return command
+
+	def _createSegments(self) -> None:
+		"""Create the segment contexts.
+		"""
+
+		self._segments = {}
+		self._segmentsI = []
 
-			cmdOff += command.cmdsize
-			self.loadCommands.append(command)
+		for cmdOff, cmd in self._commandIndex:
+			if cmd != LoadCommands.LC_SEGMENT_64:
+				continue
 
-			# populate the segments at this point too
-			if isinstance(command, segment_command_64):
-				segCtx = SegmentContext(self.file, command)
+			command: segment_command_64 = self._getCommandAt(cmdOff)
+			segCtx = SegmentContext(self.file, command, lazy=self._lazy)
 
-				self.segments[command.segname] = segCtx
-				self.segmentsI.append(segCtx)
-				pass
+			self._segments[command.segname] = segCtx
+			self._segmentsI.append(segCtx)
 			pass
 		pass
 
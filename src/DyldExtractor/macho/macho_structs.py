@@ -1,3 +1,4 @@
+import numpy as np
 from enum import IntEnum
 from ctypes import (
 	Union,
@@ -803,3 +804,7 @@ class nlist_64(Structure):
 		("n_desc", c_uint16),
 		("n_value", c_uint64),
 	]
+
+
+# nlist_64 as a numpy dtype, for reading whole symbol tables.
+NLIST_64_DTYPE = np.dtype(nlist_64)
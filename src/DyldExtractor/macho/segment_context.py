@@ -12,10 +12,12 @@ class SegmentContext(object):
 
 	seg: segment_command_64
 
-	sects: Dict[bytes, section_64]
-	sectsI: List[section_64]
-
-	def __init__(self, file: mmap, segment: segment_command_64) -> None:
+	def __init__(
+		self,
+		file: mmap,
+		segment: segment_command_64,
+		lazy: bool = False
+	) -> None:
 		"""Represents a segment.
 
 		This holds information regarding a segment and its sections.
@@ -23,19 +25,42 @@ class SegmentContext(object):
 		Args:
 			file: The data source used for the segment.
 			segment: The segment structure.
+			lazy: Optional; Defer reading the sections until they are
+				first accessed.
 		"""
 
 		super().__init__()
 
 		self.seg = segment
 
-		self.sects = {}
-		self.sectsI = []
+		self._file = file
+		self._sects: Dict[bytes, section_64] = None
+		self._sectsI: List[section_64] = None
+
+		if not lazy:
+			self._parseSections()
+		pass
+
+	@property
+	def sects(self) -> Dict[bytes, section_64]:
+		if self._sects is None:
+			self._parseSections()
+		return self._sects
+
+	@property
+	def sectsI(self) -> List[section_64]:
+		if self._sectsI is None:
+			self._parseSections()
+		return self._sectsI
+
+	def _parseSections(self) -> None:
+		self._sects = {}
+		self._sectsI = []
 
-		sectsStart = segment._fileOff_ + len(segment)
-		for i in range(segment.nsects):
+		sectsStart = self.seg._fileOff_ + len(self.seg)
+		for i in range(self.seg.nsects):
 			sectOff = sectsStart + (i * section_64.SIZE)
-			sect = section_64(file, sectOff)
+			sect = section_64(self._file, sectOff)
 
-			self.sects[sect.sectname] = sect
-			self.sectsI.append(sect)
+			self._sects[sect.sectname] = sect
+			self._sectsI.append(sect)
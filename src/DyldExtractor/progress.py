@@ -0,0 +1,193 @@
+import time
+from typing import (
+	Any,
+	Dict,
+	Iterator,
+	Tuple
+)
+
+
+# The default time between reports, in seconds.
+REPORT_INTERVAL = 0.1
+
+
+class ThrottledStatus(object):
+
+	def __init__(self, interval: float = REPORT_INTERVAL) -> None:
+		"""A status bar that reports at most once per interval.
+
+		Converters update the status bar inside their loops. Each update
+		only records the stage and counts it, the stage is reported when
+		the interval has passed, or right away when the unit changes.
+
+		Args:
+			interval: The minimum time between reports, in seconds.
+		"""
+
+		super().__init__()
+
+		self.unit = "--"
+		self.status = "--"
+
+		# The number of updates in the current unit and status.
+		self.count = 0
+
+		self._interval = interval
+		self._nextReport = 0.0
+		pass
+
+	def update(
+		self,
+		unit: str = None,
+		status: str = None,
+		force: bool = False
+	) -> None:
+		"""Record progress in a stage.
+
+		Args:
+			unit: Optional; The converter that is running.
+			status: Optional; What the converter is doing.
+			force: Optional; Report even if the interval hasn't passed.
+		"""
+
+		self.count += 1
+
+		if unit is not None and unit != self.unit:
+			self.unit = unit
+			self.count = 1
+			force = True
+			pass
+
+		if status is not None and status != self.status:
+			self.status = status
+			self.count = 1
+			pass
+
+		now = time.monotonic()
+		if force or now >= self._nextReport:
+			self._nextReport = now + self._interval
+			self._report()
+			pass
+		pass
+
+	def _report(self) -> None:
+		"""Report the current stage.
+		"""
+		pass
+	pass
+
+
+class ProgressBarStatus(ThrottledStatus):
+
+	def __init__(self, progressBar: Any, interval: float = REPORT_INTERVAL) -> None:
+		"""Reports to a progress bar.
+
+		Args:
+			progressBar: A progressbar.ProgressBar with "unit" and
+				"status" variables.
+			interval: The minimum time between reports, in seconds.
+		"""
+
+		super().__init__(interval)
+
+		self._progressBar = progressBar
+		pass
+
+	def _report(self) -> None:
+		self._progressBar.update(unit=self.unit, status=self.status)
+		pass
+	pass
+
+
+class QueueStatus(ThrottledStatus):
+
+	def __init__(
+		self,
+		queue: Any,
+		jobName: str,
+		interval: float = REPORT_INTERVAL
+	) -> None:
+		"""Reports to another process through a queue.
+
+		Messages are (jobName, unit, status, count) tuples, and a job
+		is finished when its unit and status are None.
+
+		Args:
+			queue: A multiprocessing queue, read by a QueueReporter.
+			jobName: Identifies the job in the messages.
+			interval: The minimum time between reports, in seconds.
+		"""
+
+		super().__init__(interval)
+
+		self._queue = queue
+		self._jobName = jobName
+		pass
+
+	def _report(self) -> None:
+		self._queue.put((self._jobName, self.unit, self.status, self.count))
+		pass
+
+	def finish(self) -> None:
+		"""Report that the job is finished.
+		"""
+
+		self._queue.put((self._jobName, None, None, self.count))
+		pass
+	pass
+
+
+class QueueReporter(object):
+
+	def __init__(self, queue: Any, progressBar: Any) -> None:
+		"""Shows the progress that jobs report through a queue.
+
+		Args:
+			queue: The multiprocessing queue given to each QueueStatus.
+			progressBar: A progressbar.ProgressBar with a "status"
+				variable, its value is the number of finished jobs.
+		"""
+
+		super().__init__()
+
+		self._queue = queue
+		self._progressBar = progressBar
+
+		# The last message of each running job.
+		self.running: Dict[str, Tuple[str, str, int]] = {}
+		pass
+
+	def run(self, results: Iterator[Any], total: int) -> Iterator[Any]:
+		"""Show progress until all jobs are finished.
+
+		Blocks on the queue instead of polling the jobs.
+
+		Args:
+			results: The results of the jobs, in the order they finish,
+				like the iterator from Pool.imap_unordered.
+			total: The number of jobs.
+
+		Returns:
+			An iterator of the results, each one is yielded when a job
+			reports that it is finished.
+		"""
+
+		jobsComplete = 0
+		while jobsComplete < total:
+			jobName, unit, status, count = self._queue.get()
+
+			if unit is None:
+				self.running.pop(jobName, None)
+				jobsComplete += 1
+				self._progressBar.update(jobsComplete)
+				yield next(results)
+				continue
+
+			self.running[jobName] = (unit, status, count)
+			self._progressBar.update(
+				jobsComplete,
+				status=f"{jobName}: {unit} >> {status} ({count})"
+			)
+			pass
+		pass
+	pass